@@ -10,8 +10,9 @@ from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QIcon
 from qfluentwidgets import (PrimaryPushButton, TransparentToolButton, FluentIcon,
                            ToolTipFilter, ToolTipPosition, ComboBox,
-                           InfoBarPosition, InfoBar, LineEdit)
+                           LineEdit)
 from src.utils.account_manager import AccountManager
+from src.components.ui_helpers import show_info_bar
 from src.utils.oauth_handler import OAuthHandler, OAuthBrowserDialog
 
 class AccountDialog(QDialog):
@@ -28,6 +29,7 @@ class AccountDialog(QDialog):
         
         # 连接信号
         self.accountManager.accountsChanged.connect(self.refreshAccountLists)
+        self.accountManager.saveFailed.connect(self.onAccountsSaveFailed)
         self.oauthHandler.githubAuthSuccess.connect(self.handleGithubOAuthSuccess)
         self.oauthHandler.githubAuthFailed.connect(self.handleOAuthError)
         self.oauthHandler.gitlabAuthSuccess.connect(self.handleGitlabOAuthSuccess)
@@ -170,6 +172,10 @@ class AccountDialog(QDialog):
         # 发出账号更改信号
         self.accountsChanged.emit()
         
+    def onAccountsSaveFailed(self, message):
+        """ 账号配置写入失败的回调，修改已在界面中显示成功，需要另外提示 """
+        QMessageBox.warning(self, "保存失败", f"账号配置未能写入文件，重启后更改将丢失:\n{message}")
+        
     def showAddGithubAccountDialog(self):
         """ 显示添加GitHub账号对话框 """
         dialog = QDialog(self)
@@ -225,15 +231,7 @@ class AccountDialog(QDialog):
         # 添加账号
         if self.accountManager.add_github_account(username, token, name):
             dialog.accept()
-            InfoBar.success(
-                title="添加成功",
-                content=f"GitHub账号 {username} 已成功添加",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            show_info_bar(self, 'success', "添加成功", f"GitHub账号 {username} 已成功添加")
         else:
             dialog.accept()  # 关闭对话框
             # 显示更详细的错误信息
@@ -307,15 +305,7 @@ class AccountDialog(QDialog):
         # 添加账号
         if self.accountManager.add_gitlab_account(url, token, name):
             dialog.accept()
-            InfoBar.success(
-                title="添加成功",
-                content=f"GitLab账号已成功添加",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            show_info_bar(self, 'success', "添加成功", f"GitLab账号已成功添加")
         else:
             dialog.accept()  # 关闭对话框
             # 显示更详细的错误信息
@@ -357,15 +347,7 @@ class AccountDialog(QDialog):
         
         if reply == QMessageBox.Yes:
             if self.accountManager.remove_github_account(account['username']):
-                InfoBar.success(
-                    title="删除成功",
-                    content=f"GitHub账号 {account['username']} 已删除",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'success', "删除成功", f"GitHub账号 {account['username']} 已删除")
             else:
                 QMessageBox.warning(self, "删除失败", "无法删除所选账号")
                 
@@ -387,15 +369,7 @@ class AccountDialog(QDialog):
         
         if reply == QMessageBox.Yes:
             if self.accountManager.remove_gitlab_account(account['url'], account['username']):
-                InfoBar.success(
-                    title="删除成功",
-                    content=f"GitLab账号 {account['username']} 已删除",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'success', "删除成功", f"GitLab账号 {account['username']} 已删除")
             else:
                 QMessageBox.warning(self, "删除失败", "无法删除所选账号")
                 
@@ -498,15 +472,7 @@ class AccountDialog(QDialog):
                 self.oauthHandler.github_client_id, 
                 self.oauthHandler.github_client_secret
             ):
-                InfoBar.success(
-                    title="添加成功",
-                    content="GitHub账号已成功添加",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'success', "添加成功", "GitHub账号已成功添加")
             else:
                 QMessageBox.warning(self, "添加失败", "无法通过OAuth验证添加GitHub账号")
     
@@ -611,14 +577,6 @@ class AccountDialog(QDialog):
                 self.oauthHandler.gitlab_client_secret,
                 self.gitlab_url
             ):
-                InfoBar.success(
-                    title="添加成功",
-                    content="GitLab账号已成功添加",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'success', "添加成功", "GitLab账号已成功添加")
             else:
                 QMessageBox.warning(self, "添加失败", "无法通过OAuth验证添加GitLab账号") 
\ No newline at end of file
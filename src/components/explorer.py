@@ -7,8 +7,9 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTreeView, QFileSystemModel,
                            QMenu, QAction, QInputDialog, QMessageBox, QHBoxLayout)
 from PyQt5.QtCore import Qt, QDir, pyqtSignal, QModelIndex
 from PyQt5.QtGui import QIcon, QCursor
-from qfluentwidgets import (PushButton, SearchLineEdit, FluentIcon, InfoBar,
-                          InfoBarPosition, ToolButton, PrimaryToolButton)
+from qfluentwidgets import (PushButton, SearchLineEdit, FluentIcon,
+                          ToolButton, PrimaryToolButton)
+from src.components.ui_helpers import show_info_bar
 
 class FileExplorer(QWidget):
     """ 文件浏览器组件 """
@@ -96,15 +97,7 @@ class FileExplorer(QWidget):
     def createNewFile(self):
         """ 创建新的Markdown文件 """
         if not self.rootPath:
-            InfoBar.warning(
-                title="未打开仓库",
-                content="请先打开一个仓库",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            show_info_bar(self, 'warning', "未打开仓库", "请先打开一个仓库")
             return
             
         filename, ok = QInputDialog.getText(
@@ -122,15 +115,7 @@ class FileExplorer(QWidget):
             
             # 检查文件是否已存在
             if os.path.exists(filePath):
-                InfoBar.warning(
-                    title="文件已存在",
-                    content=f"文件 {filename} 已存在",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'warning', "文件已存在", f"文件 {filename} 已存在")
                 return
                 
             # 创建空文件
@@ -143,15 +128,7 @@ class FileExplorer(QWidget):
                 self.treeView.setCurrentIndex(newIndex)
                 self.fileSelected.emit(filePath)
                 
-                InfoBar.success(
-                    title="文件已创建",
-                    content=f"文件 {filename} 已成功创建",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'success', "文件已创建", f"文件 {filename} 已成功创建")
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"创建文件失败: {str(e)}")
                 
@@ -213,29 +190,13 @@ class FileExplorer(QWidget):
             
             # 检查新文件名是否已存在
             if os.path.exists(newPath):
-                InfoBar.warning(
-                    title="文件已存在",
-                    content=f"文件 {newName} 已存在",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'warning', "文件已存在", f"文件 {newName} 已存在")
                 return
                 
             # 重命名文件
             try:
                 os.rename(oldPath, newPath)
-                InfoBar.success(
-                    title="文件已重命名",
-                    content=f"文件已重命名为 {newName}",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'success', "文件已重命名", f"文件已重命名为 {newName}")
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"重命名文件失败: {str(e)}")
                 
@@ -257,15 +218,7 @@ class FileExplorer(QWidget):
         if reply == QMessageBox.Yes:
             try:
                 os.remove(filePath)
-                InfoBar.success(
-                    title="文件已删除",
-                    content=f"文件 {fileName} 已成功删除",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'success', "文件已删除", f"文件 {fileName} 已成功删除")
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"删除文件失败: {str(e)}")
                 
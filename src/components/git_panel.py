@@ -2,24 +2,259 @@
 # -*- coding: utf-8 -*-
 
 import os
+import re
 import sys
-import git
+import time
+import difflib
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QListWidget, QListWidgetItem,
                            QCheckBox, QHBoxLayout, QPushButton, QInputDialog, QMessageBox,
-                           QFileDialog, QComboBox, QToolBar, QAction, QSizePolicy, QMenu, QDialog, QSplitter)
-from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
-from PyQt5.QtGui import QIcon, QCursor, QFont
+                           QFileDialog, QComboBox, QToolBar, QAction, QSizePolicy, QMenu, QDialog, QSplitter,
+                           QListView, QStyledItemDelegate, QStyleOptionViewItem, QStyle, QApplication)
+from PyQt5.QtCore import (Qt, pyqtSignal, pyqtSlot, QAbstractListModel, QModelIndex, QStringListModel,
+                          QTimer, QSignalBlocker, QThreadPool)
+from PyQt5.QtGui import QIcon, QCursor, QFont, QPalette
 from qfluentwidgets import (LineEdit, PrimaryToolButton, FluentIcon, TitleLabel, 
-                          PrimaryPushButton, InfoBar, InfoBarPosition, ComboBox,
+                          PrimaryPushButton, ComboBox,
                           CardWidget, ToolButton, TransparentToolButton, ToolTipFilter,
                           ToolTipPosition)
-from src.utils.git_manager import GitManager
 from src.utils.config_manager import ConfigManager
 from src.utils.account_manager import AccountManager
 from src.utils.logger import info, warning, error, debug
-from src.utils.git_thread import GitThread
+from src.components.ui_helpers import show_info_bar
+from src.utils.git_thread import (GitThread, GitStatusThread, GitStatusReaders, GitOpenThread,
+                                  PathProbeThread, BranchListThread)
+from src.utils.fs_utils import is_dir_nonempty
+from src.utils.git_runnable import GitCloneRunnable
 from src.components.loading_mask import LoadingMask
+from src.components.picker_dialog import ItemPickerDialog
+
+# 带协议的完整地址前缀，带这些前缀的地址不会是GitHub快捷方式
+_URL_SCHEMES = ("http://", "https://", "git@", "ssh://", "file://")
+# GitHub快捷方式，如 username/repo
+_GH_SHORTCUT_RE = re.compile(r'([^/:@\s]+)/([^/:@\s]+?)(?:\.git)?')
+# 主机名后误用冒号分隔路径的http(s) URL，如 https://github.com:username/repo.git（端口号除外）
+_HOST_COLON_PATH_RE = re.compile(r'^(https?://[^/:]+):(?!\d+(?:/|$))/*(.+)$')
+
+def _normalize_git_url(raw):
+    """ 规范化用户输入的仓库地址
+    Args:
+        raw: 用户输入的URL或GitHub快捷方式
+    Returns:
+        str: 快捷方式返回完整的GitHub URL，其它地址返回修正后的原地址
+    """
+    url = raw.strip()
+    
+    if not url.startswith(_URL_SCHEMES):
+        # 只有一个斜杠的无协议地址才可能是快捷方式，由正则的整体匹配一次判断
+        match = _GH_SHORTCUT_RE.fullmatch(url)
+        if match:
+            return f"https://github.com/{match.group(1)}/{match.group(2)}.git"
+        return url
+        
+    match = _HOST_COLON_PATH_RE.match(url)
+    if match:
+        return f"{match.group(1)}/{match.group(2)}"
+        
+    return url
+
+# 存储列表行开头的存储引用，如 stash@{0}: WIP on main: ...
+_STASH_REF_RE = re.compile(r'stash@\{(\d+)\}')
+
+def _parse_stash_id(line):
+    """ 从git stash list的一行中解析存储编号
+    Args:
+        line: 存储列表中的一行
+    Returns:
+        int: 存储编号，行格式不符时返回None
+    """
+    match = _STASH_REF_RE.match(line)
+    return int(match.group(1)) if match else None
+
+# 变更列表项中保存已编码路径的数据角色
+_PATH_BYTES_ROLE = Qt.UserRole + 1
+# 变更列表中保存文件状态文字的数据角色
+_STATUS_ROLE = Qt.UserRole + 2
+
+class CommitLogModel(QAbstractListModel):
+    """ 提交历史列表模型，显示文本和提示信息在视图请求时才生成 """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._commits = []
+        
+    def setCommits(self, commits):
+        """ 设置提交历史，只有新提交加在前面时增量插入，否则整体重置
+        Args:
+            commits: GitManager.getCommitHistory返回的提交字典列表
+        """
+        commits = list(commits)
+        if commits == self._commits:
+            return
+            
+        # 查找原来的第一条提交在新列表中的位置，之前的都是新增的提交
+        old_hashes = [commit['hash'] for commit in self._commits]
+        new_hashes = [commit['hash'] for commit in commits]
+        added = new_hashes.index(old_hashes[0]) if old_hashes and old_hashes[0] in new_hashes else -1
+        if added <= 0 or new_hashes[added:] != old_hashes[:len(new_hashes) - added]:
+            self.beginResetModel()
+            self._commits = commits
+            self.endResetModel()
+            return
+            
+        self.beginInsertRows(QModelIndex(), 0, added - 1)
+        self._commits[0:0] = commits[:added]
+        self.endInsertRows()
+        
+        # 超出条数限制的旧提交从末尾移除
+        if len(self._commits) > len(commits):
+            self.beginRemoveRows(QModelIndex(), len(commits), len(self._commits) - 1)
+            del self._commits[len(commits):]
+            self.endRemoveRows()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._commits)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        commit = self._commits[index.row()]
+        if role == Qt.DisplayRole:
+            # 列表中只显示提交信息的首行，保证每行等高
+            summary = commit['message'].partition('\n')[0]
+            return f"{commit['hash'][:7]} - {summary}"
+        if role == Qt.ToolTipRole:
+            # 只有鼠标悬停时才构造提示文本
+            return f"作者: {commit['author']}\n日期: {commit['date']}\n消息: {commit['message']}"
+        return None
+
+class ChangesModel(QAbstractListModel):
+    """ 变更文件列表模型，只保存(状态, 路径)、已编码的路径和每行一个字节的勾选状态 """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._pathBytes = []
+        self._checked = bytearray()
+        
+    def setChanges(self, changes):
+        """ 设置变更文件，所有文件默认勾选
+        Args:
+            changes: GitManager.getChangedFiles返回的(状态, 路径)列表
+        """
+        self.beginResetModel()
+        self._rows = list(changes)
+        # 路径在设置时编码一次，提交时直接使用
+        self._pathBytes = [os.fsencode(path) for _, path in self._rows]
+        self._checked = bytearray(b'\x01') * len(self._rows)
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        status, path = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{status}    {path}"
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._checked[index.row()] else Qt.Unchecked
+        if role == Qt.UserRole:
+            return path
+        if role == _STATUS_ROLE:
+            return status
+        if role == _PATH_BYTES_ROLE:
+            return self._pathBytes[index.row()]
+        return None
+        
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+            
+        self._checked[index.row()] = 1 if value == Qt.Checked else 0
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+class ChangesDelegate(QStyledItemDelegate):
+    """ 变更文件列表委托，在勾选框后分两列绘制状态和路径 """
+    
+    # 状态列宽度
+    STATUS_WIDTH = 80
+    
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        
+        # 背景、选中效果和勾选框交给样式绘制，文字自行分列绘制
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+        textRect = style.subElementRect(QStyle.SE_ItemViewItemText, opt, opt.widget)
+        
+        painter.save()
+        selected = bool(opt.state & QStyle.State_Selected)
+        painter.setPen(opt.palette.color(QPalette.HighlightedText if selected else QPalette.Text))
+        
+        statusRect = textRect.adjusted(0, 0, 0, 0)
+        statusRect.setWidth(self.STATUS_WIDTH)
+        painter.drawText(statusRect, Qt.AlignVCenter | Qt.AlignLeft, index.data(_STATUS_ROLE))
+        
+        # 路径过长时省略中间部分，保留目录开头和文件名
+        pathRect = textRect.adjusted(self.STATUS_WIDTH, 0, 0, 0)
+        path = opt.fontMetrics.elidedText(index.data(Qt.UserRole), Qt.ElideMiddle, pathRect.width())
+        painter.drawText(pathRect, Qt.AlignVCenter | Qt.AlignLeft, path)
+        painter.restore()
+
+class NewBranchDialog(QDialog):
+    """ 新建分支对话框，在同一个对话框中输入分支名称并选择是否切换 """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("创建分支")
+        
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("请输入新分支名称:"))
+        
+        self.nameEdit = LineEdit(self)
+        layout.addWidget(self.nameEdit)
+        
+        self.switchCheckBox = QCheckBox("创建后切换到该分支", self)
+        self.switchCheckBox.setChecked(True)
+        layout.addWidget(self.switchCheckBox)
+        
+        # 按钮
+        btnLayout = QHBoxLayout()
+        btnLayout.addStretch(1)
+        self.okBtn = PrimaryPushButton("确定")
+        cancelBtn = QPushButton("取消")
+        self.okBtn.clicked.connect(self.accept)
+        cancelBtn.clicked.connect(self.reject)
+        btnLayout.addWidget(self.okBtn)
+        btnLayout.addWidget(cancelBtn)
+        layout.addLayout(btnLayout)
+        
+        # 名称为空时不能确认
+        self.okBtn.setEnabled(False)
+        self.nameEdit.textChanged.connect(lambda text: self.okBtn.setEnabled(bool(text.strip())))
+        self.nameEdit.returnPressed.connect(self.okBtn.click)
+        
+    def name(self):
+        """ 获取输入的分支名称 """
+        return self.nameEdit.text().strip()
+        
+    def switch(self):
+        """ 是否在创建后切换到新分支 """
+        return self.switchCheckBox.isChecked()
 
 class GitPanel(QWidget):
     """ Git面板组件 """
@@ -28,37 +263,170 @@ class GitPanel(QWidget):
     repositoryInitialized = pyqtSignal(str)
     repositoryOpened = pyqtSignal(str)
     
+    # 分支列表缓存的有效期（秒），用于兜底在本程序之外创建或删除的分支
+    BRANCHES_CACHE_TTL = 60
+    
+    # 保留状态缓存的仓库数量，超出时淘汰最久未使用的仓库
+    REPO_STATUS_CACHE_SIZE = 8
+    
+    # Git线程操作在结果提示中显示的名称
+    OPERATION_NAMES = {
+        'pull': "拉取",
+        'push': "推送",
+        'fetch': "获取更新",
+        'commit': "提交",
+        'sync': "同步",
+        'init': "初始化仓库",
+        'import': "导入外部仓库",
+        'create_branch': "创建分支",
+        'merge_branch': "合并分支",
+        'delete_branch': "删除分支",
+        'add_remote': "设置远程仓库",
+        'remove_remote': "删除远程仓库",
+        'stash': "存储更改",
+        'apply_stash': "应用存储",
+        'drop_stash': "删除存储",
+        'clear_stash': "清空存储",
+    }
+    
+    # 未跟踪文件扫描方式的切换顺序及提示文字
+    UNTRACKED_MODES = ('no', 'normal', 'all')
+    UNTRACKED_MODE_TIPS = {
+        'no': "未跟踪文件：不显示",
+        'normal': "未跟踪文件：只显示目录",
+        'all': "未跟踪文件：显示全部",
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.gitManager = None
         self.currentPath = ""
-        self.configManager = ConfigManager()
+        self.configManager = ConfigManager.instance()
         self.recentReposList = []
+        self._recentRepoLabels = {}  # 仓库路径到下拉框显示文字的缓存
+        
+        # 状态刷新的取消令牌，切换仓库或重新刷新时置位以丢弃进行中的刷新
+        self._cancelToken = threading.Event()
+        self._statusThread = None
+        
+        # 状态刷新线程专用的GitManager，同一仓库的多次刷新之间复用
+        self._statusReaders = None
+        
+        # 仓库打开的取消令牌，再次切换仓库时置位以丢弃尚未完成的打开
+        self._openToken = threading.Event()
+        
+        # 远程仓库缓存，远程仓库很少变化，只在增删远程仓库或切换仓库时失效
+        self._remotesCache = None
+        self._remoteDetailsCache = None
+        
+        # 存储列表缓存，元素为(存储ID, 显示文本)，在存储变化或切换仓库时失效
+        self._stashCache = None
+        
+        # 当前分支缓存，只在刷新、提交、切换分支或切换仓库时失效
+        self._branchCache = None
+        
+        # 分支列表缓存，元素为(读取时间, 分支列表)，由状态刷新填充
+        self._branchesCache = None
+        
+        # 分支选择对话框共用的分支模型，只在分支列表变化时重建
+        self._branchModel = QStringListModel(self)
+        self._branchModelItems = ()
+        
+        # 各仓库最近一次成功读取的状态，切换仓库时先显示缓存再后台刷新
+        self._repoStatusCache = OrderedDict()
+        
+        # 未跟踪文件扫描方式，大仓库中完整扫描未跟踪目录非常耗时
+        self._untrackedMode = self.configManager.get_untracked_mode()
+        if self._untrackedMode not in self.UNTRACKED_MODES:
+            self._untrackedMode = 'normal'
+        
+        # 刷新去抖定时器，短时间内的多次刷新请求合并为一次
+        self._refreshTimer = QTimer(self)
+        self._refreshTimer.setSingleShot(True)
+        self._refreshTimer.setInterval(150)
+        self._refreshTimer.timeout.connect(self._doRefreshStatus)
+        
+        # 最近仓库下拉框是否已安排重建，同一轮事件循环中只重建一次
+        self._recentPending = False
+        
+        # 错误和询问对话框各只创建一次，每次显示时重设内容
+        self._errorBox = QMessageBox(self)
+        self._errorBox.setStandardButtons(QMessageBox.Ok)
+        self._confirmBox = QMessageBox(self)
+        
+        # 带"不再询问"选项的确认对话框同样只创建一次
+        self._dontAskBox = QMessageBox(QMessageBox.Question, "", "", QMessageBox.Yes | QMessageBox.No, self)
+        self._dontAskBox.setDefaultButton(QMessageBox.No)
+        self._dontAskBox.setCheckBox(QCheckBox("不再询问"))
         
         # 创建Git线程
         self.gitThread = GitThread(self)
         self.gitThread.operationStarted.connect(self.onGitOperationStarted)
         self.gitThread.operationFinished.connect(self.onGitOperationFinished)
         self.gitThread.progressUpdate.connect(self.onGitProgressUpdate)
+        self.gitThread.finished.connect(self._onGitThreadFinished)
+        self._operationCallback = None  # 当前操作完成后要执行的回调
+        self._operationResult = None    # 当前操作的结果 (成功, 操作名称, 消息)
+        
+        # 进行中的克隆任务，克隆在线程池中执行，不占用Git线程
+        self._cloneRunnables = set()
         
         # 初始化UI
         self.initUI()
         
+        # 分支、远程仓库和存储菜单只创建一次，显示时直接复用
+        self._branchMenu = QMenu(self)
+        for text, slot in (("创建新分支", self.createNewBranch),
+                           ("合并分支", self.mergeBranch),
+                           ("删除分支", self.deleteBranch)):
+            self._branchMenu.addAction(text).triggered.connect(slot)
+            
+        self._remoteMenu = QMenu(self)
+        for text, slot in (("添加远程仓库", self.addRemote),
+                           ("查看远程仓库", self.viewRemotes),
+                           ("删除远程仓库", self.removeRemote),
+                           (None, None),
+                           ("从GitHub导入", self.importFromGitHub),
+                           ("克隆远程仓库", self.cloneExternalRepo)):
+            if text is None:
+                self._remoteMenu.addSeparator()
+            else:
+                self._remoteMenu.addAction(text).triggered.connect(slot)
+                
+        # 选择远程仓库的菜单，在第一次需要选择时按远程仓库列表构建
+        self._remotePickerMenu = QMenu(self)
+        self._remotePickerPrompt = None
+        self._remotePickerItems = ()
+        
+        self._stashMenu = QMenu(self)
+        for text, slot in (("存储更改", self.stashChanges),
+                           ("应用存储", self.applyStash),
+                           ("查看存储列表", self.viewStashList),
+                           ("删除存储", self.dropStash),
+                           ("清空所有存储", self.clearStash)):
+            self._stashMenu.addAction(text).triggered.connect(slot)
+        
         # 创建加载遮罩 - 在UI初始化之后创建，确保正确的父子关系和Z顺序
         self.loadingMask = LoadingMask(self)
+        self.loadingMask.cancelRequested.connect(self.cancelClones)
+        
+        # 延迟显示加载遮罩，很快完成的操作不显示遮罩，避免闪烁和多余的重绘
+        self._pendingMask = None
+        self._maskTimer = QTimer(self)
+        self._maskTimer.setSingleShot(True)
+        self._maskTimer.setInterval(200)
+        self._maskTimer.timeout.connect(self._showPendingMask)
         
         # 初始加载最近仓库列表
         self.updateRecentRepositories()
         
+        # 打开仓库后才可用的控件，以及还需要存在远程仓库才可用的控件
+        self._repoControls = (self.commitBtn, self.stashBtn, self.branchBtn,
+                              self.remoteBtn, self.branchCombo)
+        self._remoteControls = (self.pushBtn, self.pullBtn, self.syncBtn)
+        
         # 禁用一些初始按钮
-        self.commitBtn.setEnabled(False)
-        self.pushBtn.setEnabled(False)
-        self.pullBtn.setEnabled(False)
-        self.stashBtn.setEnabled(False)
-        self.branchBtn.setEnabled(False)
-        self.remoteBtn.setEnabled(False)
-        self.branchCombo.setEnabled(False)
-        self.syncBtn.setEnabled(False)
+        self._setRepoControlsEnabled(False, False)
         
     def initUI(self):
         """ 初始化UI """
@@ -175,7 +543,6 @@ class GitPanel(QWidget):
         self.syncBtn = PrimaryPushButton("同步远程仓库")
         self.syncBtn.setIcon(FluentIcon.SYNC.icon())
         self.syncBtn.clicked.connect(self.syncWithRemote)
-        self.syncBtn.setEnabled(False)
         externalCardLayout.addWidget(self.syncBtn)
         
         layout.addWidget(externalCard)
@@ -192,10 +559,23 @@ class GitPanel(QWidget):
         operationCardLayout.addWidget(self.commitMsgEdit)
         
         # 变更文件列表
-        operationCardLayout.addWidget(QLabel("变更文件:"))
-        
-        self.changesList = QListWidget()
-        self.changesList.setSelectionMode(QListWidget.ExtendedSelection)
+        changesLabelLayout = QHBoxLayout()
+        changesLabelLayout.addWidget(QLabel("变更文件:"))
+        changesLabelLayout.addStretch(1)
+        
+        # 未跟踪文件扫描方式切换按钮
+        self.untrackedBtn = TransparentToolButton(FluentIcon.VIEW)
+        self.untrackedBtn.setToolTip(self.UNTRACKED_MODE_TIPS[self._untrackedMode])
+        self.untrackedBtn.clicked.connect(self.toggleUntrackedMode)
+        changesLabelLayout.addWidget(self.untrackedBtn)
+        operationCardLayout.addLayout(changesLabelLayout)
+        
+        self.changesModel = ChangesModel(self)
+        self.changesList = QListView()
+        self.changesList.setModel(self.changesModel)
+        self.changesList.setItemDelegate(ChangesDelegate(self.changesList))
+        self.changesList.setSelectionMode(QListView.ExtendedSelection)
+        self.changesList.setUniformItemSizes(True)
         operationCardLayout.addWidget(self.changesList)
         
         # 按钮布局
@@ -242,7 +622,10 @@ class GitPanel(QWidget):
         historyCardLayout.addWidget(QLabel("提交历史:"))
         
         # 历史记录列表
-        self.historyList = QListWidget()
+        self.historyModel = CommitLogModel(self)
+        self.historyList = QListView()
+        self.historyList.setModel(self.historyModel)
+        self.historyList.setUniformItemSizes(True)
         historyCardLayout.addWidget(self.historyList)
         
         layout.addWidget(historyCard)
@@ -254,33 +637,70 @@ class GitPanel(QWidget):
         layout.setStretch(3, 2)  # 历史记录卡片大量拉伸
         
     def updateRecentRepositories(self):
+        """ 请求更新最近仓库下拉框，同一轮事件循环中的多次请求只执行一次 """
+        if self._recentPending:
+            return
+        self._recentPending = True
+        QTimer.singleShot(0, self._doUpdateRecentRepositories)
+        
+    def _doUpdateRecentRepositories(self):
         """ 更新最近仓库下拉框 """
+        self._recentPending = False
+        
+        # 重新获取最新的仓库列表（不使用缓存），与下拉框中的列表相同时无需任何改动
+        repos = self.configManager.get_recent_repositories()
+        if repos == self.recentReposList and self.recentRepoCombo.count() > 0:
+            return
+            
         # 保存当前选中的索引
         currentIndex = self.recentRepoCombo.currentIndex()
         
         # 暂时阻断信号以防止循环
-        self.recentRepoCombo.blockSignals(True)
-        
-        try:
-            # 清空下拉框
-            self.recentRepoCombo.clear()
-            self.recentRepoCombo.addItem("选择最近仓库...")
-            
-            # 重新获取最新的仓库列表（不使用缓存）
-            self.recentReposList = self.configManager.get_recent_repositories()
-            for repo in self.recentReposList:
-                repoName = os.path.basename(repo)
-                self.recentRepoCombo.addItem(f"{repoName} ({repo})")
+        with QSignalBlocker(self.recentRepoCombo):
+            if self.recentRepoCombo.count() == 0:
+                self.recentRepoCombo.addItem("选择最近仓库...")
+                
+            # 只对变化的条目做插入和删除，从后往前处理以保持前面的索引不变，
+            # 下拉框第0项是提示文字，仓库条目的索引需要加1
+            matcher = difflib.SequenceMatcher(None, self.recentReposList, repos, autojunk=False)
+            for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+                if tag == 'equal':
+                    continue
+                for index in range(i2, i1, -1):
+                    self.recentRepoCombo.removeItem(index)
+                for offset, repo in enumerate(repos[j1:j2]):
+                    self.recentRepoCombo.insertItem(i1 + 1 + offset, self._recentRepoLabel(repo))
+            self.recentReposList = repos
             
             # 如果先前有选择，尝试恢复选中状态
             if currentIndex > 0 and currentIndex <= len(self.recentReposList):
                 self.recentRepoCombo.setCurrentIndex(currentIndex)
             else:
                 self.recentRepoCombo.setCurrentIndex(0)
-        finally:
-            # 确保信号一定会被重新启用
-            self.recentRepoCombo.blockSignals(False)
+            
+    def _recentRepoLabel(self, repo):
+        """ 获取最近仓库在下拉框中的显示文字，结果按路径缓存
+        Args:
+            repo: 仓库路径
+        Returns:
+            str: 显示文字
+        """
+        label = self._recentRepoLabels.get(repo)
+        if label is None:
+            label = self._recentRepoLabels[repo] = f"{os.path.basename(repo)} ({repo})"
+        return label
     
+    def _probePath(self, path, callback):
+        """ 在后台线程检查路径，完成后在UI线程调用callback(exists, nonempty)
+        Args:
+            path: 要检查的路径
+            callback: 检查完成的回调
+        """
+        thread = PathProbeThread(path, self)
+        thread.probed.connect(lambda _, exists, nonempty: callback(exists, nonempty))
+        thread.finished.connect(thread.deleteLater)
+        thread.start()
+        
     def onRecentRepoSelected(self, index):
         """ 处理选择最近仓库 """
         if index <= 0:
@@ -290,30 +710,34 @@ class GitPanel(QWidget):
         selectedIndex = index
         
         # 先重置下拉框状态，阻断可能的事件循环
-        self.recentRepoCombo.blockSignals(True)
-        self.recentRepoCombo.setCurrentIndex(0)
-        self.recentRepoCombo.blockSignals(False)
+        with QSignalBlocker(self.recentRepoCombo):
+            self.recentRepoCombo.setCurrentIndex(0)
             
         # 使用索引从列表中获取仓库路径
         if 0 < selectedIndex <= len(self.recentReposList):
             repoPath = self.recentReposList[selectedIndex-1]
-            if repoPath and os.path.exists(repoPath):
-                try:
-                    self.setRepository(repoPath)
-                    # 发送信号前临时阻断更新
-                    self.repositoryOpened.emit(repoPath)
-                except Exception as e:
-                    QMessageBox.critical(self, "错误", f"打开仓库失败: {str(e)}")
+            if repoPath:
+                # 最近仓库可能位于已断开的网络驱动器上，存在性检查放到后台线程
+                self._probePath(repoPath, lambda exists, _: self._openRecentRepo(repoPath, exists))
             else:
-                InfoBar.warning(
-                    title="无效仓库路径",
-                    content=f"路径 '{repoPath}' 不存在或无效",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'warning', "无效仓库路径", f"路径 '{repoPath}' 不存在或无效")
+                
+    def _openRecentRepo(self, repoPath, exists):
+        """ 路径检查完成后打开最近仓库
+        Args:
+            repoPath: 仓库路径
+            exists: 路径是否存在
+        """
+        if not exists:
+            show_info_bar(self, 'warning', "无效仓库路径", f"路径 '{repoPath}' 不存在或无效")
+            return
+            
+        try:
+            self.setRepository(repoPath)
+            # 发送信号前临时阻断更新
+            self.repositoryOpened.emit(repoPath)
+        except Exception as e:
+            self._showError("错误", f"打开仓库失败: {str(e)}")
         
     def openRepository(self):
         """ 打开仓库 """
@@ -325,45 +749,92 @@ class GitPanel(QWidget):
                 self.setRepository(repoPath)
                 self.repositoryOpened.emit(repoPath)
             except Exception as e:
-                QMessageBox.critical(self, "错误", f"打开仓库失败: {str(e)}")
+                self._showError("错误", f"打开仓库失败: {str(e)}")
             
-    def setRepository(self, path):
-        """ 设置Git仓库路径 """
-        if not path or not os.path.exists(path):
+    def setRepository(self, path, prepared=None):
+        """ 设置Git仓库路径
+        Args:
+            path: 仓库路径
+            prepared: 工作线程中预先准备的仓库数据，包含git_manager和remotes
+        """
+        # 路径是否存在由打开线程判断，不存在时走打开失败的提示，避免在界面线程访问网络路径
+        if not path:
             return
             
+        # 取消上一个仓库进行中的打开和状态刷新，避免旧结果覆盖新仓库的界面
+        self._openToken.set()
+        self._openToken = threading.Event()
+        self._cancelRefresh()
+        
+        if prepared:
+            self._applyOpenedRepo(path, prepared)
+            return
+            
+        # 构造GitManager会读取仓库的index和配置，放到后台线程执行
+        self.statusLabel.setText(f"正在打开仓库: {os.path.basename(path)}")
+        thread = GitOpenThread(path, self._openToken, self)
+        thread.repoOpened.connect(self.onRepoOpened)
+        thread.openFailed.connect(self.onRepoOpenFailed)
+        thread.finished.connect(thread.deleteLater)
+        thread.start()
+        
+    def onRepoOpened(self, token, path, prepared):
+        """ 仓库打开完成的回调
+        Args:
+            token: 发起本次打开时的取消令牌
+            path: 仓库路径
+            prepared: 包含git_manager和remotes的仓库数据
+        """
+        if token is not self._openToken:
+            return
+        self._applyOpenedRepo(path, prepared)
+        
+    def onRepoOpenFailed(self, token, path, message):
+        """ 仓库打开失败的回调 """
+        if token is not self._openToken:
+            return
+        self._applyOpenedRepo(path, None, message)
+        
+    def _applyOpenedRepo(self, path, prepared, message=None):
+        """ 使用打开好的仓库更新面板
+        Args:
+            path: 仓库路径
+            prepared: 包含git_manager和remotes的仓库数据，打开失败时为None
+            message: 打开失败时的错误信息
+        """
+        # 打开期间可能有刷新请求，确保不会沿用上一个仓库的状态
+        self._cancelRefresh()
+        self._invalidateRemotesCache()
+        self._stashCache = None
+        self._branchCache = None
+        self._branchesCache = None
+            
         try:
-            self.gitManager = GitManager(path)
+            if prepared is None:
+                raise Exception(message)
+            self.gitManager = prepared['git_manager']
+            self._remotesCache = prepared['remotes']
             if self.gitManager.isValidRepo():
+                self._resetStatusReaders(self.gitManager.repo_path)
                 self.statusLabel.setText(f"当前仓库: {os.path.basename(path)}")
                 
+                # 先用该仓库上次的状态填充界面，随后的刷新只在状态变化时重绘
+                cached = self._repoStatusCache.get(self.gitManager.repo_path)
+                if cached:
+                    self._repoStatusCache.move_to_end(self.gitManager.repo_path)
+                    self._applyStatus(cached)
+                    self.statusLabel.setText(f"当前仓库: {os.path.basename(path)}（正在刷新...）")
+                
                 # 检查是否有远程仓库，根据结果启用或禁用相关按钮
-                remotes = self.gitManager.getRemotes()
+                remotes = self._getRemotesCached()
                 has_remotes = len(remotes) > 0
                 
-                # 始终启用的按钮
-                self.commitBtn.setEnabled(True)
-                self.branchBtn.setEnabled(True)
-                self.remoteBtn.setEnabled(True)
-                self.branchCombo.setEnabled(True)
-                self.stashBtn.setEnabled(True)
-                
-                # 只有当存在远程仓库时才启用的按钮
-                self.pushBtn.setEnabled(has_remotes)
-                self.pullBtn.setEnabled(has_remotes)
-                self.syncBtn.setEnabled(has_remotes)
+                # 仓库相关按钮始终启用，远程相关按钮只有当存在远程仓库时才启用
+                self._setRepoControlsEnabled(True, has_remotes)
                 
                 # 如果没有远程仓库，显示提示信息
                 if not has_remotes:
-                    InfoBar.info(
-                        title="没有远程仓库",
-                        content="当前仓库没有配置远程仓库，部分功能将被禁用",
-                        orient=Qt.Horizontal,
-                        isClosable=True,
-                        position=InfoBarPosition.TOP,
-                        duration=3000,
-                        parent=self
-                    )
+                    show_info_bar(self, 'info', "没有远程仓库", "当前仓库没有配置远程仓库，部分功能将被禁用", 3000)
                 
                 self.refreshStatus()
                 
@@ -372,34 +843,42 @@ class GitPanel(QWidget):
             else:
                 self.statusLabel.setText("无效的Git仓库")
                 self.gitManager = None
-                self.commitBtn.setEnabled(False)
-                self.pushBtn.setEnabled(False)
-                self.pullBtn.setEnabled(False)
-                self.stashBtn.setEnabled(False)
-                self.branchBtn.setEnabled(False)
-                self.remoteBtn.setEnabled(False)
-                self.branchCombo.setEnabled(False)
-                self.syncBtn.setEnabled(False)
+                self._resetStatusReaders()
+                self._setRepoControlsEnabled(False, False)
                 
-                InfoBar.warning(
-                    title="无效仓库",
-                    content="所选路径不是有效的Git仓库",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'warning', "无效仓库", "所选路径不是有效的Git仓库")
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"打开仓库失败: {str(e)}")
+            self._showError("错误", f"打开仓库失败: {str(e)}")
             self.gitManager = None
-            self.commitBtn.setEnabled(False)
-            self.pushBtn.setEnabled(False)
-            self.pullBtn.setEnabled(False)
-            self.stashBtn.setEnabled(False)
-            self.branchBtn.setEnabled(False)
-            self.remoteBtn.setEnabled(False)
-            self.branchCombo.setEnabled(False)
+            self._resetStatusReaders()
+            self._setRepoControlsEnabled(False, False)
+            
+    def _resetStatusReaders(self, repo_path=None):
+        """ 切换仓库时更换状态刷新线程专用的GitManager，仍是同一仓库时继续复用
+        Args:
+            repo_path: 新仓库路径，为None时只关闭旧的实例
+        """
+        if self._statusReaders is not None:
+            if self._statusReaders.repo_path == repo_path:
+                return
+            self._statusReaders.close()
+        self._statusReaders = GitStatusReaders(repo_path) if repo_path else None
+        
+    def _setRepoControlsEnabled(self, opened, has_remotes):
+        """ 统一设置仓库相关控件的可用状态
+        Args:
+            opened: 是否已打开有效的仓库
+            has_remotes: 是否存在远程仓库，仅在已打开仓库时生效
+        """
+        # 暂停重绘，所有控件状态设置完成后统一刷新一次
+        self.setUpdatesEnabled(False)
+        try:
+            for control in self._repoControls:
+                control.setEnabled(opened)
+            for control in self._remoteControls:
+                control.setEnabled(opened and has_remotes)
+        finally:
+            self.setUpdatesEnabled(True)
             
     def initializeRepository(self):
         """ 初始化新仓库 """
@@ -430,10 +909,21 @@ class GitPanel(QWidget):
         fullRepoPath = os.path.abspath(fullRepoPath)
         info(f"GitPanel - 完整的仓库路径: {fullRepoPath}")
         
+        # 目录检查放到后台线程，网络路径响应慢时不会卡住界面
+        self._probePath(fullRepoPath,
+                        lambda exists, nonempty: self._initRepositoryAt(fullRepoPath, repoName, nonempty))
+        
+    def _initRepositoryAt(self, fullRepoPath, repoName, nonempty):
+        """ 目录检查完成后继续初始化仓库
+        Args:
+            fullRepoPath: 完整的仓库路径
+            repoName: 仓库名称
+            nonempty: 目录是否已存在且不为空
+        """
         # 检查路径是否已存在
-        if os.path.exists(fullRepoPath) and os.listdir(fullRepoPath):
-            reply = QMessageBox.question(
-                self, "确认覆盖", 
+        if nonempty:
+            reply = self._ask(
+                "确认覆盖", 
                 f"目录 {fullRepoPath} 已存在且不为空，是否继续？\n（不会删除现有文件，但会将此目录初始化为Git仓库）",
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No
@@ -443,8 +933,8 @@ class GitPanel(QWidget):
                 return
         
         # 询问是否同时创建远程仓库
-        createRemote = QMessageBox.question(
-            self, "创建远程仓库",
+        createRemote = self._ask(
+            "创建远程仓库",
             "是否同时在GitHub/GitLab上创建远程仓库？",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
@@ -453,22 +943,15 @@ class GitPanel(QWidget):
         try:
             info(f"GitPanel - 开始初始化仓库: {fullRepoPath}")
             
-            # 使用Git线程执行初始化操作
-            self.gitThread.setup(
-                operation='init',
-                git_manager=None,  # 不再需要GitManager实例
-                path=fullRepoPath,
-                initial_branch="main"
-            )
-            self.gitThread.start()
-            
-            # 这个方法会在Git操作完成后在onGitOperationFinished中调用
+            # 初始化完成后打开新仓库，回调在Git线程退出后执行
             def on_init_finished(success, op, msg):
                 if success:
                     info(f"GitPanel - 仓库初始化成功: {fullRepoPath}")
                     # 尝试打开新创建的仓库
                     try:
                         # 初始化成功，创建远程仓库（如果需要）
+                        # 延迟导入，只有创建仓库的流程才需要加载GitPython
+                        import git
                         local_repo = git.Repo(fullRepoPath)
                         if createRemote:
                             self.createRemoteRepository(local_repo, fullRepoPath, repoName)
@@ -487,16 +970,14 @@ class GitPanel(QWidget):
                         )
                 else:
                     error(f"GitPanel - 仓库初始化失败: {msg}")
-                
-                # 移除临时连接
-                self.gitThread.operationFinished.disconnect(on_init_finished)
             
-            # 临时连接，只处理一次初始化完成的回调
-            self.gitThread.operationFinished.connect(on_init_finished)
+            # 使用Git线程执行初始化操作
+            self._runGitOperation('init', on_finished=on_init_finished,
+                                  path=fullRepoPath, initial_branch="main")
             
         except Exception as e:
             error(f"GitPanel - 初始化仓库失败: {str(e)}, 路径: {fullRepoPath}")
-            QMessageBox.critical(self, "错误", f"初始化仓库失败: {str(e)}")
+            self._showError("错误", f"初始化仓库失败: {str(e)}")
 
     def createRemoteRepository(self, local_repo, repo_path, repo_name):
         """ 创建远程仓库并关联
@@ -517,8 +998,8 @@ class GitPanel(QWidget):
         
         # 如果没有配置任何账号，提示添加账号
         if not github_accounts and not gitlab_accounts:
-            reply = QMessageBox.question(
-                self, "添加账号",
+            reply = self._ask(
+                "添加账号",
                 "创建远程仓库需要配置GitHub或GitLab账号，是否现在添加账号？",
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.Yes
@@ -559,8 +1040,8 @@ class GitPanel(QWidget):
             # 只有一个账号，直接使用
             selected = choices[0]
             # 询问是否创建为私有仓库
-            is_private = QMessageBox.question(
-                self, "仓库隐私设置",
+            is_private = self._ask(
+                "仓库隐私设置",
                 "是否创建为私有仓库？",
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No
@@ -632,7 +1113,7 @@ class GitPanel(QWidget):
                     info(f"GitHub远程仓库创建成功: {remote_url}")
                 else:
                     error("GitHub远程仓库创建失败")
-                    QMessageBox.critical(self, "错误", "GitHub远程仓库创建失败，请检查网络和账号设置")
+                    self._showError("错误", "GitHub远程仓库创建失败，请检查网络和账号设置")
                     return
             elif platform == "gitlab":
                 # 创建GitLab远程仓库
@@ -649,7 +1130,7 @@ class GitPanel(QWidget):
                     info(f"GitLab远程仓库创建成功: {remote_url}")
                 else:
                     error("GitLab远程仓库创建失败")
-                    QMessageBox.critical(self, "错误", "GitLab远程仓库创建失败，请检查网络和账号设置")
+                    self._showError("错误", "GitLab远程仓库创建失败，请检查网络和账号设置")
                     return
             
             # 将远程仓库与本地仓库关联并推送内容
@@ -657,12 +1138,13 @@ class GitPanel(QWidget):
                 # 设置远程仓库
                 debug(f"正在关联本地仓库与远程仓库: {remote_url}")
                 try:
-                    if 'origin' in [remote.name for remote in local_repo.remotes]:
-                        # 如果origin已存在，则设置URL
-                        local_repo.remote('origin').set_url(remote_url)
-                    else:
-                        # 创建新的远程引用
-                        local_repo.create_remote('origin', remote_url)
+                    # 直接写入origin的配置，origin不存在时即为创建，
+                    # 省去读取远程列表和remote add/set-url各启动一次git进程
+                    with local_repo.config_writer() as writer:
+                        writer.set_value('remote "origin"', 'url', remote_url)
+                        if not writer.has_option('remote "origin"', 'fetch'):
+                            writer.set_value('remote "origin"', 'fetch', '+refs/heads/*:refs/remotes/origin/*')
+                    self._invalidateRemotesCache()
                     
                     # 修改远程仓库URL以包含token（用于推送时身份验证）
                     authenticated_url = remote_url
@@ -687,101 +1169,367 @@ class GitPanel(QWidget):
                     )
         except Exception as e:
             error(f"创建远程仓库时发生错误: {str(e)}")
-            QMessageBox.critical(self, "错误", f"创建远程仓库时发生错误: {str(e)}")
+            self._showError("错误", f"创建远程仓库时发生错误: {str(e)}")
 
     def refreshStatus(self):
+        """ 请求刷新Git状态，150毫秒内的多次请求只执行一次 """
+        # 进行中的刷新结果已过期，不能再回填缓存；分支缓存由刷新结果更新，
+        # 只在改变引用的操作完成后失效
+        self._cancelRefresh()
+        self._refreshTimer.start()
+        
+    def _doRefreshStatus(self):
         """ 刷新Git状态 """
         if not self.gitManager:
             return
             
+        # 新的刷新会取代进行中的刷新
+        self._cancelRefresh()
+        
+        # 在后台线程读取状态，完成后回到UI线程更新列表
+        # HEAD未移动时状态线程直接复用上次的提交历史
+        cached = self._repoStatusCache.get(self.gitManager.repo_path)
+        history = (cached['head'], cached['commits']) if cached else None
+        thread = GitStatusThread(self._statusReaders, self._cancelToken, 5, self,
+                                 remotes=self._remotesCache,
+                                 untracked_mode=self._untrackedMode,
+                                 history=history)
+        thread.statusReady.connect(self.onStatusReady)
+        thread.statusFailed.connect(self.onStatusFailed)
+        thread.finished.connect(thread.deleteLater)
+        self._statusThread = thread
+        thread.start()
+        
+    def toggleUntrackedMode(self):
+        """ 依次切换未跟踪文件的扫描方式并重新刷新 """
+        modes = self.UNTRACKED_MODES
+        self._untrackedMode = modes[(modes.index(self._untrackedMode) + 1) % len(modes)]
+        self.configManager.set_untracked_mode(self._untrackedMode)
+        
+        tip = self.UNTRACKED_MODE_TIPS[self._untrackedMode]
+        self.untrackedBtn.setToolTip(tip)
+        show_info_bar(self, 'info', "变更文件", tip)
+        self.refreshStatus()
+        
+    def _cancelRefresh(self):
+        """ 取消进行中的状态刷新 """
+        self._cancelToken.set()
+        self._cancelToken = threading.Event()
+        self._statusThread = None
+        
+    def _currentBranch(self):
+        """ 获取当前分支名称，结果缓存到下一次刷新或切换分支
+        Returns:
+            str: 当前分支名称
+        """
+        if self._branchCache is None:
+            self._branchCache = self.gitManager.getCurrentBranch()
+        return self._branchCache
+        
+    def _getBranchesCached(self):
+        """ 获取分支列表，结果在有效期内缓存
+        Returns:
+            tuple: 分支名称元组，直接返回缓存无需复制
+        """
+        if self._branchesCache is None or time.monotonic() - self._branchesCache[0] > self.BRANCHES_CACHE_TTL:
+            self._setBranchesCache(self.gitManager.getBranches())
+        return self._branchesCache[1]
+        
+    def _pickBranch(self, title, prompt):
+        """ 从当前分支以外的分支中选择一个
+        
+        对话框立即打开，分支列表缓存过期时在后台线程读取，读取完成后再填充
+        Args:
+            title: 对话框标题
+            prompt: 提示文本
+        Returns:
+            tuple: (选中的分支名, 是否确认)
+        """
+        currentBranch = self._currentBranch()
+        dialog = ItemPickerDialog(self, title, prompt, None)
+        
+        def fill():
+            # 对话框直接绑定面板持有的分支模型，由过滤模型跳过当前分支，无需复制列表
+            dialog.setSourceModel(self._branchModel, excluded=currentBranch)
+            
+        thread = None
+        if self._branchesCache is not None and time.monotonic() - self._branchesCache[0] <= self.BRANCHES_CACHE_TTL:
+            fill()
+        else:
+            thread = BranchListThread(self._statusReaders, self)
+            thread.loaded.connect(self._setBranchesCache)
+            thread.loaded.connect(lambda branches: fill())
+            thread.failed.connect(dialog.setLoadFailed)
+            thread.finished.connect(thread.deleteLater)
+            thread.start()
+            
         try:
-            # 获取变更文件
-            changes = self.gitManager.getChangedFiles()
+            accepted = dialog.exec_() == QDialog.Accepted
+            branchName = dialog.selectedText() if accepted else ""
+        finally:
+            if thread is not None:
+                # 对话框关闭后线程可能仍在读取，断开与对话框相关的连接，只保留缓存更新
+                try:
+                    thread.loaded.disconnect()
+                    thread.failed.disconnect()
+                    thread.loaded.connect(self._setBranchesCache)
+                except (TypeError, RuntimeError):
+                    pass  # 线程已结束并被删除
+            dialog.deleteLater()
             
-            # 清空列表
-            self.changesList.clear()
+        return branchName, bool(branchName)
+        
+    def _setBranchesCache(self, branches):
+        """ 更新分支列表缓存，列表变化时同步更新分支模型
+        Args:
+            branches: 分支名称列表
+        """
+        branches = tuple(branches)
+        if branches != self._branchModelItems:
+            self._branchModel.setStringList(list(branches))
+            self._branchModelItems = branches
+        self._branchesCache = (time.monotonic(), branches)
+        
+    def _getRemotesCached(self):
+        """ 获取远程仓库名称列表，结果在会话内缓存
+        Returns:
+            list: 远程仓库名称列表
+        """
+        if self._remotesCache is None:
+            self._remotesCache = self.gitManager.getRemotes()
+        return self._remotesCache
+        
+    def _getRemoteDetailsCached(self):
+        """ 获取远程仓库详细信息，结果在会话内缓存
+        Returns:
+            list: 远程仓库信息列表，包含名称和URL
+        """
+        if self._remoteDetailsCache is None:
+            self._remoteDetailsCache = self.gitManager.getRemoteDetails()
+        return self._remoteDetailsCache
+        
+    def _invalidateRemotesCache(self):
+        """ 远程仓库发生变化后清除缓存 """
+        self._remotesCache = None
+        self._remoteDetailsCache = None
+        
+    def _getStashesCached(self):
+        """ 获取存储列表，加载时一次性解析存储ID
+        Returns:
+            list: (存储ID, 显示文本)元组列表
+        """
+        if self._stashCache is None:
+            stashes = []
+            for line in self.gitManager.getStashList():
+                stash_id = _parse_stash_id(line)
+                if stash_id is not None:
+                    stashes.append((stash_id, line))
+            self._stashCache = stashes
+        return self._stashCache
+        
+    def _showListDialog(self, title, items, prompt=None):
+        """ 显示基于QListView的只读列表对话框，列表行由视图按需渲染
+        Args:
+            title: 对话框标题
+            items: 要显示的字符串列表
+            prompt: 列表上方的提示文本
+        """
+        dialog = QDialog(self)
+        dialog.setWindowTitle(title)
+        dialog.resize(500, 400)
+        
+        layout = QVBoxLayout(dialog)
+        
+        if prompt:
+            layout.addWidget(QLabel(prompt))
             
-            # 添加变更文件到列表
-            for status, path in changes:
-                item = QListWidgetItem()
-                
-                # 创建一个包含复选框的小部件
-                widget = QWidget()
-                layout = QHBoxLayout(widget)
-                layout.setContentsMargins(5, 0, 5, 0)
-                
-                checkbox = QCheckBox()
-                checkbox.setChecked(True)
-                
-                statusLabel = QLabel(status)
-                statusLabel.setFixedWidth(80)
-                
-                pathLabel = QLabel(path)
-                
-                layout.addWidget(checkbox)
-                layout.addWidget(statusLabel)
-                layout.addWidget(pathLabel)
-                
-                item.setSizeHint(widget.sizeHint())
-                self.changesList.addItem(item)
-                self.changesList.setItemWidget(item, widget)
+        # 列表视图
+        listView = QListView(dialog)
+        listView.setModel(QStringListModel(items, listView))
+        listView.setEditTriggers(QListView.NoEditTriggers)
+        listView.setUniformItemSizes(True)
+        layout.addWidget(listView)
+        
+        # 按钮
+        btnLayout = QHBoxLayout()
+        btnLayout.addStretch(1)
+        
+        closeBtn = PrimaryPushButton("关闭")
+        closeBtn.clicked.connect(dialog.accept)
+        btnLayout.addWidget(closeBtn)
+        layout.addLayout(btnLayout)
+        
+        dialog.exec_()
+        
+    def _showError(self, title, text):
+        """ 显示错误对话框，复用同一个QMessageBox实例
+        Args:
+            title: 对话框标题
+            text: 错误信息
+        """
+        box = self._errorBox
+        if box.isVisible():
+            # 错误对话框正在显示时又出现错误，临时创建一个
+            box = QMessageBox(self)
+            box.setStandardButtons(QMessageBox.Ok)
+        box.setIcon(QMessageBox.Critical)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec_()
+        
+    def _ask(self, title, text, buttons=QMessageBox.Yes | QMessageBox.No, defaultButton=QMessageBox.NoButton):
+        """ 显示询问对话框，复用同一个QMessageBox实例，用法与QMessageBox.question一致
+        Args:
+            title: 对话框标题
+            text: 提示文本
+            buttons: 标准按钮组合
+            defaultButton: 默认按钮
+        Returns:
+            QMessageBox.StandardButton: 用户点击的按钮
+        """
+        box = self._confirmBox
+        if box.isVisible():
+            box = QMessageBox(self)
+        box.setIcon(QMessageBox.Question)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(buttons)
+        box.setDefaultButton(defaultButton)
+        return box.exec_()
+        
+    def _confirm(self, key, title, text):
+        """ 显示带"不再询问"选项的确认对话框
+        Args:
+            key: 操作标识，用于保存"不再询问"设置
+            title: 对话框标题
+            text: 提示文本
+        Returns:
+            bool: 用户是否确认，已选择不再询问时直接返回True
+        """
+        if not self.configManager.get_confirm_enabled(key):
+            return True
+            
+        box = self._dontAskBox
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setDefaultButton(QMessageBox.No)
+        dontAskBox = box.checkBox()
+        dontAskBox.setChecked(False)
+        
+        confirmed = box.exec_() == QMessageBox.Yes
+        # 只有确认时才记住选择，避免取消操作后被永久跳过
+        if confirmed and dontAskBox.isChecked():
+            self.configManager.set_confirm_enabled(key, False)
+        return confirmed
+        
+    def _pickItem(self, title, prompt, items):
+        """ 从可搜索的列表中选择一项，选项在对话框打开后按需加载
+        Args:
+            title: 对话框标题
+            prompt: 提示文本
+            items: 选项字符串的可迭代对象，可以是生成器
+        Returns:
+            tuple: (选中的文本, 是否确认)，与QInputDialog.getItem一致
+        """
+        return ItemPickerDialog.getItem(self, title, prompt, lambda: items)
+        
+    def onStatusFailed(self, token, message):
+        """ 状态读取失败的回调 """
+        if token is not self._cancelToken:
+            return
+            
+        # 刷新失败时保留缓存中上次成功的状态
+        self.statusLabel.setText(f"当前仓库: {os.path.basename(self.gitManager.repo_path)}")
+        self._showError("错误", f"刷新状态失败: {message}")
+        
+    def onStatusReady(self, token, status):
+        """ 状态读取完成的回调
+        Args:
+            token: 发起本次刷新时的取消令牌
+            status: 状态字典
+        """
+        # 已被取消或被更新的刷新取代的结果直接丢弃
+        if token is not self._cancelToken:
+            return
+            
+        self.statusLabel.setText(f"当前仓库: {os.path.basename(self.gitManager.repo_path)}")
+        self._branchCache = status['current_branch']
+        self._remotesCache = status['remotes']
+        if status['branches'] is not None:
+            self._setBranchesCache(status['branches'])
+        
+        # 与当前显示的状态相同时无需重绘
+        repo_path = self.gitManager.repo_path
+        if self._repoStatusCache.get(repo_path) == status:
+            self._repoStatusCache.move_to_end(repo_path)
+            return
+        self._repoStatusCache[repo_path] = status
+        self._repoStatusCache.move_to_end(repo_path)
+        while len(self._repoStatusCache) > self.REPO_STATUS_CACHE_SIZE:
+            self._repoStatusCache.popitem(last=False)
+        self._applyStatus(status)
+        
+    def _applyStatus(self, status):
+        """ 用状态字典更新变更列表、提交历史、分支下拉框和远程相关按钮
+        Args:
+            status: 状态字典
+        """
+        try:
+            # 更新变更文件，行内容由委托在绘制时生成
+            self.changesModel.setChanges(status['changes'])
                 
-            # 获取最近的提交历史
-            commits = self.gitManager.getCommitHistory(5)
-            
-            # 清空历史列表
-            self.historyList.clear()
-            
-            # 添加提交历史到列表
-            for commit in commits:
-                item = QListWidgetItem()
-                item.setText(f"{commit['hash'][:7]} - {commit['message']}")
-                item.setToolTip(f"作者: {commit['author']}\n日期: {commit['date']}\n消息: {commit['message']}")
-                self.historyList.addItem(item)
+            # 更新提交历史，文本和提示信息由模型按需生成
+            self.historyModel.setCommits(status['commits'])
                 
             # 更新分支下拉框
-            self.updateBranchCombo()
+            if status['branches'] is not None:
+                self.updateBranchCombo(status['current_branch'], status['branches'])
             
             # 检查远程仓库状态并更新UI
-            remotes = self.gitManager.getRemotes()
-            has_remotes = len(remotes) > 0
+            has_remotes = len(status['remotes']) > 0
             
             # 根据是否有远程仓库来启用或禁用相关按钮
-            self.pushBtn.setEnabled(has_remotes)
-            self.pullBtn.setEnabled(has_remotes)
-            self.syncBtn.setEnabled(has_remotes)
+            self._setRepoControlsEnabled(True, has_remotes)
                 
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"刷新状态失败: {str(e)}")
+            self._showError("错误", f"刷新状态失败: {str(e)}")
             
-    def updateBranchCombo(self):
-        """ 更新分支下拉框 """
+    def updateBranchCombo(self, currentBranch=None, branches=None):
+        """ 更新分支下拉框
+        Args:
+            currentBranch: 当前分支名称，为None时从仓库读取
+            branches: 分支列表，为None时从仓库读取
+        """
         if not self.gitManager:
             return
             
         try:
             # 获取当前分支
-            currentBranch = self.gitManager.getCurrentBranch()
+            if currentBranch is None:
+                currentBranch = self._currentBranch()
             
             # 获取所有分支
-            branches = self.gitManager.getBranches()
+            if branches is None:
+                branches = self._getBranchesCached()
             
             # 记住选中的索引
             previousIndex = self.branchCombo.currentIndex()
             
-            # 清空下拉框
-            self.branchCombo.clear()
-            
-            # 添加分支到下拉框
-            for branch in branches:
-                self.branchCombo.addItem(branch)
+            # 重建期间阻断信号，避免添加条目时触发切换分支
+            with QSignalBlocker(self.branchCombo):
+                # 清空下拉框
+                self.branchCombo.clear()
                 
-            # 选中当前分支
-            index = self.branchCombo.findText(currentBranch)
-            if index >= 0:
-                self.branchCombo.setCurrentIndex(index)
-            elif previousIndex >= 0 and previousIndex < self.branchCombo.count():
-                self.branchCombo.setCurrentIndex(previousIndex)
+                # 添加分支到下拉框
+                for branch in branches:
+                    self.branchCombo.addItem(branch)
+                    
+                # 选中当前分支
+                index = self.branchCombo.findText(currentBranch)
+                if index >= 0:
+                    self.branchCombo.setCurrentIndex(index)
+                elif previousIndex >= 0 and previousIndex < self.branchCombo.count():
+                    self.branchCombo.setCurrentIndex(previousIndex)
                 
         except Exception as e:
             print(f"更新分支下拉框失败: {e}")
@@ -792,12 +1540,12 @@ class GitPanel(QWidget):
             return
             
         selectedBranch = self.branchCombo.currentText()
-        currentBranch = self.gitManager.getCurrentBranch()
+        currentBranch = self._currentBranch()
         
         if selectedBranch != currentBranch:
             try:
-                reply = QMessageBox.question(
-                    self, "切换分支", 
+                reply = self._ask(
+                    "切换分支", 
                     f"确定要切换到分支 '{selectedBranch}' 吗？\n这将丢弃所有未提交的更改。",
                     QMessageBox.Yes | QMessageBox.No,
                     QMessageBox.No
@@ -807,186 +1555,81 @@ class GitPanel(QWidget):
                     self.gitManager.checkoutBranch(selectedBranch)
                     self.refreshStatus()
                     
-                    InfoBar.success(
-                        title="切换分支成功",
-                        content=f"已切换到分支 '{selectedBranch}'",
-                        orient=Qt.Horizontal,
-                        isClosable=True,
-                        position=InfoBarPosition.TOP,
-                        duration=2000,
-                        parent=self
-                    )
+                    # 切换成功后当前分支已知，刷新完成前无需再读取
+                    self._branchCache = selectedBranch
+                    
+                    show_info_bar(self, 'success', "切换分支成功", f"已切换到分支 '{selectedBranch}'")
                 else:
                     # 恢复选中当前分支
                     index = self.branchCombo.findText(currentBranch)
                     if index >= 0:
-                        self.branchCombo.setCurrentIndex(index)
+                        with QSignalBlocker(self.branchCombo):
+                            self.branchCombo.setCurrentIndex(index)
             except Exception as e:
-                QMessageBox.critical(self, "错误", f"切换分支失败: {str(e)}")
+                self._showError("错误", f"切换分支失败: {str(e)}")
                 
                 # 恢复选中当前分支
                 index = self.branchCombo.findText(currentBranch)
                 if index >= 0:
-                    self.branchCombo.setCurrentIndex(index)
+                    with QSignalBlocker(self.branchCombo):
+                        self.branchCombo.setCurrentIndex(index)
                 
     def showBranchMenu(self):
         """ 显示分支菜单 """
         if not self.gitManager:
             return
             
-        # 创建菜单
-        menu = QMenu(self)
-        
-        # 创建新分支动作
-        createBranchAction = menu.addAction("创建新分支")
-        createBranchAction.triggered.connect(self.createNewBranch)
-        
-        # 合并分支动作
-        mergeBranchAction = menu.addAction("合并分支")
-        mergeBranchAction.triggered.connect(self.mergeBranch)
-        
-        # 删除分支动作
-        deleteBranchAction = menu.addAction("删除分支")
-        deleteBranchAction.triggered.connect(self.deleteBranch)
-        
         # 显示菜单
-        menu.exec_(QCursor.pos())
+        self._branchMenu.exec_(QCursor.pos())
         
     def createNewBranch(self):
         """ 创建新分支 """
         if not self.gitManager:
             return
             
-        # 输入分支名称
-        branchName, ok = QInputDialog.getText(
-            self, "创建分支", "请输入新分支名称:"
-        )
-        
-        if not ok or not branchName:
+        # 在一个对话框中输入分支名称并选择是否切换
+        dialog = NewBranchDialog(self)
+        if dialog.exec_() != QDialog.Accepted or not dialog.name():
             return
             
-        try:
-            # 创建分支
-            self.gitManager.createBranch(branchName)
-            
-            # 询问是否切换到新分支
-            reply = QMessageBox.question(
-                self, "切换分支", 
-                f"是否切换到新创建的分支 '{branchName}'?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.Yes
-            )
-            
-            if reply == QMessageBox.Yes:
-                self.gitManager.checkoutBranch(branchName)
-                
-            # 刷新状态
-            self.refreshStatus()
-            
-            InfoBar.success(
-                title="创建分支成功",
-                content=f"已成功创建分支 '{branchName}'",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"创建分支失败: {str(e)}")
+        # 在Git线程中创建分支，完成后统一刷新状态
+        self._runGitOperation('create_branch', branch_name=dialog.name(),
+                              checkout=dialog.switch())
             
     def mergeBranch(self):
         """ 合并分支 """
         if not self.gitManager:
             return
             
-        # 获取所有分支
-        branches = self.gitManager.getBranches()
-        currentBranch = self.gitManager.getCurrentBranch()
-        
-        # 从分支列表中移除当前分支
-        if currentBranch in branches:
-            branches.remove(currentBranch)
-            
-        if not branches:
-            InfoBar.warning(
-                title="无可合并分支",
-                content="没有其他分支可合并到当前分支",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
-            return
-            
-        # 选择要合并的分支
-        branchName, ok = QInputDialog.getItem(
-            self, "合并分支", 
-            f"选择要合并到 '{currentBranch}' 的分支:",
-            branches, 0, False
+        # 选择要合并的分支，分支列表在对话框打开后加载
+        branchName, ok = self._pickBranch(
+            "合并分支", 
+            f"选择要合并到 '{self._currentBranch()}' 的分支:"
         )
         
         if not ok or not branchName:
             return
             
-        try:
-            # 合并分支
-            self.gitManager.mergeBranch(branchName)
-            
-            # 刷新状态
-            self.refreshStatus()
-            
-            InfoBar.success(
-                title="合并分支成功",
-                content=f"已成功将 '{branchName}' 合并到 '{currentBranch}'",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"合并分支失败: {str(e)}")
+        # 在Git线程中合并分支
+        self._runGitOperation('merge_branch', branch_name=branchName)
             
     def deleteBranch(self):
         """ 删除分支 """
         if not self.gitManager:
             return
             
-        # 获取所有分支
-        branches = self.gitManager.getBranches()
-        currentBranch = self.gitManager.getCurrentBranch()
-        
-        # 从分支列表中移除当前分支
-        if currentBranch in branches:
-            branches.remove(currentBranch)
-            
-        if not branches:
-            InfoBar.warning(
-                title="无可删除分支",
-                content="没有其他分支可删除",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
-            return
-            
-        # 选择要删除的分支
-        branchName, ok = QInputDialog.getItem(
-            self, "删除分支", 
-            "选择要删除的分支:",
-            branches, 0, False
+        # 选择要删除的分支，分支列表在对话框打开后加载
+        branchName, ok = self._pickBranch(
+            "删除分支", 
+            "选择要删除的分支:"
         )
         
         if not ok or not branchName:
             return
             
         # 询问是否强制删除
-        reply = QMessageBox.question(
-            self, "删除分支", 
+        reply = self._ask(
+            "删除分支", 
             f"是否强制删除分支 '{branchName}'?\n强制删除可能导致未合并的更改丢失。",
             QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
             QMessageBox.No
@@ -995,60 +1638,17 @@ class GitPanel(QWidget):
         if reply == QMessageBox.Cancel:
             return
             
-        forceDelete = (reply == QMessageBox.Yes)
-        
-        try:
-            # 删除分支
-            self.gitManager.deleteBranch(branchName, forceDelete)
-            
-            # 刷新状态
-            self.refreshStatus()
-            
-            InfoBar.success(
-                title="删除分支成功",
-                content=f"已成功删除分支 '{branchName}'",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"删除分支失败: {str(e)}")
+        # 在Git线程中删除分支
+        self._runGitOperation('delete_branch', branch_name=branchName,
+                              force=(reply == QMessageBox.Yes))
             
     def showRemoteMenu(self):
         """ 显示远程仓库菜单 """
         if not self.gitManager:
             return
             
-        # 创建菜单
-        menu = QMenu(self)
-        
-        # 添加远程仓库动作
-        addRemoteAction = menu.addAction("添加远程仓库")
-        addRemoteAction.triggered.connect(self.addRemote)
-        
-        # 查看远程仓库动作
-        viewRemoteAction = menu.addAction("查看远程仓库")
-        viewRemoteAction.triggered.connect(self.viewRemotes)
-        
-        # 删除远程仓库动作
-        removeRemoteAction = menu.addAction("删除远程仓库")
-        removeRemoteAction.triggered.connect(self.removeRemote)
-        
-        # 添加分隔符
-        menu.addSeparator()
-        
-        # 从GitHub导入动作
-        importGitHubAction = menu.addAction("从GitHub导入")
-        importGitHubAction.triggered.connect(self.importFromGitHub)
-        
-        # 克隆远程仓库动作
-        cloneRepoAction = menu.addAction("克隆远程仓库")
-        cloneRepoAction.triggered.connect(self.cloneExternalRepo)
-        
         # 显示菜单
-        menu.exec_(QCursor.pos())
+        self._remoteMenu.exec_(QCursor.pos())
         
     def addRemote(self):
         """ 添加远程仓库 """
@@ -1063,12 +1663,13 @@ class GitPanel(QWidget):
         if not ok or not remoteName:
             return
             
-        # 检查远程仓库名称是否已存在
+        # 检查远程仓库名称是否已存在，结果在输入URL后继续使用
+        update = False
         try:
-            existing_remotes = self.gitManager.getRemotes()
-            if remoteName in existing_remotes:
-                reply = QMessageBox.question(
-                    self, "远程仓库已存在", 
+            update = remoteName in self._getRemotesCached()
+            if update:
+                reply = self._ask(
+                    "远程仓库已存在", 
                     f"远程仓库名称 '{remoteName}' 已存在，是否更新URL?",
                     QMessageBox.Yes | QMessageBox.No,
                     QMessageBox.No
@@ -1089,35 +1690,8 @@ class GitPanel(QWidget):
         if not ok or not remoteUrl:
             return
             
-        try:
-            # 尝试清理URL
-            remoteUrl = self.gitManager.sanitize_url(remoteUrl)
-            
-            # 添加或更新远程仓库
-            existing_remotes = self.gitManager.getRemotes()
-            if remoteName in existing_remotes:
-                # 更新已存在的远程仓库URL
-                self.gitManager.repo.git.remote('set-url', remoteName, remoteUrl)
-                message = f"已更新远程仓库 '{remoteName}' 的URL"
-            else:
-                # 添加新的远程仓库
-                self.gitManager.addRemote(remoteName, remoteUrl)
-                message = f"已成功添加远程仓库 '{remoteName}'"
-                
-            # 刷新状态并更新UI
-            self.refreshStatus()
-            
-            InfoBar.success(
-                title="操作成功",
-                content=message,
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"添加远程仓库失败: {str(e)}")
+        # 在Git线程中添加或更新远程仓库，URL由GitManager清理
+        self._runGitOperation('add_remote', remote_name=remoteName, url=remoteUrl, update=update)
             
     def viewRemotes(self):
         """ 查看远程仓库 """
@@ -1126,29 +1700,20 @@ class GitPanel(QWidget):
             
         try:
             # 获取远程仓库详情
-            remotes = self.gitManager.getRemoteDetails()
+            remotes = self._getRemoteDetailsCached()
             
             if not remotes:
-                InfoBar.info(
-                    title="无远程仓库",
-                    content="当前仓库没有配置远程仓库",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'info', "无远程仓库", "当前仓库没有配置远程仓库")
                 return
                 
             # 显示远程仓库信息
-            remoteInfo = "远程仓库列表:\n\n"
-            for remote in remotes:
-                remoteInfo += f"名称: {remote['name']}\n"
-                remoteInfo += f"URL: {remote['url']}\n\n"
-                
-            QMessageBox.information(self, "远程仓库信息", remoteInfo)
+            self._showListDialog(
+                "远程仓库信息",
+                [f"{remote['name']}: {remote['url']}" for remote in remotes],
+                "远程仓库列表:"
+            )
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"获取远程仓库信息失败: {str(e)}")
+            self._showError("错误", f"获取远程仓库信息失败: {str(e)}")
             
     def removeRemote(self):
         """ 删除远程仓库 """
@@ -1157,89 +1722,42 @@ class GitPanel(QWidget):
             
         try:
             # 获取远程仓库详情
-            remotes = self.gitManager.getRemoteDetails()
+            remotes = self._getRemoteDetailsCached()
             
             if not remotes:
-                InfoBar.info(
-                    title="无远程仓库",
-                    content="当前仓库没有配置远程仓库",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'info', "无远程仓库", "当前仓库没有配置远程仓库")
                 return
                 
-            # 获取远程仓库名称列表
-            remoteNames = [remote['name'] for remote in remotes]
+            # 名称到URL的索引，选择和确认时共用
+            remoteUrls = {remote['name']: remote['url'] for remote in remotes}
             
             # 选择要删除的远程仓库
-            remoteName, ok = QInputDialog.getItem(
-                self, "删除远程仓库", 
+            remoteName, ok = self._pickItem(
+                "删除远程仓库", 
                 "选择要删除的远程仓库:",
-                remoteNames, 0, False
+                remoteUrls
             )
             
             if not ok or not remoteName:
                 return
                 
             # 确认删除
-            reply = QMessageBox.question(
-                self, "删除远程仓库", 
-                f"确定要删除远程仓库 '{remoteName}' 吗?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            
-            if reply == QMessageBox.No:
+            if not self._confirm('remove_remote', "删除远程仓库",
+                                 f"确定要删除远程仓库 '{remoteName}' ({remoteUrls.get(remoteName, '')}) 吗?"):
                 return
                 
-            # 删除远程仓库
-            self.gitManager.removeRemote(remoteName)
-            
-            InfoBar.success(
-                title="删除远程仓库成功",
-                content=f"已成功删除远程仓库 '{remoteName}'",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            # 在Git线程中删除远程仓库
+            self._runGitOperation('remove_remote', remote_name=remoteName)
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"删除远程仓库失败: {str(e)}")
+            self._showError("错误", f"删除远程仓库失败: {str(e)}")
             
     def showStashMenu(self):
         """ 显示存储菜单 """
         if not self.gitManager:
             return
             
-        # 创建菜单
-        menu = QMenu(self)
-        
-        # 创建存储动作
-        createStashAction = menu.addAction("存储更改")
-        createStashAction.triggered.connect(self.stashChanges)
-        
-        # 应用存储动作
-        applyStashAction = menu.addAction("应用存储")
-        applyStashAction.triggered.connect(self.applyStash)
-        
-        # 查看存储列表动作
-        viewStashAction = menu.addAction("查看存储列表")
-        viewStashAction.triggered.connect(self.viewStashList)
-        
-        # 删除存储动作
-        dropStashAction = menu.addAction("删除存储")
-        dropStashAction.triggered.connect(self.dropStash)
-        
-        # 清空存储动作
-        clearStashAction = menu.addAction("清空所有存储")
-        clearStashAction.triggered.connect(self.clearStash)
-        
         # 显示菜单
-        menu.exec_(QCursor.pos())
+        self._stashMenu.exec_(QCursor.pos())
         
     def stashChanges(self):
         """ 存储更改 """
@@ -1254,24 +1772,8 @@ class GitPanel(QWidget):
         if not ok:
             return
             
-        try:
-            # 存储更改
-            self.gitManager.stashChanges(message if message else None)
-            
-            # 刷新状态
-            self.refreshStatus()
-            
-            InfoBar.success(
-                title="存储更改成功",
-                content="已成功存储工作区更改",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"存储更改失败: {str(e)}")
+        # 在Git线程中存储更改
+        self._runGitOperation('stash', message=message if message else None)
             
     def applyStash(self):
         """ 应用存储 """
@@ -1280,50 +1782,30 @@ class GitPanel(QWidget):
             
         try:
             # 获取存储列表
-            stashes = self.gitManager.getStashList()
+            stashes = self._getStashesCached()
             
             if not stashes:
-                InfoBar.info(
-                    title="无存储记录",
-                    content="没有可用的存储记录",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'info', "无存储记录", "没有可用的存储记录")
                 return
                 
             # 选择要应用的存储
-            stash, ok = QInputDialog.getItem(
-                self, "应用存储", 
+            displayList = [display for _, display in stashes]
+            stash, ok = self._pickItem(
+                "应用存储", 
                 "选择要应用的存储:",
-                stashes, 0, False
+                displayList
             )
             
             if not ok or not stash:
                 return
                 
             # 获取存储ID
-            stash_id = int(stash.split(':')[0].split('@')[1])
+            stash_id = stashes[displayList.index(stash)][0]
             
-            # 应用存储
-            self.gitManager.applyStash(stash_id)
-            
-            # 刷新状态
-            self.refreshStatus()
-            
-            InfoBar.success(
-                title="应用存储成功",
-                content="已成功应用存储的更改",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            # 在Git线程中应用存储
+            self._runGitOperation('apply_stash', stash_id=stash_id)
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"应用存储失败: {str(e)}")
+            self._showError("错误", f"应用存储失败: {str(e)}")
             
     def viewStashList(self):
         """ 查看存储列表 """
@@ -1332,28 +1814,16 @@ class GitPanel(QWidget):
             
         try:
             # 获取存储列表
-            stashes = self.gitManager.getStashList()
+            stashes = self._getStashesCached()
             
             if not stashes:
-                InfoBar.info(
-                    title="无存储记录",
-                    content="没有可用的存储记录",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'info', "无存储记录", "没有可用的存储记录")
                 return
                 
             # 显示存储列表
-            stashInfo = "存储列表:\n\n"
-            for stash in stashes:
-                stashInfo += f"{stash}\n"
-                
-            QMessageBox.information(self, "存储列表", stashInfo)
+            self._showListDialog("存储列表", [display for _, display in stashes], "存储列表:")
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"获取存储列表失败: {str(e)}")
+            self._showError("错误", f"获取存储列表失败: {str(e)}")
             
     def dropStash(self):
         """ 删除存储 """
@@ -1362,47 +1832,30 @@ class GitPanel(QWidget):
             
         try:
             # 获取存储列表
-            stashes = self.gitManager.getStashList()
+            stashes = self._getStashesCached()
             
             if not stashes:
-                InfoBar.info(
-                    title="无存储记录",
-                    content="没有可用的存储记录",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'info', "无存储记录", "没有可用的存储记录")
                 return
                 
             # 选择要删除的存储
-            stash, ok = QInputDialog.getItem(
-                self, "删除存储", 
+            displayList = [display for _, display in stashes]
+            stash, ok = self._pickItem(
+                "删除存储", 
                 "选择要删除的存储:",
-                stashes, 0, False
+                displayList
             )
             
             if not ok or not stash:
                 return
                 
             # 获取存储ID
-            stash_id = int(stash.split(':')[0].split('@')[1])
-            
-            # 删除存储
-            self.gitManager.dropStash(stash_id)
-            
-            InfoBar.success(
-                title="删除存储成功",
-                content="已成功删除存储",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            stash_id = stashes[displayList.index(stash)][0]
+            
+            # 在Git线程中删除存储
+            self._runGitOperation('drop_stash', stash_id=stash_id)
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"删除存储失败: {str(e)}")
+            self._showError("错误", f"删除存储失败: {str(e)}")
             
     def clearStash(self):
         """ 清空所有存储 """
@@ -1411,40 +1864,22 @@ class GitPanel(QWidget):
             
         try:
             # 确认清空
-            reply = QMessageBox.question(
-                self, "清空存储", 
-                "确定要清空所有存储吗? 此操作不可撤销。",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            
-            if reply == QMessageBox.No:
+            if not self._confirm('clear_stash', "清空存储", "确定要清空所有存储吗? 此操作不可撤销。"):
                 return
                 
-            # 清空存储
-            self.gitManager.clearStash()
-            
-            InfoBar.success(
-                title="清空存储成功",
-                content="已成功清空所有存储",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            # 在Git线程中清空存储
+            self._runGitOperation('clear_stash')
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"清空存储失败: {str(e)}")
+            self._showError("错误", f"清空存储失败: {str(e)}")
             
     def commitChanges(self):
         """ 提交更改 """
         if not self.gitManager:
             return
             
-        # 获取更改文件列表
-        changed_files = self.gitManager.getChangedFiles()
-        
-        if not changed_files:
+        # 直接使用变更面板中已读取的文件，不在界面线程重新执行git status
+        model = self.changesModel
+        if model.rowCount() == 0:
             QMessageBox.information(self, "提示", "没有需要提交的更改")
             return
             
@@ -1462,11 +1897,20 @@ class GitPanel(QWidget):
         fileListWidget = QListWidget()
         fileListWidget.setSelectionMode(QListWidget.MultiSelection)
         
-        for status, file_path in changed_files:
-            item = QListWidgetItem(f"{status}: {file_path}")
-            item.setData(Qt.UserRole, file_path)
+        # 对话框打开期间变更面板可能被刷新，先取出当前的文件列表
+        # 批量添加时暂停重绘，变更面板中取消勾选的文件默认不选择
+        file_paths = []
+        path_bytes = []
+        fileListWidget.setUpdatesEnabled(False)
+        for row in range(model.rowCount()):
+            index = model.index(row)
+            file_paths.append(index.data(Qt.UserRole))
+            path_bytes.append(index.data(_PATH_BYTES_ROLE))
+            item = QListWidgetItem(f"{index.data(_STATUS_ROLE)}: {file_paths[-1]}")
+            item.setData(Qt.UserRole, row)
             fileListWidget.addItem(item)
-            item.setSelected(True)  # 默认选择所有文件
+            item.setSelected(index.data(Qt.CheckStateRole) == Qt.Checked)
+        fileListWidget.setUpdatesEnabled(True)
             
         layout.addWidget(fileListWidget)
         
@@ -1494,13 +1938,9 @@ class GitPanel(QWidget):
         if dialog.exec_() != QDialog.Accepted:
             return
             
-        # 获取选择的文件
-        selected_files = []
-        for i in range(fileListWidget.count()):
-            item = fileListWidget.item(i)
-            if item.isSelected():
-                file_path = item.data(Qt.UserRole)
-                selected_files.append(file_path)
+        # 获取选择的文件，直接使用选择模型中的选中项
+        selected_rows = [item.data(Qt.UserRole) for item in fileListWidget.selectedItems()]
+        selected_files = [file_paths[row] for row in selected_rows]
                 
         # 获取提交消息
         commit_message = commitMessageEdit.text()
@@ -1513,13 +1953,10 @@ class GitPanel(QWidget):
             return
         
         # 使用Git线程执行提交操作
-        self.gitThread.setup(
-            operation='commit',
-            git_manager=self.gitManager,
-            file_paths=selected_files,
-            message=commit_message
-        )
-        self.gitThread.start()
+        if self._runGitOperation('commit', file_paths=selected_files,
+                                 path_bytes=[path_bytes[row] for row in selected_rows],
+                                 message=commit_message):
+            self._branchCache = None
 
     def pushChanges(self):
         """ 推送更改 """
@@ -1527,41 +1964,25 @@ class GitPanel(QWidget):
             return
             
         # 确保存在远程仓库
-        if not self.ensureRemoteExists("推送"):
+        remotes = self.ensureRemoteExists("推送")
+        if not remotes:
             return
             
-        # 获取远程仓库列表
-        remotes = self.gitManager.getRemotes()
-        
-        remote_name = None
-        # 如果有多个远程仓库，让用户选择
-        if len(remotes) > 1:
-            remote_items = [remote for remote in remotes]
-            remote_name, ok = QInputDialog.getItem(
-                self, "选择远程仓库", 
-                "请选择要推送到的远程仓库:",
-                remote_items, 0, False
-            )
-            
-            if not ok or not remote_name:
-                return
-        else:
-            remote_name = remotes[0]
+        # 选择远程仓库
+        remote_name = self._chooseRemote(remotes, "请选择要推送到的远程仓库:")
+        if not remote_name:
+            return
         
         # 获取当前分支
-        branch = self.gitManager.getCurrentBranch()
+        branch = self._currentBranch()
         
         # 询问是否设置上游分支
         set_upstream = False
-        try:
-            # 检查是否需要设置上游分支
-            # 通过检查git rev-parse命令的输出来判断
-            self.gitManager.repo.git.rev_parse(f'{remote_name}/{branch}')
-        except:
-            # 异常表示远程没有对应分支，询问是否设置上游
-            reply = QMessageBox.question(
-                self, "设置上游分支", 
-                f"远程仓库 {remote_name} 没有 {branch} 分支。\n是否要设置为上游分支？",
+        if self.gitManager.getUpstream(branch) is None:
+            # 当前分支没有跟踪的上游分支，询问是否设置
+            reply = self._ask(
+                "设置上游分支", 
+                f"分支 {branch} 尚未跟踪远程仓库 {remote_name} 的分支。\n是否要设置为上游分支？",
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.Yes
             )
@@ -1569,14 +1990,8 @@ class GitPanel(QWidget):
             set_upstream = (reply == QMessageBox.Yes)
         
         # 使用Git线程执行推送操作
-        self.gitThread.setup(
-            operation='push',
-            git_manager=self.gitManager,
-            remote_name=remote_name,
-            branch=branch,
-            set_upstream=set_upstream
-        )
-        self.gitThread.start()
+        self._runGitOperation('push', remote_name=remote_name, branch=branch,
+                              set_upstream=set_upstream)
 
     def pullChanges(self):
         """ 拉取更改 """
@@ -1584,38 +1999,20 @@ class GitPanel(QWidget):
             return
             
         # 确保存在远程仓库
-        if not self.ensureRemoteExists("拉取"):
+        remotes = self.ensureRemoteExists("拉取")
+        if not remotes:
             return
             
-        # 获取远程仓库列表
-        remotes = self.gitManager.getRemotes()
-        
-        remote_name = None
-        # 如果有多个远程仓库，让用户选择
-        if len(remotes) > 1:
-            remote_items = [remote for remote in remotes]
-            remote_name, ok = QInputDialog.getItem(
-                self, "选择远程仓库", 
-                "请选择要拉取的远程仓库:",
-                remote_items, 0, False
-            )
-            
-            if not ok or not remote_name:
-                return
-        else:
-            remote_name = remotes[0]
+        # 选择远程仓库
+        remote_name = self._chooseRemote(remotes, "请选择要拉取的远程仓库:")
+        if not remote_name:
+            return
         
         # 获取当前分支
-        branch = self.gitManager.getCurrentBranch()
+        branch = self._currentBranch()
         
         # 使用Git线程执行拉取操作
-        self.gitThread.setup(
-            operation='pull',
-            git_manager=self.gitManager,
-            remote_name=remote_name,
-            branch=branch
-        )
-        self.gitThread.start()
+        self._runGitOperation('pull', remote_name=remote_name, branch=branch)
 
     def importFromGitHub(self):
         """ 从GitHub导入仓库 """
@@ -1633,29 +2030,12 @@ class GitPanel(QWidget):
         if not ok or not url:
             return
             
-        # 处理快捷方式
-        if not url.startswith("http") and "/" in url and not url.startswith("git@"):
-            # 将username/repo转换为完整URL
-            if url.count("/") == 1:  # 确保只有一个斜杠
-                url = f"https://github.com/{url}.git"
-        
-        # 确保URL格式正确（移除可能导致问题的部分）
-        if ":" in url and not url.startswith("git@"):
-            # 检查是否有不正确的端口指定
-            parts = url.split(":")
-            if len(parts) > 1 and not parts[0].endswith("//"):
-                # 修正格式为标准https URL
-                domain_parts = parts[0].split("//")
-                if len(domain_parts) > 1:
-                    protocol = domain_parts[0] + "//"
-                    domain = domain_parts[1]
-                    url = protocol + domain + "/" + "/".join(parts[1:])
-                    # 移除URL中可能的端口指定
-                    url = url.replace(":github.com", "github.com")
+        # 处理快捷方式并修正URL格式
+        url = _normalize_git_url(url)
         
         # 询问是否作为远程仓库添加
-        reply = QMessageBox.question(
-            self, "添加方式", 
+        reply = self._ask(
+            "添加方式", 
             "如何添加该仓库?\n\n选择'是'将其添加为远程仓库\n选择'否'直接拉取并合并内容",
             QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
             QMessageBox.Yes
@@ -1677,36 +2057,26 @@ class GitPanel(QWidget):
             if ok and name:
                 remote_name = name
             
-        try:
-            # 导入外部仓库
-            self.gitManager.importExternalRepo(url, as_remote, remote_name)
-            
-            # 如果添加为远程仓库，询问是否拉取
-            if as_remote:
-                reply = QMessageBox.question(
-                    self, "拉取更改", 
-                    f"是否立即从远程仓库 '{remote_name}' 拉取更改?",
-                    QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.Yes
-                )
+        # 如果添加为远程仓库，导入完成后询问是否拉取
+        def on_import_finished(success, op, msg):
+            if not success or not as_remote:
+                return
                 
-                if reply == QMessageBox.Yes:
-                    self.gitManager.pull(remote_name)
+            reply = self._ask(
+                "拉取更改", 
+                f"是否立即从远程仓库 '{remote_name}' 拉取更改?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.Yes
+            )
             
-            # 刷新状态
-            self.refreshStatus()
+            if reply == QMessageBox.Yes:
+                # 回调在Git线程退出后执行，可以直接开始拉取，
+                # 结果和刷新由onGitOperationFinished统一处理
+                self._runGitOperation('pull', remote_name=remote_name, branch=None)
             
-            InfoBar.success(
-                title="导入成功",
-                content=f"已成功从GitHub导入仓库" + (" 并添加为远程仓库" if as_remote else ""),
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"从GitHub导入失败: {str(e)}")
+        # 使用Git线程执行导入操作
+        self._runGitOperation('import', on_finished=on_import_finished,
+                              url=url, as_remote=as_remote, remote_name=remote_name)
             
     def cloneExternalRepo(self):
         """ 克隆外部仓库 """
@@ -1721,25 +2091,8 @@ class GitPanel(QWidget):
         if not ok or not url:
             return
             
-        # 处理快捷方式
-        if not url.startswith("http") and "/" in url and not url.startswith("git@"):
-            # 将username/repo转换为完整URL
-            if url.count("/") == 1:  # 确保只有一个斜杠
-                url = f"https://github.com/{url}.git"
-                
-        # 确保URL格式正确（移除可能导致问题的部分）
-        if ":" in url and not url.startswith("git@"):
-            # 检查是否有不正确的端口指定
-            parts = url.split(":")
-            if len(parts) > 1 and not parts[0].endswith("//"):
-                # 修正格式为标准https URL
-                domain_parts = parts[0].split("//")
-                if len(domain_parts) > 1:
-                    protocol = domain_parts[0] + "//"
-                    domain = domain_parts[1]
-                    url = protocol + domain + "/" + "/".join(parts[1:])
-                    # 移除URL中可能的端口指定
-                    url = url.replace(":github.com", "github.com")
+        # 处理快捷方式并修正URL格式
+        url = _normalize_git_url(url)
         
         # 选择目标路径
         target_path = QFileDialog.getExistingDirectory(
@@ -1769,9 +2122,9 @@ class GitPanel(QWidget):
             target_path = os.path.join(target_path, repo_name)
             
         # 如果目标路径已存在，确认是否覆盖
-        if os.path.exists(target_path) and os.listdir(target_path):
-            reply = QMessageBox.question(
-                self, "确认覆盖", 
+        if is_dir_nonempty(target_path):
+            reply = self._ask(
+                "确认覆盖", 
                 f"目录 {target_path} 已存在且不为空，是否继续？",
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No
@@ -1781,16 +2134,16 @@ class GitPanel(QWidget):
                 return
                 
         # 询问是否以递归方式克隆（包含子模块）
-        recursive = QMessageBox.question(
-            self, "克隆子模块", 
+        recursive = self._ask(
+            "克隆子模块", 
             "是否以递归方式克隆（包含子模块）？",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         ) == QMessageBox.Yes
         
         # 询问是否指定分支
-        branch_reply = QMessageBox.question(
-            self, "指定分支", 
+        branch_reply = self._ask(
+            "指定分支", 
             "是否要克隆特定分支？",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
@@ -1808,13 +2161,10 @@ class GitPanel(QWidget):
                 branch = None
         
         try:
-            # 使用异步方式克隆仓库
+            # 使用异步方式克隆仓库，加载状态会在克隆完成后自动隐藏
             self.cloneRepositoryAsync(url, target_path, branch, None, recursive)
-            
-            # 显示加载状态（加载状态会在操作完成后自动隐藏）
-            self.loadingMask.showLoading("正在克隆仓库", f"正在从 {url} 克隆仓库到 {target_path}...")
         except Exception as e:
-            QMessageBox.critical(self, "错误", f"克隆仓库失败: {str(e)}")
+            self._showError("错误", f"克隆仓库失败: {str(e)}")
 
     def syncWithRemote(self):
         """ 同步远程仓库 """
@@ -1822,64 +2172,42 @@ class GitPanel(QWidget):
             return
             
         # 确保存在远程仓库
-        if not self.ensureRemoteExists("同步"):
+        remotes = self.ensureRemoteExists("同步")
+        if not remotes:
             return
             
         # 获取当前分支
-        currentBranch = self.gitManager.getCurrentBranch()
-        
-        # 获取远程仓库列表
-        remotes = self.gitManager.getRemotes()
-        
-        remote_name = None
-        # 如果有多个远程仓库，让用户选择
-        if len(remotes) > 1:
-            remote_items = [remote for remote in remotes]
-            remote_name, ok = QInputDialog.getItem(
-                self, "选择远程仓库", 
-                "请选择要同步的远程仓库:",
-                remote_items, 0, False
-            )
-            
-            if not ok or not remote_name:
-                return
-        else:
-            remote_name = remotes[0]
+        currentBranch = self._currentBranch()
+        
+        # 选择远程仓库
+        remote_name = self._chooseRemote(remotes, "请选择要同步的远程仓库:")
+        if not remote_name:
+            return
             
         # 确认对话框
-        reply = QMessageBox.question(
-            self, "确认同步", 
+        if self._confirm(
+            'sync', "确认同步", 
             f"确定要与远程仓库 {remote_name} 同步 {currentBranch} 分支吗?\n" +
-            "这将执行 fetch+pull+push 操作。",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
+            "这将执行 fetch+pull+push 操作。"
+        ):
             # 使用Git线程执行同步操作
-            self.gitThread.setup(
-                operation='sync',
-                git_manager=self.gitManager,
-                remote_name=remote_name,
-                branch=currentBranch
-            )
-            self.gitThread.start()
+            self._runGitOperation('sync', remote_name=remote_name, branch=currentBranch)
 
     def ensureRemoteExists(self, operation_name="操作"):
         """ 确保远程仓库存在，如果不存在则提示用户添加 
         Args:
             operation_name: 操作名称，用于错误提示
         Returns:
-            bool: 是否存在远程仓库
+            list: 远程仓库名称列表，不存在远程仓库时返回None
         """
         if not self.gitManager:
-            return False
+            return None
             
         try:
-            remotes = self.gitManager.getRemotes()
+            remotes = self._getRemotesCached()
             if not remotes:
-                reply = QMessageBox.question(
-                    self, f"无法{operation_name}", 
+                reply = self._ask(
+                    f"无法{operation_name}", 
                     f"当前仓库没有配置远程仓库，无法{operation_name}。\n是否现在添加远程仓库?",
                     QMessageBox.Yes | QMessageBox.No,
                     QMessageBox.Yes
@@ -1887,11 +2215,67 @@ class GitPanel(QWidget):
                 
                 if reply == QMessageBox.Yes:
                     self.addRemote()
-                return False
-            return True
+                return None
+            return remotes
         except Exception:
-            return False
+            return None
+            
+    def _chooseRemote(self, remotes, prompt):
+        """ 选择要操作的远程仓库，只有一个远程仓库时直接使用
+        Args:
+            remotes: 远程仓库名称列表
+            prompt: 选择菜单顶部的提示文本
+        Returns:
+            str: 远程仓库名称，用户取消时返回None
+        """
+        if len(remotes) == 1:
+            return remotes[0]
+            
+        # 远程仓库很少变化，选择菜单只在列表变化时重建，每次只更新提示文本
+        remotes = tuple(remotes)
+        if remotes != self._remotePickerItems:
+            self._remotePickerMenu.clear()
+            self._remotePickerPrompt = self._remotePickerMenu.addAction(prompt)
+            self._remotePickerPrompt.setEnabled(False)
+            self._remotePickerMenu.addSeparator()
+            for name in remotes:
+                self._remotePickerMenu.addAction(name).setData(name)
+            self._remotePickerItems = remotes
+        else:
+            self._remotePickerPrompt.setText(prompt)
+            
+        action = self._remotePickerMenu.exec_(QCursor.pos())
+        if action is None or not action.data():
+            return None
+        return action.data()
 
+    def _runGitOperation(self, operation, on_finished=None, **params):
+        """ 在Git线程中执行操作，完成后由onGitOperationFinished统一提示和刷新
+        Args:
+            operation: 操作名称
+            on_finished: 可选的回调，参数与operationFinished信号相同，在Git线程退出后调用，
+                         因此回调中可以直接开始下一个操作
+            **params: 操作参数
+        Returns:
+            bool: 是否已启动
+        """
+        if self.gitThread.isRunning():
+            show_info_bar(self, 'warning', "请稍候", "上一个Git操作尚未完成")
+            return False
+            
+        self._operationCallback = on_finished
+        self._operationResult = None
+        self.gitThread.setup(operation=operation, git_manager=self.gitManager, **params)
+        self.gitThread.start()
+        return True
+        
+    def _onGitThreadFinished(self):
+        """ Git线程退出后调用当前操作的完成回调 """
+        callback, self._operationCallback = self._operationCallback, None
+        result, self._operationResult = self._operationResult, None
+        if callback is not None and result is not None:
+            callback(*result)
+        
     def onGitOperationStarted(self, operation):
         """Git操作开始时的回调
         
@@ -1906,25 +2290,36 @@ class GitPanel(QWidget):
             'commit': '正在提交更改',
             'sync': '正在同步仓库',
             'init': '正在初始化仓库',
-            'clone': '正在克隆仓库',
+            'import': '正在导入外部仓库',
+            'create_branch': '正在创建分支',
+            'merge_branch': '正在合并分支',
+            'delete_branch': '正在删除分支',
+            'add_remote': '正在设置远程仓库',
+            'remove_remote': '正在删除远程仓库',
+            'stash': '正在存储更改',
+            'apply_stash': '正在应用存储',
+            'drop_stash': '正在删除存储',
+            'clear_stash': '正在清空存储',
         }
         
         # 获取操作标题或使用默认文本
         title = operation_titles.get(operation, f'正在执行Git操作: {operation}')
         description = f"请稍候，正在处理中..."
         
+        # 操作超过200毫秒仍未完成时才显示加载遮罩
+        self._pendingMask = (title, description)
+        self._maskTimer.start()
+        
+    def _showPendingMask(self):
+        """ 显示延迟的加载遮罩 """
+        if not self._pendingMask:
+            return
+            
+        title, description = self._pendingMask
+        self._pendingMask = None
         try:
-            # 确保遮罩大小与父窗口一致
-            if self.loadingMask.parent():
-                self.loadingMask.resize(self.size())
-                self.loadingMask.move(0, 0)
-            
-            # 显示加载遮罩并保证是最顶层
-            self.loadingMask.showLoading(title, description)
-            self.loadingMask.setWindowFlags(self.loadingMask.windowFlags() | Qt.WindowStaysOnTopHint)
-            self.loadingMask.raise_()
-            self.loadingMask.activateWindow()
-            self.loadingMask.repaint()  # 强制重绘，确保立即显示
+            # 显示加载遮罩，showLoading负责调整大小并提升到顶层，仍有克隆在进行时保留取消按钮
+            self.loadingMask.showLoading(title, description, cancelable=bool(self._cloneRunnables))
         except Exception as e:
             # 记录异常但不中断操作
             error(f"显示加载遮罩时出错: {str(e)}")
@@ -1937,26 +2332,37 @@ class GitPanel(QWidget):
             operation: 操作类型
             message: 结果消息
         """
+        # 记录结果，供Git线程退出后调用操作的完成回调
+        self._operationResult = (success, operation, message)
+        
         try:
-            # 隐藏加载遮罩
-            self.loadingMask.hideLoading()
+            # 操作在遮罩显示前完成时不再显示；隐藏加载遮罩，仍有克隆在进行时保留
+            self._maskTimer.stop()
+            self._pendingMask = None
+            if not self._cloneRunnables:
+                self.loadingMask.hideLoading()
+            
+            # 导入和远程仓库操作可能改变了远程仓库，存储操作改变了存储列表
+            if operation in ('import', 'add_remote', 'remove_remote'):
+                self._invalidateRemotesCache()
+            elif operation in ('stash', 'apply_stash', 'drop_stash', 'clear_stash'):
+                self._stashCache = None
+            
+            # 改变引用的操作之后当前分支和分支列表需要重新读取
+            if operation in ('init', 'import', 'create_branch', 'merge_branch', 'delete_branch',
+                             'fetch', 'pull', 'sync'):
+                self._branchCache = None
+                self._branchesCache = None
             
             # 刷新状态
             self.refreshStatus()
             
             # 显示操作结果
+            name = self.OPERATION_NAMES.get(operation, operation)
             if success:
-                InfoBar.success(
-                    title=f"{operation}成功",
-                    content=message,
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=3000,
-                    parent=self
-                )
+                show_info_bar(self, 'success', f"{name}成功", message, 3000)
             else:
-                QMessageBox.critical(self, f"{operation}失败", message)
+                self._showError(f"{name}失败", message)
         except Exception as e:
             error(f"Git操作完成回调出错: {str(e)}")
             # 确保UI更新，即使有错误
@@ -1972,7 +2378,7 @@ class GitPanel(QWidget):
         self.loadingMask.updateProgress(progress, message)
 
     def cloneRepositoryAsync(self, url, target_path, branch=None, depth=None, recursive=False):
-        """异步克隆仓库
+        """异步克隆仓库，克隆在线程池中执行，不占用Git线程
         
         Args:
             url: 仓库URL
@@ -1981,45 +2387,47 @@ class GitPanel(QWidget):
             depth: 克隆深度
             recursive: 是否递归克隆子模块
         """
-        # 使用Git线程执行克隆操作，直接使用静态方法而不创建临时GitManager
-        from src.utils.git_manager import GitManager
-        
-        # 使用Git线程执行克隆操作
-        self.gitThread.setup(
-            operation='clone',
-            git_manager=None,  # 不使用临时GitManager
-            url=url,
-            target_path=target_path,
-            branch=branch,
-            depth=depth,
-            recursive=recursive
-        )
+        runnable = GitCloneRunnable(url, target_path, branch, depth, recursive)
         
-        # 定义克隆完成的回调
-        def on_clone_finished(success, op, msg):
-            if success:
-                # 克隆成功，打开新仓库
-                try:
-                    self.setRepository(target_path)
-                    
-                    # 发出信号通知其他组件
-                    self.repositoryOpened.emit(target_path)
-                except Exception as e:
-                    error(f"克隆成功但打开仓库失败: {str(e)}")
-                    QMessageBox.information(
-                        self, 
-                        "克隆成功", 
-                        f"仓库已克隆成功，但打开时出错: {str(e)}\n仓库路径: {target_path}"
-                    )
-            
-            # 移除临时连接
-            self.gitThread.operationFinished.disconnect(on_clone_finished)
-        
-        # 临时连接，只处理一次克隆完成的回调
-        self.gitThread.operationFinished.connect(on_clone_finished)
+        def on_clone_finished(success, path, msg):
+            self._cloneRunnables.discard(runnable)
+            if not self._cloneRunnables and not self.gitThread.isRunning():
+                self.loadingMask.hideLoading()
+                
+            if not success:
+                self._showError("克隆仓库失败", msg)
+                return
+                
+            show_info_bar(self, 'success', "克隆仓库成功", msg, 3000)
+            try:
+                # 使用工作线程中已打开的仓库
+                self.setRepository(path, runnable.result_data)
+                
+                # 发出信号通知其他组件
+                self.repositoryOpened.emit(path)
+            except Exception as e:
+                error(f"克隆成功但打开仓库失败: {str(e)}")
+                QMessageBox.information(
+                    self, 
+                    "克隆成功", 
+                    f"仓库已克隆成功，但打开时出错: {str(e)}\n仓库路径: {path}"
+                )
         
-        # 开始克隆
-        self.gitThread.start()
+        runnable.signals.progress.connect(self.onGitProgressUpdate)
+        runnable.signals.finished.connect(on_clone_finished)
+        
+        # 持有任务引用直到完成，取消时也通过它终止git进程
+        self._cloneRunnables.add(runnable)
+        self._maskTimer.stop()
+        self._pendingMask = None
+        self.loadingMask.showLoading("正在克隆仓库", f"正在从 {url} 克隆仓库到 {target_path}...",
+                                     cancelable=True)
+        QThreadPool.globalInstance().start(runnable)
+        
+    def cancelClones(self):
+        """ 取消所有进行中的克隆 """
+        for runnable in self._cloneRunnables:
+            runnable.cancel()
 
     def resizeEvent(self, event):
         """窗口大小改变事件，确保遮罩能够覆盖整个窗口"""
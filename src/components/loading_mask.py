@@ -1,23 +1,45 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QGraphicsOpacityEffect, QProgressBar, QFrame
-from PyQt5.QtCore import Qt, QSize, QTimer
+from PyQt5.QtWidgets import (QWidget, QLabel, QVBoxLayout, QGraphicsOpacityEffect, QProgressBar, QFrame,
+                           QPushButton)
+from PyQt5.QtCore import Qt, QSize, QTimer, pyqtSignal
 from PyQt5.QtGui import QColor, QPainter, QFont
 from qfluentwidgets import SmoothScrollArea, isDarkTheme, FluentIcon, InfoBar, InfoBarPosition, SpinBox, ProgressRing
 
+# 提示面板的浅色和深色样式，样式表内容固定，只在主题变化时重新设置
+_TIP_PANEL_QSS = """
+    QFrame#loadingTipPanel {
+        background-color: rgba(255, 255, 255, 0.9);
+        border-radius: 10px;
+        border: 1px solid rgba(200, 200, 200, 0.5);
+    }
+"""
+_TIP_PANEL_DARK_QSS = """
+    QFrame#loadingTipPanel {
+        background-color: rgba(43, 43, 43, 0.9);
+        border-radius: 10px;
+        border: 1px solid rgba(80, 80, 80, 0.5);
+    }
+    QFrame#loadingTipPanel QLabel {
+        color: white;
+    }
+"""
 class LoadingMask(QWidget):
     """加载遮罩组件，用于在Git操作时虚化UI并显示提示"""
     
+    # 点击取消按钮时发出
+    cancelRequested = pyqtSignal()
+    
     def __init__(self, parent=None):
         super(LoadingMask, self).__init__(parent)
         
-        # 设置无边框、透明背景的窗口
-        self.setWindowFlags(Qt.FramelessWindowHint)
+        # 设置无边框、透明背景并保持在最高层级的窗口，标志只在构造时设置一次
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
         
-        # 设置最高层级，确保显示在所有元素之上
-        self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
+        # 半透明背景色，黑色，透明度120/255
+        self._bgColor = QColor(0, 0, 0, 120)
         
         # 初始化UI
         self.initUI()
@@ -38,13 +60,8 @@ class LoadingMask(QWidget):
         self.tipPanel.setFixedSize(300, 150)  # 减小提示框尺寸
         
         # 设置样式
-        self.tipPanel.setStyleSheet("""
-            QFrame#loadingTipPanel {
-                background-color: rgba(255, 255, 255, 0.9);
-                border-radius: 10px;
-                border: 1px solid rgba(200, 200, 200, 0.5);
-            }
-        """)
+        self._tipPanelQss = None
+        self.updateTipPanelStyle()
         
         # 提示面板布局
         tipLayout = QVBoxLayout(self.tipPanel)
@@ -79,29 +96,53 @@ class LoadingMask(QWidget):
         self.progressBar.hide()  # 默认隐藏进度条
         tipLayout.addWidget(self.progressBar)
         
+        # 添加取消按钮，只在可取消的操作中显示
+        self.cancelButton = QPushButton("取消", self)
+        self.cancelButton.clicked.connect(self.onCancelClicked)
+        self.cancelButton.hide()
+        tipLayout.addWidget(self.cancelButton, 0, Qt.AlignCenter)
+        
         # 将提示面板添加到主布局
         layout.addWidget(self.tipPanel, 0, Qt.AlignCenter)
         
     def paintEvent(self, event):
         """绘制背景遮罩"""
+        # 只填充需要重绘的区域，进度环动画等局部更新时不必重新混合整个遮罩；
+        # 填充纯色矩形不需要抗锯齿
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(event.rect(), self._bgColor)
         
-        # 设置半透明背景
-        bg_color = QColor(0, 0, 0, 120)  # 黑色，透明度120/255
-        painter.fillRect(self.rect(), bg_color)
+    def updateTipPanelStyle(self):
+        """按当前主题设置提示面板样式，样式未变化时不重新设置，避免Qt重复解析样式表"""
+        qss = _TIP_PANEL_DARK_QSS if isDarkTheme() else _TIP_PANEL_QSS
+        if qss is not self._tipPanelQss:
+            self._tipPanelQss = qss
+            self.tipPanel.setStyleSheet(qss)
         
-    def showLoading(self, title, description=""):
+    def showLoading(self, title, description="", cancelable=False):
         """显示加载状态
         
         Args:
             title: 操作标题
             description: 操作描述
+            cancelable: 是否显示取消按钮
         """
+        # 主题可能在上次显示后切换过
+        self.updateTipPanelStyle()
+        
         # 更新标题和描述
         self.titleLabel.setText(title)
         self.descLabel.setText(description)
         
+        # 进度条在收到进度后才显示，不保留上一次操作的进度
+        self.progressBar.hide()
+        self.progressBar.setValue(0)
+        
+        # 显示取消按钮时加高提示面板
+        self.cancelButton.setEnabled(True)
+        self.cancelButton.setVisible(cancelable)
+        self.tipPanel.setFixedHeight(190 if cancelable else 150)
+        
         # 调整大小和位置
         if self.parent():
             self.resize(self.parent().size())
@@ -118,8 +159,17 @@ class LoadingMask(QWidget):
         # 启动进度环动画，使用正确的API
         self.progressRing.resume()
         
+    def onCancelClicked(self):
+        """取消按钮点击事件，只发出一次取消请求"""
+        self.cancelButton.setEnabled(False)
+        self.descLabel.setText("正在取消...")
+        self.cancelRequested.emit()
+        
     def hideLoading(self):
         """隐藏加载状态"""
+        if not self.isVisible():
+            return
+            
         # 停止进度环动画，使用正确的API
         self.progressRing.pause()
         self.hide()
@@ -131,11 +181,14 @@ class LoadingMask(QWidget):
             value: 进度值（0-100）
             desc: 新的描述文本（可选）
         """
+        # git的进度输出中很多行的百分比和描述相同，未变化时不更新，避免多余的重绘
         if value >= 0:
-            self.progressBar.show()
-            self.progressBar.setValue(value)
+            if value != self.progressBar.value():
+                self.progressBar.setValue(value)
+            if self.progressBar.isHidden():
+                self.progressBar.show()
             
-        if desc:
+        if desc and desc != self.descLabel.text():
             self.descLabel.setText(desc)
             
     def resizeEvent(self, event):
@@ -2,24 +2,57 @@
 # -*- coding: utf-8 -*-
 
 import os
+import re
 import time
+from datetime import date, timedelta
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
-                           QLabel, QTextEdit, QFileDialog, QMessageBox,
+                           QLabel, QPlainTextEdit, QFileDialog, QMessageBox,
                            QTabWidget, QWidget, QListWidget, QListWidgetItem,
-                           QFormLayout, QComboBox, QGroupBox, QSplitter)
-from PyQt5.QtCore import Qt, pyqtSignal, QDateTime, QDate, QTime
+                           QFormLayout, QComboBox, QGroupBox, QSplitter, QApplication)
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QThread
 from PyQt5.QtGui import QIcon, QTextCursor
 from qfluentwidgets import (PrimaryPushButton, InfoBar, InfoBarPosition, 
-                          FluentIcon, ComboBox, ToolTipFilter)
+                          FluentIcon, ComboBox, ToolTipFilter, LineEdit)
 
 from src.utils.logger import (get_log_file_path, get_log_dir, export_log, 
                             get_all_log_files, get_recent_logs, info, show_error_message)
 
+# 日志行开头的时间戳，格式为 "YYYY-MM-DD HH:MM:SS"
+_TIMESTAMP_PATTERN = r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}"
+
+class LogLoadThread(QThread):
+    """日志读取线程类，在后台读取日志文件末尾的内容，避免大日志文件阻塞对话框"""
+    
+    # 定义信号
+    loaded = pyqtSignal(str)  # 读取完成信号，参数为日志内容
+    failed = pyqtSignal(str)  # 读取失败信号，参数为错误信息
+    
+    def __init__(self, lines, parent=None):
+        """初始化日志读取线程
+        
+        Args:
+            lines: 要读取的行数
+            parent: 父对象
+        """
+        super(LogLoadThread, self).__init__(parent)
+        self.lines = lines
+        
+    def run(self):
+        """读取日志的线程主函数"""
+        try:
+            self.loaded.emit(get_recent_logs(self.lines))
+        except Exception as e:
+            self.failed.emit(str(e))
+
 class LogDialog(QDialog):
     """日志查看和导出对话框"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        
+        # 日志读取线程，每次刷新时重新启动
+        self._loadThread = self._createLoadThread()
+        
         self.initUI()
         
     def initUI(self):
@@ -43,9 +76,11 @@ class LogDialog(QDialog):
         mainLayout.addLayout(infoLayout)
         
         # 日志内容区域
-        self.logTextEdit = QTextEdit()
+        # 纯文本日志使用按文本块布局的QPlainTextEdit，并限制最大行数
+        self.logTextEdit = QPlainTextEdit()
         self.logTextEdit.setReadOnly(True)
-        self.logTextEdit.setLineWrapMode(QTextEdit.NoWrap)  # 禁用自动换行
+        self.logTextEdit.setLineWrapMode(QPlainTextEdit.NoWrap)  # 禁用自动换行
+        self.logTextEdit.setMaximumBlockCount(5000)
         mainLayout.addWidget(self.logTextEdit)
         
         # 筛选区域
@@ -60,11 +95,16 @@ class LogDialog(QDialog):
         
         # 关键词过滤
         filterLayout.addWidget(QLabel("关键词:"))
-        self.keywordEdit = QTextEdit()
-        self.keywordEdit.setMaximumHeight(28)
-        self.keywordEdit.textChanged.connect(self.applyFilter)
+        self.keywordEdit = LineEdit()
+        self.keywordEdit.textChanged.connect(self.onKeywordChanged)
         filterLayout.addWidget(self.keywordEdit)
         
+        # 关键词输入停顿后再筛选，连续输入或粘贴只筛选一次
+        self._filterTimer = QTimer(self)
+        self._filterTimer.setSingleShot(True)
+        self._filterTimer.setInterval(150)
+        self._filterTimer.timeout.connect(self.applyFilter)
+        
         # 日期范围过滤
         filterLayout.addWidget(QLabel("日期:"))
         self.dateCombo = ComboBox()
@@ -97,28 +137,71 @@ class LogDialog(QDialog):
         self.refreshLogContent()
         
     def refreshLogContent(self):
-        """刷新日志内容"""
-        self.logTextEdit.clear()
+        """刷新日志内容，日志在后台线程中读取，读取完成后由onLogLoaded显示"""
+        if self._loadThread.isRunning():
+            return
+            
+        self.refreshButton.setEnabled(False)
+        self.logTextEdit.setPlainText("正在加载日志...")
+        self._loadThread.start()
         
+    def _createLoadThread(self):
+        """创建日志读取线程"""
+        thread = LogLoadThread(1000, self)  # 获取最近1000行
+        thread.loaded.connect(self.onLogLoaded)
+        thread.failed.connect(self.onLogLoadFailed)
+        return thread
+        
+    def done(self, result):
+        """关闭对话框时断开仍在读取的线程，线程转交给应用程序，读取结束后自行删除"""
+        thread = self._loadThread
+        if thread.isRunning():
+            thread.loaded.disconnect(self.onLogLoaded)
+            thread.failed.disconnect(self.onLogLoadFailed)
+            # 不在界面线程等待读取结束，也避免对话框销毁时线程仍在运行
+            thread.setParent(QApplication.instance())
+            thread.finished.connect(thread.deleteLater)
+            if thread.isFinished():
+                thread.deleteLater()
+            self._loadThread = self._createLoadThread()
+        super().done(result)
+        
+    def onLogLoaded(self, log_content):
+        """日志读取完成的回调
+        
+        Args:
+            log_content: 日志内容
+        """
+        self.refreshButton.setEnabled(True)
         try:
-            # 获取最近日志内容
-            log_content = get_recent_logs(1000)  # 获取最近1000行
-            self.logTextEdit.setPlainText(log_content)
+            # 记录原始内容用于筛选，筛选时整个文本只用一个正则扫描，不再逐行处理
+            self.original_content = log_content
+            self._lastFilterKey = None
+            
+            # 应用当前筛选，没有筛选条件时直接显示原始内容，只设置一次文本
+            self.applyFilter()
             
             # 滚动到底部
             cursor = self.logTextEdit.textCursor()
             cursor.movePosition(QTextCursor.End)
             self.logTextEdit.setTextCursor(cursor)
             
-            # 记录原始内容用于筛选
-            self.original_content = log_content
-            
-            # 应用当前筛选
-            self.applyFilter()
-            
         except Exception as e:
-            self.logTextEdit.setPlainText(f"读取日志失败: {str(e)}")
+            self.onLogLoadFailed(str(e))
+            
+    def onLogLoadFailed(self, message):
+        """日志读取失败的回调
+        
+        Args:
+            message: 错误信息
+        """
+        self.refreshButton.setEnabled(True)
+        self.logTextEdit.setPlainText(f"读取日志失败: {message}")
             
+    def onKeywordChanged(self, text):
+        """关键词变化时延迟筛选"""
+        self._filterTimer.start()
+        
     def applyFilter(self):
         """应用筛选条件"""
         if not hasattr(self, 'original_content'):
@@ -126,54 +209,43 @@ class LogDialog(QDialog):
             
         # 获取筛选条件
         level = self.levelCombo.currentText()
-        keyword = self.keywordEdit.toPlainText().strip()
+        keyword = self.keywordEdit.text().strip()
         date_range = self.dateCombo.currentText()
         
+        # 筛选条件与上次相同时不再重新筛选，日期范围相对今天计算，因此日期也是条件的一部分
+        today = date.today()
+        filter_key = (level, keyword, date_range, today)
+        if filter_key == self._lastFilterKey:
+            return
+        self._lastFilterKey = filter_key
+        
         # 如果所有筛选都是默认值，则显示原始内容
         if level == "全部" and not keyword and date_range == "全部时间":
             self.logTextEdit.setPlainText(self.original_content)
             return
             
-        # 分行处理
-        filtered_lines = []
-        for line in self.original_content.split('\n'):
-            # 跳过空行
-            if not line.strip():
-                continue
-                
-            # 级别筛选
-            if level != "全部" and level not in line:
-                continue
-                
-            # 关键词筛选
-            if keyword and keyword not in line:
-                continue
-                
-            # 日期筛选
-            if date_range != "全部时间":
-                try:
-                    # 提取日期部分 (假设格式为 "YYYY-MM-DD HH:MM:SS")
-                    date_str = line.split(' - ')[0].strip()
-                    log_date = QDateTime.fromString(date_str, "yyyy-MM-dd HH:mm:ss").date()
-                    today = QDate.currentDate()
-                    
-                    if date_range == "今天" and log_date != today:
-                        continue
-                    elif date_range == "昨天" and log_date != today.addDays(-1):
-                        continue
-                    elif date_range == "最近三天" and log_date < today.addDays(-3):
-                        continue
-                    elif date_range == "最近一周" and log_date < today.addDays(-7):
-                        continue
-                except:
-                    # 如果日期解析失败，保留该行
-                    pass
-                    
-            # 通过所有筛选，添加该行
-            filtered_lines.append(line)
+        # 级别、关键词和日期合并为一个正则，每个条件是一个行内前瞻，逐行匹配交给正则引擎
+        conditions = ["(?=[^\\n]*\\S)"]  # 跳过空行
+        if level != "全部":
+            conditions.append(f"(?=[^\\n]*{re.escape(level)})")
+        if keyword:
+            conditions.append(f"(?=[^\\n]*{re.escape(keyword)})")
+            
+        # 日期范围展开为行首的日期前缀，不是以时间戳开头的行保留
+        start, end = {
+            "今天": (today, today),
+            "昨天": (today - timedelta(days=1), today - timedelta(days=1)),
+            "最近三天": (today - timedelta(days=3), today),
+            "最近一周": (today - timedelta(days=7), today),
+        }.get(date_range, (None, None))
+        if start is not None:
+            days = '|'.join((start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1))
+            conditions.append(f"(?=(?:{days}) |(?!{_TIMESTAMP_PATTERN}))")
             
+        pattern = re.compile('^' + ''.join(conditions) + '[^\\n]*', re.MULTILINE)
+        
         # 更新显示
-        self.logTextEdit.setPlainText('\n'.join(filtered_lines))
+        self.logTextEdit.setPlainText('\n'.join(m.group(0) for m in pattern.finditer(self.original_content)))
         
     def clearFilter(self):
         """清除所有筛选条件"""
@@ -181,9 +253,9 @@ class LogDialog(QDialog):
         self.keywordEdit.clear()
         self.dateCombo.setCurrentText("全部时间")
         
-        # 显示原始内容
-        if hasattr(self, 'original_content'):
-            self.logTextEdit.setPlainText(self.original_content)
+        # 立即显示原始内容，不必等待关键词的延迟筛选
+        self._filterTimer.stop()
+        self.applyFilter()
         
     def exportLog(self):
         """导出日志文件"""
@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from itertools import islice
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QListView,
+                           QPushButton)
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QSortFilterProxyModel
+from qfluentwidgets import LineEdit, PrimaryPushButton
+
+class LazyListModel(QAbstractListModel):
+    """ 从迭代器按批读取选项的列表模型，视图滚动到底部时才读取下一批 """
+
+    BATCH_SIZE = 200
+
+    def __init__(self, items, parent=None):
+        """ 初始化模型
+        Args:
+            items: 选项字符串的可迭代对象，可以是生成器
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._iterator = iter(items)
+        self._items = []
+        self._exhausted = False
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return self._items[index.row()]
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+
+        batch = list(islice(self._iterator, self.BATCH_SIZE))
+        if len(batch) < self.BATCH_SIZE:
+            self._exhausted = True
+        if not batch:
+            return
+
+        start = len(self._items)
+        self.beginInsertRows(QModelIndex(), start, start + len(batch) - 1)
+        self._items.extend(batch)
+        self.endInsertRows()
+
+class PickerFilterModel(QSortFilterProxyModel):
+    """ 选择对话框的过滤模型，在搜索过滤之外还可以排除一个固定的选项 """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._excluded = None
+
+    def setExcluded(self, text):
+        """ 设置要排除的选项
+        Args:
+            text: 选项文本，为None时不排除
+        """
+        self._excluded = text
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, sourceRow, sourceParent):
+        if self._excluded is not None:
+            index = self.sourceModel().index(sourceRow, 0, sourceParent)
+            if index.data(Qt.DisplayRole) == self._excluded:
+                return False
+        return super().filterAcceptsRow(sourceRow, sourceParent)
+
+class ItemPickerDialog(QDialog):
+    """ 可搜索的选项选择对话框，选项按需加载，适用于分支、远程仓库和存储等可能很长的列表 """
+
+    def __init__(self, parent, title, prompt, provider):
+        """ 初始化对话框
+        Args:
+            parent: 父窗口
+            title: 对话框标题
+            prompt: 列表上方的提示文本
+            provider: 无参可调用对象，返回选项字符串的可迭代对象，在对话框打开时才调用；
+                      为None时先显示加载提示，选项稍后通过setItems填充
+        """
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.resize(500, 400)
+
+        layout = QVBoxLayout(self)
+
+        if prompt:
+            layout.addWidget(QLabel(prompt))
+
+        # 搜索框
+        self.searchEdit = LineEdit(self)
+        self.searchEdit.setPlaceholderText("搜索...")
+        self.searchEdit.setClearButtonEnabled(True)
+        layout.addWidget(self.searchEdit)
+
+        # 加载中或没有选项时的提示
+        self.placeholderLabel = QLabel("正在加载...", self)
+        self.placeholderLabel.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.placeholderLabel)
+
+        # 列表视图，过滤由代理模型完成，未加载的选项在滚动到底部时才读取
+        self.model = LazyListModel((), self)
+        self.proxyModel = PickerFilterModel(self)
+        self.proxyModel.setSourceModel(self.model)
+        self.proxyModel.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+        self.listView = QListView(self)
+        self.listView.setModel(self.proxyModel)
+        self.listView.setEditTriggers(QListView.NoEditTriggers)
+        self.listView.setUniformItemSizes(True)
+        self.listView.doubleClicked.connect(self.accept)
+        layout.addWidget(self.listView)
+
+        # 按钮
+        btnLayout = QHBoxLayout()
+        btnLayout.addStretch(1)
+        okBtn = PrimaryPushButton("确定")
+        cancelBtn = QPushButton("取消")
+        okBtn.clicked.connect(self.accept)
+        cancelBtn.clicked.connect(self.reject)
+        btnLayout.addWidget(okBtn)
+        btnLayout.addWidget(cancelBtn)
+        layout.addLayout(btnLayout)
+
+        self.searchEdit.textChanged.connect(self.onSearchTextChanged)
+        self.searchEdit.returnPressed.connect(self.accept)
+
+        if provider is not None:
+            self.setItems(provider())
+        self.searchEdit.setFocus()
+
+    def setItems(self, items):
+        """ 设置选项，保留当前的搜索文本
+        Args:
+            items: 选项字符串的可迭代对象，可以是生成器
+        """
+        model = LazyListModel(items, self)
+        model.fetchMore()
+        self.setSourceModel(model)
+
+    def setSourceModel(self, model, excluded=None):
+        """ 直接使用已有的列表模型作为选项，模型由调用方持有，可在多次打开对话框时复用
+        Args:
+            model: 列表模型
+            excluded: 不显示的选项文本
+        """
+        oldModel = self.model
+        self.model = model
+        self.proxyModel.setExcluded(excluded)
+        self.proxyModel.setSourceModel(model)
+        if oldModel.parent() is self:
+            oldModel.deleteLater()
+
+        if self.proxyModel.rowCount() == 0 and not self.model.canFetchMore():
+            self.placeholderLabel.setText("没有可选的项")
+            self.placeholderLabel.show()
+            return
+
+        self.placeholderLabel.hide()
+        self.onSearchTextChanged(self.searchEdit.text())
+
+    def setLoadFailed(self, message):
+        """ 显示选项加载失败的提示
+        Args:
+            message: 错误信息
+        """
+        self.placeholderLabel.setText(f"加载失败: {message}")
+        self.placeholderLabel.show()
+
+    def onSearchTextChanged(self, text):
+        """ 按搜索文本过滤选项 """
+        self.proxyModel.setFilterFixedString(text)
+
+        # 已加载的选项中没有匹配项时继续读取，直到找到匹配项或选项读完
+        while self.proxyModel.rowCount() == 0 and self.model.canFetchMore():
+            self.model.fetchMore()
+
+        self._selectFirst()
+
+    def _selectFirst(self):
+        """ 当前没有选中项时选中第一项 """
+        if not self.listView.currentIndex().isValid() and self.proxyModel.rowCount() > 0:
+            self.listView.setCurrentIndex(self.proxyModel.index(0, 0))
+
+    def selectedText(self):
+        """ 获取选中的选项
+        Returns:
+            str: 选中的选项文本，没有选中项时返回空字符串
+        """
+        index = self.listView.currentIndex()
+        if not index.isValid():
+            return ""
+        return index.data(Qt.DisplayRole)
+
+    @classmethod
+    def getItem(cls, parent, title, prompt, provider):
+        """ 显示对话框并返回选择结果
+        Args:
+            parent: 父窗口
+            title: 对话框标题
+            prompt: 提示文本
+            provider: 无参可调用对象，返回选项字符串的可迭代对象
+        Returns:
+            tuple: (选中的文本, 是否确认)，与QInputDialog.getItem一致
+        """
+        dialog = cls(parent, title, prompt, provider)
+        if dialog.exec_() != QDialog.Accepted:
+            return "", False
+
+        text = dialog.selectedText()
+        return text, bool(text)
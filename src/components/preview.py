@@ -3,17 +3,276 @@
 
 import sys
 import os
+import json
+import functools
 import markdown
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QScrollArea
-from PyQt5.QtCore import Qt, QUrl
-from PyQt5.QtWebEngineWidgets import QWebEngineView
+from PyQt5.QtCore import Qt, QUrl, QTimer
+from PyQt5.QtGui import QDesktopServices
+from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage
 from qfluentwidgets import Theme, isDarkTheme
 
+# 预览基础样式
+_BASE_CSS = """
+.markdown-body {
+    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
+    font-size: 16px;
+    line-height: 1.5;
+    word-wrap: break-word;
+    padding: 16px;
+}
+
+.markdown-body a:hover {
+    text-decoration: underline;
+}
+
+.markdown-body h1, .markdown-body h2 {
+    padding-bottom: 0.3em;
+}
+
+.markdown-body h1 {
+    font-size: 2em;
+}
+
+.markdown-body h2 {
+    font-size: 1.5em;
+}
+
+.markdown-body h3 {
+    font-size: 1.25em;
+}
+
+.markdown-body h4 {
+    font-size: 1em;
+}
+
+.markdown-body pre {
+    padding: 16px;
+    overflow: auto;
+    line-height: 1.45;
+    border-radius: 3px;
+}
+
+.markdown-body code {
+    padding: 0.2em 0.4em;
+    margin: 0;
+    font-size: 85%;
+    border-radius: 3px;
+    font-family: "SFMono-Regular", Consolas, "Liberation Mono", Menlo, monospace;
+}
+
+.markdown-body pre > code {
+    padding: 0;
+    margin: 0;
+    font-size: 100%;
+    word-break: normal;
+    white-space: pre;
+    background: transparent;
+    border: 0;
+}
+
+.markdown-body blockquote {
+    padding: 0 1em;
+    margin: 0 0 16px 0;
+}
+
+.markdown-body table {
+    display: block;
+    width: 100%;
+    overflow: auto;
+    border-spacing: 0;
+    border-collapse: collapse;
+}
+
+.markdown-body table th {
+    font-weight: 600;
+}
+
+.markdown-body table th, .markdown-body table td {
+    padding: 6px 13px;
+}
+
+.markdown-body table tr {
+    border-top: 1px solid;
+}
+
+.markdown-body img {
+    max-width: 100%;
+    box-sizing: content-box;
+}
+
+.markdown-body ul, .markdown-body ol {
+    padding-left: 2em;
+}
+
+.markdown-body li+li {
+    margin-top: 0.25em;
+}
+"""
+
+# 亮色主题样式
+_LIGHT_THEME_CSS = """
+.markdown-body {
+    color: #24292e;
+    background-color: #ffffff;
+}
+
+.markdown-body a {
+    color: #0366d6;
+    text-decoration: none;
+}
+
+.markdown-body h1, .markdown-body h2 {
+    border-bottom: 1px solid #eaecef;
+}
+
+.markdown-body pre {
+    background-color: #f6f8fa;
+}
+
+.markdown-body code {
+    background-color: rgba(27,31,35,0.05);
+    color: #24292e;
+}
+
+.markdown-body blockquote {
+    color: #6a737d;
+    border-left: 0.25em solid #dfe2e5;
+}
+
+.markdown-body table th, .markdown-body table td {
+    border: 1px solid #dfe2e5;
+}
+
+.markdown-body table tr {
+    background-color: #fff;
+}
+
+.markdown-body table tr:nth-child(2n) {
+    background-color: #f6f8fa;
+}
+
+.markdown-body img {
+    background-color: #fff;
+}
+"""
+
+# 深色主题样式
+_DARK_THEME_CSS = """
+.markdown-body {
+    color: #c9d1d9;
+    background-color: #0d1117;
+}
+
+.markdown-body a {
+    color: #58a6ff;
+    text-decoration: none;
+}
+
+.markdown-body h1, .markdown-body h2 {
+    border-bottom: 1px solid #21262d;
+}
+
+.markdown-body pre {
+    background-color: #161b22;
+}
+
+.markdown-body code {
+    background-color: rgba(240,246,252,0.15);
+    color: #e6edf3;
+}
+
+.markdown-body blockquote {
+    color: #8b949e;
+    border-left: 0.25em solid #30363d;
+}
+
+.markdown-body table th, .markdown-body table td {
+    border: 1px solid #30363d;
+}
+
+.markdown-body table tr {
+    background-color: #0d1117;
+}
+
+.markdown-body table tr:nth-child(2n) {
+    background-color: #161b22;
+}
+
+.markdown-body img {
+    background-color: #0d1117;
+}
+"""
+
+# 完整样式只在导入时拼接一次
+_LIGHT_CSS = _BASE_CSS + _LIGHT_THEME_CSS
+_DARK_CSS = _BASE_CSS + _DARK_THEME_CSS
+
+# Markdown转换器只在导入时创建一次，每次转换前reset即可复用已注册的扩展
+_MD = markdown.Markdown(extensions=[
+    'markdown.extensions.tables',
+    'markdown.extensions.fenced_code',
+    'markdown.extensions.codehilite',
+    'markdown.extensions.toc',
+    'markdown.extensions.attr_list',
+    'markdown.extensions.def_list',
+    'markdown.extensions.abbr',
+    'markdown.extensions.footnotes',
+    'markdown.extensions.md_in_html'
+])
+
+@functools.lru_cache(maxsize=32)
+def _render_cached(text):
+    """ 将Markdown文本转换为HTML，最近的转换结果在所有预览实例间共享
+    Args:
+        text: Markdown文本
+    Returns:
+        str: 正文HTML
+    """
+    # reset清除上一篇文档的脚注、缩写等状态
+    return _MD.reset().convert(text)
+
+# 预览外壳文档，只在首次显示或主题变化时加载，正文通过脚本替换
+_SHELL_HTML = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>%s</style>
+</head>
+<body>
+    <div class="markdown-body" id="md"></div>
+</body>
+</html>
+"""
+
+# 替换正文并保持滚动位置的脚本，%s为JSON编码的HTML
+_UPDATE_JS = """(function() {
+    var y = window.scrollY;
+    document.getElementById('md').innerHTML = %s;
+    window.scrollTo(0, y);
+})();"""
+
+class _PreviewPage(QWebEnginePage):
+    """ 预览页面，点击的链接用系统浏览器打开，预览始终停留在外壳文档 """
+    
+    def acceptNavigationRequest(self, url, navigationType, isMainFrame):
+        # 页内锚点（如目录）仍在预览中跳转
+        if (navigationType == QWebEnginePage.NavigationTypeLinkClicked
+                and not url.matches(self.url(), QUrl.RemoveFragment)):
+            QDesktopServices.openUrl(url)
+            return False
+        return super().acceptNavigationRequest(url, navigationType, isMainFrame)
+        
 class MarkdownPreview(QWidget):
     """ Markdown预览组件 """
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._shellStyle = None    # 当前外壳文档使用的样式
+        self._pageReady = False    # 外壳文档是否加载完成
+        self._pendingHtml = None   # 外壳文档加载完成前待显示的正文
+        self._pendingText = ""     # 等待渲染的Markdown文本
+        self._lastText = None      # 上一次渲染的Markdown文本
         self.initUI()
         
     def initUI(self):
@@ -24,7 +283,15 @@ class MarkdownPreview(QWidget):
         
         # 创建预览视图
         self.webView = QWebEngineView()
+        self.webView.setPage(_PreviewPage(self.webView))
         self.webView.setContextMenuPolicy(Qt.NoContextMenu)  # 禁用右键菜单
+        self.webView.loadFinished.connect(self.onShellLoaded)
+        
+        # 连续输入时合并为停顿后的一次渲染
+        self._renderTimer = QTimer(self)
+        self._renderTimer.setSingleShot(True)
+        self._renderTimer.setInterval(120)
+        self._renderTimer.timeout.connect(self._doRender)
         
         # 设置初始内容
         self.setMarkdown("")
@@ -33,248 +300,66 @@ class MarkdownPreview(QWidget):
         layout.addWidget(self.webView)
         
     def setMarkdown(self, text):
-        """ 设置Markdown内容并渲染 """
-        # 转换Markdown为HTML
-        html_content = self.convertMarkdownToHtml(text)
-        
-        # 获取样式
-        style = self.getPreviewStyle()
-        
-        # 组合完整的HTML文档
-        full_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <style>
-                {style}
-            </style>
-        </head>
-        <body>
-            <div class="markdown-body">
-                {html_content}
-            </div>
-        </body>
-        </html>
-        """
-        
-        # 显示HTML
-        self.webView.setHtml(full_html)
-        
-    def convertMarkdownToHtml(self, text):
-        """ 将Markdown文本转换为HTML """
-        # 定义Markdown扩展
-        extensions = [
-            'markdown.extensions.tables',
-            'markdown.extensions.fenced_code',
-            'markdown.extensions.codehilite',
-            'markdown.extensions.toc',
-            'markdown.extensions.attr_list',
-            'markdown.extensions.def_list',
-            'markdown.extensions.abbr',
-            'markdown.extensions.footnotes',
-            'markdown.extensions.md_in_html'
-        ]
-        
-        # 转换并返回
-        html = markdown.markdown(text, extensions=extensions)
-        return html
-        
-    def getPreviewStyle(self):
-        """ 获取预览样式 """
-        # 检查当前主题
-        is_dark = isDarkTheme()
-        
-        # 基础样式
-        base_style = """
-        .markdown-body {
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
-            font-size: 16px;
-            line-height: 1.5;
-            word-wrap: break-word;
-            padding: 16px;
-        }
-        
-        .markdown-body a:hover {
-            text-decoration: underline;
-        }
-        
-        .markdown-body h1, .markdown-body h2 {
-            padding-bottom: 0.3em;
-        }
-        
-        .markdown-body h1 {
-            font-size: 2em;
-        }
-        
-        .markdown-body h2 {
-            font-size: 1.5em;
-        }
-        
-        .markdown-body h3 {
-            font-size: 1.25em;
-        }
-        
-        .markdown-body h4 {
-            font-size: 1em;
-        }
-        
-        .markdown-body pre {
-            padding: 16px;
-            overflow: auto;
-            line-height: 1.45;
-            border-radius: 3px;
-        }
-        
-        .markdown-body code {
-            padding: 0.2em 0.4em;
-            margin: 0;
-            font-size: 85%;
-            border-radius: 3px;
-            font-family: "SFMono-Regular", Consolas, "Liberation Mono", Menlo, monospace;
-        }
-        
-        .markdown-body pre > code {
-            padding: 0;
-            margin: 0;
-            font-size: 100%;
-            word-break: normal;
-            white-space: pre;
-            background: transparent;
-            border: 0;
-        }
-        
-        .markdown-body blockquote {
-            padding: 0 1em;
-            margin: 0 0 16px 0;
-        }
-        
-        .markdown-body table {
-            display: block;
-            width: 100%;
-            overflow: auto;
-            border-spacing: 0;
-            border-collapse: collapse;
-        }
-        
-        .markdown-body table th {
-            font-weight: 600;
-        }
-        
-        .markdown-body table th, .markdown-body table td {
-            padding: 6px 13px;
-        }
-        
-        .markdown-body table tr {
-            border-top: 1px solid;
-        }
+        """ 设置Markdown内容，短时间内的多次设置合并为一次渲染 """
+        self._pendingText = text
+        self._renderTimer.start()
         
-        .markdown-body img {
-            max-width: 100%;
-            box-sizing: content-box;
-        }
+    def _doRender(self):
+        """ 渲染最近一次设置的Markdown内容
         
-        .markdown-body ul, .markdown-body ol {
-            padding-left: 2em;
-        }
-        
-        .markdown-body li+li {
-            margin-top: 0.25em;
-        }
+        外壳文档只在首次显示或主题变化时加载，之后只替换正文，
+        避免每次更新都重新导航、解析样式并重置滚动位置
         """
+        text = self._pendingText
+        style = self.getPreviewStyle()
         
-        # 亮色主题样式
-        light_style = """
-        .markdown-body {
-            color: #24292e;
-            background-color: #ffffff;
-        }
-        
-        .markdown-body a {
-            color: #0366d6;
-            text-decoration: none;
-        }
-        
-        .markdown-body h1, .markdown-body h2 {
-            border-bottom: 1px solid #eaecef;
-        }
-        
-        .markdown-body pre {
-            background-color: #f6f8fa;
-        }
-        
-        .markdown-body code {
-            background-color: rgba(27,31,35,0.05);
-            color: #24292e;
-        }
-        
-        .markdown-body blockquote {
-            color: #6a737d;
-            border-left: 0.25em solid #dfe2e5;
-        }
-        
-        .markdown-body table th, .markdown-body table td {
-            border: 1px solid #dfe2e5;
-        }
-        
-        .markdown-body table tr {
-            background-color: #fff;
-        }
+        # 内容和主题都没有变化时无需渲染
+        if text == self._lastText and style is self._shellStyle:
+            return
+        self._lastText = text
         
-        .markdown-body table tr:nth-child(2n) {
-            background-color: #f6f8fa;
-        }
+        # 转换Markdown为HTML
+        html_content = self.convertMarkdownToHtml(text)
         
-        .markdown-body img {
-            background-color: #fff;
-        }
+        # 首次显示或主题变化时重新加载外壳文档，正文在加载完成后显示
+        if style is not self._shellStyle:
+            self._shellStyle = style
+            self._pageReady = False
+            self._pendingHtml = html_content
+            self.webView.setHtml(_SHELL_HTML % style)
+            return
+            
+        if not self._pageReady:
+            self._pendingHtml = html_content
+            return
+            
+        self._updateBody(html_content)
+        
+    def onShellLoaded(self, ok):
+        """ 外壳文档加载完成，显示加载期间收到的正文 """
+        if not ok:
+            # 加载失败或被中断，下一次渲染时重新加载外壳文档
+            self._shellStyle = None
+            self._pageReady = False
+            self._lastText = None
+            return
+        self._pageReady = True
+        if self._pendingHtml is not None:
+            html_content, self._pendingHtml = self._pendingHtml, None
+            self._updateBody(html_content)
+            
+    def _updateBody(self, html_content):
+        """ 用脚本替换预览正文并保持滚动位置
+        Args:
+            html_content: 正文HTML
         """
+        self.webView.page().runJavaScript(_UPDATE_JS % json.dumps(html_content))
         
-        # 深色主题样式
-        dark_style = """
-        .markdown-body {
-            color: #c9d1d9;
-            background-color: #0d1117;
-        }
-        
-        .markdown-body a {
-            color: #58a6ff;
-            text-decoration: none;
-        }
-        
-        .markdown-body h1, .markdown-body h2 {
-            border-bottom: 1px solid #21262d;
-        }
-        
-        .markdown-body pre {
-            background-color: #161b22;
-        }
-        
-        .markdown-body code {
-            background-color: rgba(240,246,252,0.15);
-            color: #e6edf3;
-        }
-        
-        .markdown-body blockquote {
-            color: #8b949e;
-            border-left: 0.25em solid #30363d;
-        }
-        
-        .markdown-body table th, .markdown-body table td {
-            border: 1px solid #30363d;
-        }
-        
-        .markdown-body table tr {
-            background-color: #0d1117;
-        }
-        
-        .markdown-body table tr:nth-child(2n) {
-            background-color: #161b22;
-        }
-        
-        .markdown-body img {
-            background-color: #0d1117;
-        }
-        """
+    def convertMarkdownToHtml(self, text):
+        """ 将Markdown文本转换为HTML """
+        # 相同文本直接使用缓存的转换结果
+        return _render_cached(text)
         
-        return base_style + (dark_style if is_dark else light_style) 
\ No newline at end of file
+    def getPreviewStyle(self):
+        """ 获取预览样式，返回预先拼接好的当前主题样式 """
+        return _DARK_CSS if isDarkTheme() else _LIGHT_CSS
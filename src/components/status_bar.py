@@ -2,18 +2,103 @@
 # -*- coding: utf-8 -*-
 
 import os
+from functools import lru_cache
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer
 from qfluentwidgets import FluentIcon, IconWidget, TransparentToolButton
 
+# 状态栏样式表，深色和浅色主题通过theme动态属性选择，只在初始化时设置一次
+_STATUS_BAR_QSS = """
+    StatusBar QLabel {
+        font-size: 12px;
+    }
+    
+    StatusBar[theme="dark"] QLabel {
+        color: #BBBBBB;
+    }
+    
+    StatusBar[theme="dark"] {
+        background-color: #2D2D2D;
+        border-top: 1px solid #3D3D3D;
+    }
+    
+    StatusBar[theme="light"] QLabel {
+        color: #888888;
+    }
+    
+    StatusBar[theme="light"] {
+        background-color: #F5F5F5;
+        border-top: 1px solid #E0E0E0;
+    }
+"""
+
+@lru_cache(maxsize=64)
+def _branch_for(repo_path, head_stamp):
+    """ 获取仓库的当前分支，切换分支总会改写HEAD，因此以HEAD的修改时间作为缓存键的一部分
+    Args:
+        repo_path: 仓库路径
+        head_stamp: HEAD文件的修改时间
+    Returns:
+        str: 分支名称，不是有效仓库或处于分离头指针状态时返回None
+    """
+    # 延迟导入，状态栏随主窗口创建，启动时不加载GitPython；结果已缓存，导入只在未命中时执行
+    from src.utils.git_manager import GitManager
+    try:
+        return GitManager(repo_path).getCurrentBranch()
+    except Exception:
+        return None
+
+def _current_branch(repo_path):
+    """ 获取仓库的当前分支，HEAD未修改时直接使用缓存
+    Args:
+        repo_path: 仓库路径
+    Returns:
+        str: 分支名称，获取失败时返回None
+    """
+    try:
+        head_stamp = os.stat(os.path.join(repo_path, '.git', 'HEAD')).st_mtime_ns
+    except OSError:
+        # .git为文件（工作树、子模块）或不存在时不缓存
+        return _branch_for.__wrapped__(repo_path, None)
+    return _branch_for(repo_path, head_stamp)
+
+class _BranchProbe(QRunnable):
+    """ 在线程池中读取仓库当前分支，避免慢速磁盘或网络路径上的仓库阻塞界面 """
+    
+    class Signals(QObject):
+        """ QRunnable不是QObject，信号定义在单独的对象上 """
+        finished = pyqtSignal(str, str)  # 读取完成信号，参数为：仓库路径，分支名称（失败时为空）
+        
+    def __init__(self, repo_path):
+        """ 初始化分支读取任务
+        Args:
+            repo_path: 仓库路径
+        """
+        super().__init__()
+        # 由状态栏持有引用直到结果送达，避免线程池删除后信号对象随之失效
+        self.setAutoDelete(False)
+        self.signals = _BranchProbe.Signals()
+        self.repo_path = repo_path
+        
+    def run(self):
+        """ 读取分支的线程主函数 """
+        self.signals.finished.emit(self.repo_path, _current_branch(self.repo_path) or "")
+
 class StatusBar(QWidget):
     """ 状态栏组件 """
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._currentDark = None  # 当前已应用的主题，None表示尚未设置
         self.initUI()
         self.current_file = ""
         self.current_repo = ""
+        self._branchProbes = set()  # 进行中的分支读取任务，持有引用直到结果送达
+        
+        # 文件和仓库标签延迟到本轮事件循环结束时更新，连续多次设置只重绘一次
+        self._pendingFile = False
+        self._pendingRepo = False
+        self._flushScheduled = False
         
     def initUI(self):
         """ 初始化UI """
@@ -46,44 +131,28 @@ class StatusBar(QWidget):
         # 设置固定高度
         self.setFixedHeight(30)
         
-        # 设置默认样式 (浅色主题)
+        # 设置样式表并使用默认样式 (浅色主题)
+        self.setStyleSheet(_STATUS_BAR_QSS)
         self.updateTheme(is_dark_mode=False)
         
     def updateTheme(self, is_dark_mode=False):
-        """ 根据主题更新样式 """
-        if is_dark_mode:
-            self.setStyleSheet("""
-                QLabel {
-                    color: #BBBBBB;
-                    font-size: 12px;
-                }
-                
-                StatusBar {
-                    background-color: #2D2D2D;
-                    border-top: 1px solid #3D3D3D;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QLabel {
-                    color: #888888;
-                    font-size: 12px;
-                }
-                
-                StatusBar {
-                    background-color: #F5F5F5;
-                    border-top: 1px solid #E0E0E0;
-                }
-            """)
+        """ 根据主题更新样式，只切换theme属性并重新应用已解析的样式，不重新设置样式表 """
+        if is_dark_mode == self._currentDark:
+            return
+        self._currentDark = is_dark_mode
+        self.setProperty("theme", "dark" if is_dark_mode else "light")
+        
+        # 标签的样式依赖状态栏的属性，需要一起重新应用
+        style = self.style()
+        for widget in (self, self.fileLabel, self.repoLabel, self.branchLabel):
+            style.unpolish(widget)
+            style.polish(widget)
         
     def setCurrentFile(self, file_path):
         """ 设置当前文件信息 """
         self.current_file = file_path if file_path else ""
-        if file_path:
-            file_name = os.path.basename(file_path)
-            self.fileLabel.setText(f"文件: {file_name}")
-        else:
-            self.fileLabel.setText("文件: 无")
+        self._pendingFile = True
+        self._scheduleFlush()
             
     def getCurrentFile(self):
         """ 获取当前文件路径 """
@@ -92,25 +161,72 @@ class StatusBar(QWidget):
     def setCurrentRepository(self, repo_path):
         """ 设置当前仓库信息 """
         self.current_repo = repo_path if repo_path else ""
+        self._pendingRepo = True
+        self._scheduleFlush()
+        
+    def _scheduleFlush(self):
+        """ 安排在本轮事件循环结束时更新标签 """
+        if not self._flushScheduled:
+            self._flushScheduled = True
+            QTimer.singleShot(0, self._flushPending)
+            
+    def _flushPending(self):
+        """ 按最新的文件和仓库更新标签，期间的多次设置只应用最后一次 """
+        self._flushScheduled = False
+        
+        if self._pendingFile:
+            self._pendingFile = False
+            if self.current_file:
+                self.fileLabel.setText(f"文件: {os.path.basename(self.current_file)}")
+            else:
+                self.fileLabel.setText("文件: 无")
+                
+        if self._pendingRepo:
+            self._pendingRepo = False
+            self._applyRepository(self.current_repo)
+            
+    def _applyRepository(self, repo_path):
+        """ 显示仓库信息并在后台读取分支
+        Args:
+            repo_path: 仓库路径，为空时显示无仓库
+        """
         if repo_path:
             repo_name = os.path.basename(repo_path)
             self.repoLabel.setText(f"仓库: {repo_name}")
             
-            # 获取Git分支信息
-            try:
-                from src.utils.git_manager import GitManager
-                git_manager = GitManager(repo_path)
-                branch = git_manager.getCurrentBranch()
-                self.branchLabel.setText(f"分支: {branch}")
-                self.syncBtn.setEnabled(True)
-            except:
-                self.branchLabel.setText("分支: 无")
-                self.syncBtn.setEnabled(False)
+            # 在线程池中获取Git分支信息，结果由onBranchReady显示
+            self.branchLabel.setText("分支: …")
+            probe = _BranchProbe(repo_path)
+            
+            def on_probe_finished(path, branch):
+                self._branchProbes.discard(probe)
+                self.onBranchReady(path, branch)
+                
+            probe.signals.finished.connect(on_probe_finished, Qt.QueuedConnection)
+            self._branchProbes.add(probe)
+            QThreadPool.globalInstance().start(probe)
         else:
             self.repoLabel.setText("仓库: 无")
             self.branchLabel.setText("分支: 无")
             self.syncBtn.setEnabled(False)
             
+    def onBranchReady(self, repo_path, branch):
+        """ 分支读取完成的回调
+        Args:
+            repo_path: 仓库路径
+            branch: 分支名称，读取失败时为空
+        """
+        # 期间已切换到其他仓库时丢弃过期的结果
+        if repo_path != self.current_repo:
+            return
+            
+        if branch:
+            self.branchLabel.setText(f"分支: {branch}")
+            self.syncBtn.setEnabled(True)
+        else:
+            self.branchLabel.setText("分支: 无")
+            self.syncBtn.setEnabled(False)
+            
     def getCurrentRepository(self):
         """ 获取当前仓库路径 """
         return self.current_repo
@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from PyQt5.QtCore import Qt
+from qfluentwidgets import InfoBar, InfoBarPosition
+
+def show_info_bar(parent, kind, title, content, duration=2000):
+    """ 在父窗口顶部显示InfoBar提示
+    Args:
+        parent: 父窗口
+        kind: 提示类型，如'success'、'info'、'warning'、'error'
+        title: 标题
+        content: 内容
+        duration: 显示时长（毫秒）
+    """
+    getattr(InfoBar, kind)(title=title, content=content, orient=Qt.Horizontal, isClosable=True,
+                           position=InfoBarPosition.TOP, duration=duration, parent=parent)
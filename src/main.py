@@ -4,9 +4,8 @@
 import sys
 import os
 import signal
-import platform
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt, QCoreApplication
+from PyQt5.QtCore import Qt, QCoreApplication, QTimer
 from qfluentwidgets import FluentTranslator
 
 # 导入日志工具
@@ -71,16 +70,10 @@ def setup_signal_handling():
     except (AttributeError, ValueError) as e:
         warning(f"部分信号处理器无法设置: {e}")
 
-def main():
-    """ 应用程序入口 """
-    info("========== MGit 应用程序启动 ==========")
-    
-    # 设置全局异常处理器
-    from src.utils.logger import setup_exception_logging
-    setup_exception_logging()
-    info("全局异常处理器已设置")
-    
-    # 记录系统信息
+def _post_show_init():
+    """ 主窗口显示后再执行的初始化，只记录运行环境等信息，不影响首次显示的速度 """
+    # platform在Windows上获取系统版本时可能需要启动子进程，因此在窗口显示后才导入
+    import platform
     system_info = f"系统: {platform.system()} {platform.release()} ({platform.version()})"
     python_info = f"Python: {platform.python_version()}"
     info(f"运行环境: {system_info}, {python_info}")
@@ -90,6 +83,19 @@ def main():
     log_dir = get_log_dir()
     info(f"日志目录: {log_dir}")
     
+    # 设置信号处理
+    setup_signal_handling()
+    info("信号处理器设置完成")
+
+def main():
+    """ 应用程序入口 """
+    info("========== MGit 应用程序启动 ==========")
+    
+    # 设置全局异常处理器
+    from src.utils.logger import setup_exception_logging
+    setup_exception_logging()
+    info("全局异常处理器已设置")
+    
     # 设置应用信息
     QCoreApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
     QCoreApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
@@ -110,9 +116,8 @@ def main():
     w.show()
     info("主窗口显示成功")
     
-    # 设置信号处理
-    setup_signal_handling()
-    info("信号处理器设置完成")
+    # 记录运行环境和设置信号处理等不影响显示的初始化，在进入事件循环后执行
+    QTimer.singleShot(0, _post_show_init)
     
     info("应用程序进入事件循环...")
     # 运行应用
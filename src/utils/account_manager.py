@@ -3,11 +3,13 @@
 
 import os
 import json
+import hashlib
+from contextlib import contextmanager
 from pathlib import Path
 import requests
 import base64
 from datetime import datetime
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 import urllib3
 
 # 导入日志工具
@@ -29,6 +31,8 @@ class AccountManager(QObject):
     
     # 定义信号，当账号列表更新时触发
     accountsChanged = pyqtSignal()
+    # 账号配置写入失败时触发，参数为错误信息
+    saveFailed = pyqtSignal(str)
     
     def __init__(self, accounts_file=None):
         """ 初始化账号管理器
@@ -50,12 +54,22 @@ class AccountManager(QObject):
         else:
             self.accounts_file = accounts_file
             
+        # 保存请求合并到本轮事件循环结束时统一写入
+        self._dirty = False
+        self._flush_scheduled = False
+        self._batch_depth = 0   # batch_updates的嵌套层数，大于0时保存只标记不写入
+        self._last_hash = None  # 上次写入或读取的内容摘要，内容未变化时不写入
+        
         # 默认账号配置
         self.accounts = {
             'github': [],
             'gitlab': []
         }
         
+        # 账号索引，GitHub按用户名、GitLab按(URL, 用户名)查找账号，避免逐个遍历
+        self._github_index = {}
+        self._gitlab_index = {}
+        
         # 加载账号配置
         self.load_accounts()
         
@@ -67,20 +81,137 @@ class AccountManager(QObject):
                     loaded_accounts = json.load(f)
                     # 更新配置，但保留默认值
                     self.accounts.update(loaded_accounts)
+                self._last_hash = self._digest(self._serialize())
+            self._rebuild_indexes()
         except Exception as e:
             print(f"加载账号配置文件失败: {str(e)}")
         
+    def _rebuild_indexes(self):
+        """ 根据账号列表重建查找索引，存在重复账号时使用列表中的第一个，缺少字段的条目不加入索引 """
+        self._github_index = {account.get('username'): account
+                              for account in reversed(self.accounts['github'])
+                              if isinstance(account, dict) and account.get('username')}
+        self._gitlab_index = {(account.get('url'), account.get('username')): account
+                              for account in reversed(self.accounts['gitlab'])
+                              if isinstance(account, dict) and account.get('url') and account.get('username')}
+        
+    def _remove_from_list(self, kind, account):
+        """ 从账号列表中删除索引找到的账号
+        
+        账号按列表保存以保持文件格式和get_*_accounts的返回值不变，删除时仍需定位并移动后续元素，
+        这一步是O(N)的；删除只由用户逐个触发，因此只按对象身份定位，不再比较字段
+        Args:
+            kind: 'github'或'gitlab'
+            account: 账号字典
+        """
+        accounts = self.accounts[kind]
+        del accounts[next(i for i, item in enumerate(accounts) if item is account)]
+        
+    @contextmanager
+    def batch_updates(self):
+        """ 批量修改账号，期间的保存只标记，最外层结束时写入一次并只发出一次信号，可以嵌套使用 """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._flush_to_disk()
+                
     def save_accounts(self):
-        """ 保存账号配置 """
+        """ 保存账号配置，写入延迟到本轮事件循环结束时，期间的多次保存只写入一次 """
+        self._dirty = True
+        if self._batch_depth == 0 and not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_to_disk)
+            
+    def _flush_to_disk(self):
+        """ 将账号配置写入文件，先写入临时文件再替换，避免写入中断时损坏原文件 """
+        self._flush_scheduled = False
+        if not self._dirty or self._batch_depth > 0:
+            return
+        
         try:
-            with open(self.accounts_file, 'w', encoding='utf-8') as f:
-                json.dump(self.accounts, f, ensure_ascii=False, indent=4)
+            data = self._serialize()
+            digest = self._digest(data)
+            if digest != self._last_hash:
+                tmp_file = self.accounts_file + '.tmp'
+                with open(tmp_file, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_file, self.accounts_file)
+                self._last_hash = digest
                 
-            # 发出信号通知账号列表已更新
-            self.accountsChanged.emit()
+            # 写入成功后才清除未保存标记，失败时下一次保存会重新写入
+            self._dirty = False
         except Exception as e:
-            print(f"保存账号配置文件失败: {str(e)}")
+            # 修改方法在写入前已经返回，失败只能通过信号通知界面
+            error(f"保存账号配置文件失败: {str(e)}")
+            self.saveFailed.emit(str(e))
+            
+        # 每次写入只发出一次信号，失败时界面也据此重新显示账号列表
+        self.accountsChanged.emit()
             
+    def _serialize(self):
+        """ 将账号配置序列化为写入文件的内容
+        Returns:
+            bytes: UTF-8编码的JSON
+        """
+        return json.dumps(self.accounts, ensure_ascii=False, indent=4).encode('utf-8')
+        
+    @staticmethod
+    def _digest(data):
+        """ 计算内容摘要，用于判断账号配置是否变化
+        Args:
+            data: 序列化后的内容
+        Returns:
+            bytes: 摘要
+        """
+        return hashlib.blake2b(data, digest_size=16).digest()
+        
+    def _upsert_github_account(self, username, token, name):
+        """ 添加GitHub账号，已存在同名账号时更新令牌和别名，并保存更改
+        Args:
+            username: GitHub用户名
+            token: GitHub访问令牌
+            name: 账号别名
+        """
+        account = self._github_index.get(username)
+        if account is not None:
+            account['token'] = token
+            account['name'] = name
+        else:
+            account = {
+                'username': username,
+                'token': token,
+                'name': name
+            }
+            self.accounts['github'].append(account)
+            self._github_index[username] = account
+        self.save_accounts()
+        
+    def _upsert_gitlab_account(self, url, username, token, name):
+        """ 添加GitLab账号，已存在相同URL和用户名的账号时更新令牌和别名，并保存更改
+        Args:
+            url: GitLab实例URL
+            username: GitLab用户名
+            token: GitLab访问令牌
+            name: 账号别名
+        """
+        account = self._gitlab_index.get((url, username))
+        if account is not None:
+            account['token'] = token
+            account['name'] = name
+        else:
+            account = {
+                'url': url,
+                'username': username,
+                'token': token,
+                'name': name
+            }
+            self.accounts['gitlab'].append(account)
+            self._gitlab_index[(url, username)] = account
+        self.save_accounts()
+        
     def add_github_account(self, username, token, name=None):
         """ 添加GitHub账号
         Args:
@@ -98,24 +229,8 @@ class AccountManager(QObject):
         if name is None:
             name = username
             
-        # 检查是否已存在该账号
-        for account in self.accounts['github']:
-            if account['username'] == username:
-                # 更新已有账号
-                account['token'] = token
-                account['name'] = name
-                self.save_accounts()
-                return True
-                
-        # 添加新账号
-        self.accounts['github'].append({
-            'username': username,
-            'token': token,
-            'name': name
-        })
-        
-        # 保存更改
-        self.save_accounts()
+        # 添加新账号或更新已有账号并保存
+        self._upsert_github_account(username, token, name)
         return True
         
     def add_gitlab_account(self, url, token, name=None):
@@ -139,25 +254,8 @@ class AccountManager(QObject):
             if name == "gitlab":
                 name = username
                 
-        # 检查是否已存在该账号
-        for account in self.accounts['gitlab']:
-            if account['url'] == url and account['username'] == username:
-                # 更新已有账号
-                account['token'] = token
-                account['name'] = name
-                self.save_accounts()
-                return True
-                
-        # 添加新账号
-        self.accounts['gitlab'].append({
-            'url': url,
-            'username': username,
-            'token': token,
-            'name': name
-        })
-        
-        # 保存更改
-        self.save_accounts()
+        # 添加新账号或更新已有账号并保存
+        self._upsert_gitlab_account(url, username, token, name)
         return True
         
     def add_github_account_oauth(self, code, client_id, client_secret, name=None):
@@ -213,24 +311,8 @@ class AccountManager(QObject):
             if name is None:
                 name = username
                 
-            # 检查是否已存在该账号
-            for account in self.accounts['github']:
-                if account['username'] == username:
-                    # 更新已有账号
-                    account['token'] = token
-                    account['name'] = name
-                    self.save_accounts()
-                    return True
-                    
-            # 添加新账号
-            self.accounts['github'].append({
-                'username': username,
-                'token': token,
-                'name': name
-            })
-            
-            # 保存更改
-            self.save_accounts()
+            # 添加新账号或更新已有账号并保存
+            self._upsert_github_account(username, token, name)
             return True
         except Exception as e:
             print(f"通过OAuth添加GitHub账号时出错: {str(e)}")
@@ -299,25 +381,8 @@ class AccountManager(QObject):
                 if name == "gitlab":
                     name = username
                     
-            # 检查是否已存在该账号
-            for account in self.accounts['gitlab']:
-                if account['url'] == gitlab_url and account['username'] == username:
-                    # 更新已有账号
-                    account['token'] = token
-                    account['name'] = name
-                    self.save_accounts()
-                    return True
-                    
-            # 添加新账号
-            self.accounts['gitlab'].append({
-                'url': gitlab_url,
-                'username': username,
-                'token': token,
-                'name': name
-            })
-            
-            # 保存更改
-            self.save_accounts()
+            # 添加新账号或更新已有账号并保存
+            self._upsert_gitlab_account(gitlab_url, username, token, name)
             return True
         except Exception as e:
             print(f"通过OAuth添加GitLab账号时出错: {str(e)}")
@@ -425,12 +490,12 @@ class AccountManager(QObject):
         Returns:
             bool: 是否移除成功
         """
-        for i, account in enumerate(self.accounts['github']):
-            if account['username'] == username:
-                self.accounts['github'].pop(i)
-                self.save_accounts()
-                return True
-        return False
+        account = self._github_index.pop(username, None)
+        if account is None:
+            return False
+        self._remove_from_list('github', account)
+        self.save_accounts()
+        return True
         
     def remove_gitlab_account(self, url, username):
         """ 移除GitLab账号
@@ -440,12 +505,12 @@ class AccountManager(QObject):
         Returns:
             bool: 是否移除成功
         """
-        for i, account in enumerate(self.accounts['gitlab']):
-            if account['url'] == url and account['username'] == username:
-                self.accounts['gitlab'].pop(i)
-                self.save_accounts()
-                return True
-        return False
+        account = self._gitlab_index.pop((url, username), None)
+        if account is None:
+            return False
+        self._remove_from_list('gitlab', account)
+        self.save_accounts()
+        return True
         
     def get_github_accounts(self):
         """ 获取所有GitHub账号
@@ -3,6 +3,7 @@
 
 import os
 import json
+import time
 from pathlib import Path
 from PyQt5.QtCore import QObject, pyqtSignal
 
@@ -14,6 +15,22 @@ class ConfigManager(QObject):
     # 定义信号，当编辑器配置更新时触发
     editorConfigChanged = pyqtSignal()
     
+    # 进程内共享的实例
+    _instance = None
+    
+    # 最近仓库有效性检查结果的有效期（秒），过期后重新检查，发现会话中被删除的仓库
+    RECENT_REPOS_CHECK_TTL = 30
+    
+    @classmethod
+    def instance(cls):
+        """ 获取共享的配置管理器实例，避免各组件重复加载配置文件
+        Returns:
+            ConfigManager: 共享实例
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
     def __init__(self, config_file=None):
         """ 初始化配置管理器 
         Args:
@@ -39,12 +56,18 @@ class ConfigManager(QObject):
             'recent_repositories': [],
             'theme': 'auto',
             'max_recent_count': 10,
+            'confirmations': {},  # 操作确认开关，值为False表示不再询问
+            'untracked_mode': 'normal',  # 未跟踪文件扫描方式：no/normal/all
             'editor': {
                 'auto_save_on_focus_change': True,  # 焦点变化时自动保存
                 'auto_save_interval': 60  # 自动保存间隔（秒）
             }
         }
         
+        # 上次检查过路径有效性的最近仓库列表，列表不变时不再逐个访问仓库路径
+        self._checkedRecentRepos = None
+        self._checkedRecentReposAt = 0.0
+        
         # 加载配置
         self.load_config()
         
@@ -103,9 +126,17 @@ class ConfigManager(QObject):
         Returns:
             list: 仓库路径列表
         """
+        # 列表与上次检查时相同且检查未过期，直接返回，避免频繁访问可能很慢的网络路径
+        now = time.monotonic()
+        if (self._checkedRecentRepos == self.config['recent_repositories']
+                and now - self._checkedRecentReposAt < self.RECENT_REPOS_CHECK_TTL):
+            return list(self._checkedRecentRepos)
+            
         # 过滤掉不存在的仓库
         valid_repos = [repo for repo in self.config['recent_repositories'] 
                       if os.path.exists(repo) and os.path.exists(os.path.join(repo, '.git'))]
+        self._checkedRecentRepos = list(valid_repos)
+        self._checkedRecentReposAt = now
         
         # 更新配置
         if len(valid_repos) != len(self.config['recent_repositories']):
@@ -177,4 +208,39 @@ class ConfigManager(QObject):
         """
         if 'editor' not in self.config or 'auto_save_interval' not in self.config['editor']:
             return 60  # 默认60秒
-        return self.config['editor']['auto_save_interval'] 
\ No newline at end of file
+        return self.config['editor']['auto_save_interval'] 
+        
+    def get_confirm_enabled(self, key):
+        """获取指定操作是否需要确认
+        Args:
+            key: 操作标识，如'sync'
+        Returns:
+            bool: 是否需要确认
+        """
+        return self.config.get('confirmations', {}).get(key, True)
+        
+    def set_confirm_enabled(self, key, enabled):
+        """设置指定操作是否需要确认
+        Args:
+            key: 操作标识，如'sync'
+            enabled: 是否需要确认
+        """
+        if 'confirmations' not in self.config:
+            self.config['confirmations'] = {}
+        self.config['confirmations'][key] = enabled
+        self.save_config()
+        
+    def get_untracked_mode(self):
+        """获取变更列表中未跟踪文件的扫描方式
+        Returns:
+            str: no、normal或all
+        """
+        return self.config.get('untracked_mode', 'normal')
+        
+    def set_untracked_mode(self, mode):
+        """设置变更列表中未跟踪文件的扫描方式
+        Args:
+            mode: no、normal或all
+        """
+        self.config['untracked_mode'] = mode
+        self.save_config()
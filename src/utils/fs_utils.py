@@ -0,0 +1,20 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+from src.utils.logger import debug
+
+def is_dir_nonempty(path):
+    """判断目录是否存在且不为空，读到第一个条目即返回
+
+    Args:
+        path: 目录路径
+    Returns:
+        bool: 目录存在且至少包含一个条目，无法读取时视为空
+    """
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except OSError as e:
+        debug(f"无法读取目录 {path} - {str(e)}")
+        return False
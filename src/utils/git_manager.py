@@ -2,6 +2,10 @@
 # -*- coding: utf-8 -*-
 
 import os
+import re
+import heapq
+import subprocess
+import threading
 import git
 from datetime import datetime
 from src.utils.license_templates import get_cc_by_4_0_license
@@ -13,10 +17,19 @@ class GitManager:
     # 类级变量，用于防止循环调用
     _is_fetching = False
     
+    # git --progress 输出的进度行，如 "Receiving objects:  45% (450/1000)"
+    _PROGRESS_RE = re.compile(r'^(?:remote:\s*)?([A-Za-z][\w ]*?):\s+(\d+)%')
+    _LINE_SPLIT_RE = re.compile(rb'[\r\n]')
+    
     def __init__(self, repo_path):
         """ 初始化Git管理器 """
         self.repo_path = repo_path
         self.repo = None
+        self._branchesCache = None  # (引用指纹, 分支列表)
+        self._upstreamCache = None  # (配置修改时间, {分支: 上游分支})
+        self._remotesCache = None   # (配置修改时间, 远程仓库列表)
+        self._headCache = None      # (HEAD修改时间, HEAD文件内容)
+        self._packedRefsCache = None  # (packed-refs修改时间, {引用名: 提交哈希})
         self.connect()
         
     def connect(self):
@@ -50,11 +63,9 @@ class GitManager:
             except Exception as e:
                 raise Exception(f"无法创建目录 {path}: {str(e)}")
             
-        # 检查目录是否为空
-        if os.listdir(path):
-            # 目录非空，检查是否已经是Git仓库
-            if os.path.exists(os.path.join(path, '.git')):
-                return git.Repo(path)
+        # 已经是Git仓库时直接返回，无需先列出整个目录判断是否为空
+        if os.path.exists(os.path.join(path, '.git')):
+            return git.Repo(path)
         
         # 初始化仓库
         try:
@@ -99,60 +110,168 @@ class GitManager:
             return False
             
     def getCurrentBranch(self):
-        """ 获取当前分支名称 """
+        """ 获取当前分支名称，切换分支总会改写HEAD，HEAD未修改时直接使用上次读取的内容 """
         if not self.isValidRepo():
             return ""
-        return self.repo.active_branch.name
+            
+        head = self._readHead()
+        if not head.startswith('ref: refs/heads/'):
+            # 与GitPython的active_branch保持一致，分离头指针时抛出TypeError
+            raise TypeError(f"HEAD is a detached symbolic reference as it points to '{head}'")
+        return head[len('ref: refs/heads/'):]
         
-    def getChangedFiles(self):
-        """ 获取已更改的文件列表 """
+    def getHeadSha(self):
+        """ 获取HEAD指向的提交哈希，只读取引用文件，不启动git进程
+        Returns:
+            str: 提交哈希，仓库还没有提交时返回None
+        """
         if not self.isValidRepo():
-            return []
+            return None
             
-        changed_files = []
+        head = self._readHead()
+        if not head.startswith('ref: '):
+            return head or None
+        return self._resolveRef(head[len('ref: '):])
+        
+    def _readHead(self):
+        """ 读取HEAD文件内容，按修改时间缓存
+        Returns:
+            str: 去掉首尾空白的HEAD内容，如 ref: refs/heads/main 或提交哈希
+        """
+        head_path = os.path.join(self.repo.git_dir, 'HEAD')
+        stamp = os.stat(head_path).st_mtime_ns
+        if self._headCache is None or self._headCache[0] != stamp:
+            with open(head_path, 'r', encoding='utf-8') as f:
+                self._headCache = (stamp, f.read().strip())
+        return self._headCache[1]
         
-        # 获取未跟踪文件
-        for untracked_file in self.repo.untracked_files:
-            changed_files.append(("未跟踪", untracked_file))
+    def _resolveRef(self, refname):
+        """ 解析引用指向的提交哈希，先读取松散引用文件，不存在时查找packed-refs
+        Args:
+            refname: 完整引用名，如 refs/heads/main
+        Returns:
+            str: 提交哈希，引用不存在时返回None
+        """
+        try:
+            with open(os.path.join(self.repo.common_dir, refname), 'r', encoding='utf-8') as f:
+                return f.read().strip() or None
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            return self._packedRefs().get(refname)
             
-        # 获取已修改但未暂存的文件
-        for diff in self.repo.index.diff(None):
-            if diff.change_type == 'D':
-                changed_files.append(("已删除", diff.a_path))
-            elif diff.change_type == 'M':
-                changed_files.append(("已修改", diff.a_path))
-            elif diff.change_type == 'R':
-                changed_files.append(("已重命名", diff.a_path))
+    def _packedRefs(self):
+        """ 读取packed-refs中的引用，packed-refs未修改时直接使用上次解析的结果
+        Returns:
+            dict: {引用名: 提交哈希}
+        """
+        path = os.path.join(self.repo.common_dir, 'packed-refs')
+        try:
+            stamp = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return {}
+            
+        if self._packedRefsCache is None or self._packedRefsCache[0] != stamp:
+            refs = {}
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    # 跳过注释行和附注标签解引用行（以^开头）
+                    if line.startswith(('#', '^')):
+                        continue
+                    sha, _, refname = line.rstrip('\n').partition(' ')
+                    if refname:
+                        refs[refname] = sha
+            self._packedRefsCache = (stamp, refs)
+        return self._packedRefsCache[1]
+            
+    # git status --porcelain=v2中暂存区和工作区状态字母对应的显示文字
+    _UNSTAGED_LABELS = {'D': "已删除", 'M': "已修改", 'R': "已重命名"}
+    _STAGED_LABELS = {'A': "已暂存", 'D': "已暂存删除", 'M': "已暂存修改"}
+    
+    def getChangedFiles(self, include_untracked='normal', cancel_event=None):
+        """ 获取已更改的文件列表
+        Args:
+            include_untracked: 未跟踪文件的扫描方式，同git status --untracked-files，
+                no为不扫描，normal只列出未跟踪的目录本身，all递归列出所有文件
+            cancel_event: 取消事件，被设置时终止git status进程
+        Returns:
+            list: (状态, 路径)列表，依次为未跟踪、未暂存和已暂存的文件
+        """
+        if not self.isValidRepo():
+            return []
+            
+        # 一次git status同时得到三类变更；只读查询不刷新index，避免与其它git进程争抢index.lock
+        args = ('--porcelain=v2', '-z', f'--untracked-files={include_untracked}')
+        if cancel_event is None:
+            output = self.repo.git(no_optional_locks=True).status(*args, stdout_as_string=False)
+        else:
+            # 大仓库中git status可能耗时很久，取消时直接终止进程，不必等它执行完
+            process = self.repo.git(no_optional_locks=True).status(*args, as_process=True)
+            GitManager._terminateOnCancel(process, cancel_event)
+            output, stderr = process.proc.communicate()
+            if cancel_event.is_set():
+                raise Exception("读取变更文件已取消")
+            process.wait(stderr=stderr)
+        
+        untracked, unstaged, staged = [], [], []
+        entries = iter(output.split(b'\0'))
+        for entry in entries:
+            kind = entry[:1]
+            if kind == b'?':
+                untracked.append(("未跟踪", os.fsdecode(entry[2:])))
+                continue
+            if kind == b'1':
+                path = entry.split(b' ', 8)[8]
+            elif kind == b'2':
+                # 重命名和复制条目后面紧跟原路径，跳过
+                path = entry.split(b' ', 9)[9]
+                next(entries, None)
+            elif kind == b'u':
+                unstaged.append(("冲突", os.fsdecode(entry.split(b' ', 10)[10])))
+                continue
             else:
-                changed_files.append((diff.change_type, diff.a_path))
+                continue
                 
-        # 获取已暂存的文件
-        for diff in self.repo.index.diff('HEAD'):
-            if diff.change_type == 'A':
-                changed_files.append(("已暂存", diff.a_path))
-            elif diff.change_type == 'D':
-                changed_files.append(("已暂存删除", diff.a_path))
-            elif diff.change_type == 'M':
-                changed_files.append(("已暂存修改", diff.a_path))
-            else:
-                changed_files.append((f"已暂存{diff.change_type}", diff.a_path))
+            path = os.fsdecode(path)
+            index_status, worktree_status = chr(entry[2]), chr(entry[3])
+            if worktree_status != '.':
+                unstaged.append((self._UNSTAGED_LABELS.get(worktree_status, worktree_status), path))
+            if index_status != '.':
+                staged.append((self._STAGED_LABELS.get(index_status, f"已暂存{index_status}"), path))
                 
-        return changed_files
+        return untracked + unstaged + staged
         
     def getCommitHistory(self, count=10):
-        """ 获取提交历史 """
+        """ 获取提交历史
+        Args:
+            count: 读取的提交条数
+        Returns:
+            list: 提交字典列表，按提交时间从新到旧排列，仓库还没有提交时为空
+        """
         if not self.isValidRepo():
             return []
             
+        try:
+            head = self.repo.head.commit
+        except ValueError:
+            return []
+            
+        # 按提交时间从新到旧遍历提交图，与git log的默认顺序一致；
+        # 提交对象经由GitPython常驻的cat-file --batch进程读取，不再为每次刷新启动git rev-list
+        pending = [(-head.committed_date, head.hexsha, head)]
+        seen = {head.hexsha}
         commits = []
-        for commit in list(self.repo.iter_commits('HEAD', max_count=count)):
+        while pending and len(commits) < count:
+            _, _, commit = heapq.heappop(pending)
             commits.append({
                 'hash': str(commit.hexsha),
                 'author': str(commit.author),
                 'date': datetime.fromtimestamp(commit.committed_date).strftime('%Y-%m-%d %H:%M:%S'),
                 'message': commit.message.strip()
             })
-            
+            for parent in commit.parents:
+                if parent.hexsha not in seen:
+                    seen.add(parent.hexsha)
+                    heapq.heappush(pending, (-parent.committed_date, parent.hexsha, parent))
+                    
         return commits
         
     def stage(self, file_paths):
@@ -198,11 +317,99 @@ class GitManager:
         # 提交更改
         self.repo.git.commit('-m', message)
         
-    def pull(self, remote_name='origin', branch=None):
+    def commitPaths(self, path_bytes, message):
+        """ 批量提交已编码的路径
+        路径以NUL分隔通过标准输入传给git add，不再逐个转换为命令行参数，也不受命令行长度限制
+        Args:
+            path_bytes: 相对于仓库根目录的路径列表（bytes）
+            message: 提交信息
+        """
+        if not self.isValidRepo():
+            return
+            
+        # 暂存文件
+        process = self.repo.git.add('--pathspec-from-file=-', '--pathspec-file-nul',
+                                    istream=subprocess.PIPE, as_process=True)
+        _, stderr = process.proc.communicate(b'\0'.join(path_bytes))
+        if process.proc.returncode != 0:
+            raise Exception(f"暂存文件失败: {stderr.decode('utf-8', 'replace').strip()}")
+            
+        # 提交更改
+        self.repo.git.commit('-m', message)
+        
+    def _runWithProgress(self, command, *args, progress_callback=None):
+        """ 执行网络类git命令，边读取stderr边解析进度
+        Args:
+            command: git子命令，如pull、push、fetch
+            *args: 命令参数
+            progress_callback: 进度回调，参数为(进度百分比, 描述)；为None时直接阻塞执行
+        Raises:
+            git.exc.GitCommandError: 命令返回非0状态
+        """
+        if progress_callback is None:
+            getattr(self.repo.git, command)(*args)
+            return
+            
+        process = getattr(self.repo.git, command)('--progress', *args, as_process=True)
+        GitManager._streamProgress(process, progress_callback)
+        
+    @staticmethod
+    def _streamProgress(process, progress_callback, cancel_event=None):
+        """ 读取git --progress进程的stderr并解析进度，直到进程结束
+        Args:
+            process: as_process=True返回的git命令进程
+            progress_callback: 进度回调，参数为(进度百分比, 描述)
+            cancel_event: 取消事件，被设置时终止git进程
+        Raises:
+            git.exc.GitCommandError: 命令返回非0状态
+        """
+        if cancel_event is not None:
+            GitManager._terminateOnCancel(process, cancel_event)
+            
+        # stdout单独排空，否则管道写满会使git阻塞
+        drain = threading.Thread(target=process.proc.stdout.read, daemon=True)
+        drain.start()
+        
+        # 进度以\r刷新同一行，按\r和\n切分后逐行解析
+        errors = []
+        pending = b''
+        for chunk in iter(lambda: process.proc.stderr.read1(4096), b''):
+            *lines, pending = GitManager._LINE_SPLIT_RE.split(pending + chunk)
+            for line in lines:
+                text = line.decode('utf-8', 'replace').strip()
+                match = GitManager._PROGRESS_RE.match(text)
+                if match:
+                    progress_callback(int(match.group(2)), match.group(1))
+                elif text:
+                    # 只保留非进度行，供失败时生成错误信息
+                    errors.append(text)
+        if pending.strip():
+            errors.append(pending.decode('utf-8', 'replace').strip())
+        drain.join()
+        
+        process.wait(stderr='\n'.join(errors))
+        
+    @staticmethod
+    def _terminateOnCancel(process, cancel_event):
+        """ 启动监视线程，进程结束前取消事件被设置时终止git进程
+        Args:
+            process: as_process=True返回的git命令进程
+            cancel_event: 取消事件
+        """
+        def watch():
+            # 进程结束前定期检查取消事件，SIGTERM让git自行清理未完成的目录
+            while process.proc.poll() is None:
+                if cancel_event.wait(0.2):
+                    process.proc.terminate()
+                    return
+        threading.Thread(target=watch, daemon=True).start()
+        
+    def pull(self, remote_name='origin', branch=None, progress_callback=None):
         """ 拉取远程更改
         Args:
             remote_name: 远程仓库名称，默认为origin
             branch: 分支名称，默认为当前分支
+            progress_callback: 进度回调，参数为(进度百分比, 描述)
         """
         if not self.isValidRepo():
             return
@@ -217,7 +424,7 @@ class GitManager:
                 branch = self.getCurrentBranch()
                 
             # 拉取更改
-            self.repo.git.pull(remote_name, branch)
+            self._runWithProgress('pull', remote_name, branch, progress_callback=progress_callback)
         except git.exc.GitCommandError as e:
             error_msg = str(e).lower()
             if "could not resolve host" in error_msg:
@@ -233,12 +440,13 @@ class GitManager:
         except Exception as e:
             raise Exception(f"拉取更改失败: {str(e)}")
             
-    def push(self, remote_name='origin', branch=None, set_upstream=False):
+    def push(self, remote_name='origin', branch=None, set_upstream=False, progress_callback=None):
         """ 推送更改到远程仓库
         Args:
             remote_name: 远程仓库名称，默认为origin
             branch: 分支名称，默认为当前分支
             set_upstream: 是否设置上游分支，默认为False
+            progress_callback: 进度回调，参数为(进度百分比, 描述)
         """
         if not self.isValidRepo():
             return
@@ -262,10 +470,10 @@ class GitManager:
             if set_upstream:
                 # 添加调试信息
                 print(f"执行: git push -u {remote_name} {branch}")
-                self.repo.git.push('-u', remote_name, branch)
+                self._runWithProgress('push', '-u', remote_name, branch, progress_callback=progress_callback)
             else:
                 print(f"执行: git push {remote_name} {branch}")
-                self.repo.git.push(remote_name, branch)
+                self._runWithProgress('push', remote_name, branch, progress_callback=progress_callback)
         except git.exc.GitCommandError as e:
             error_msg = str(e).lower()
             if "could not resolve host" in error_msg:
@@ -335,26 +543,91 @@ class GitManager:
         self.repo.git.merge(branch_name)
         
     def getBranches(self):
-        """ 获取所有分支 """
+        """ 获取所有分支，引用未变化时直接返回上次的结果 """
         if not self.isValidRepo():
             return []
             
+        fingerprint = self._refsFingerprint()
+        if self._branchesCache is not None and self._branchesCache[0] == fingerprint:
+            return list(self._branchesCache[1])
+            
+        # 同一次读取的上游信息顺便更新上游缓存
+        branches, upstreams = self._readBranchRefs()
+        self._branchesCache = (fingerprint, branches)
+        self._upstreamCache = (self._configStamp(), upstreams)
+        return list(branches)
+        
+    def _readBranchRefs(self):
+        """ 用一次for-each-ref读取所有本地分支及其上游分支
+        Returns:
+            tuple: (分支名列表, {分支名: 上游分支})
+        """
         branches = []
-        for branch in self.repo.branches:
-            branches.append(str(branch))
+        upstreams = {}
+        output = self.repo.git.for_each_ref('--format=%(refname)%09%(upstream:short)', 'refs/heads')
+        for line in output.splitlines():
+            refname, _, upstream = line.partition('\t')
+            # 使用完整引用名截取分支名，避免与同名标签冲突时refname:short带上heads/前缀
+            name = refname[len('refs/heads/'):]
+            branches.append(name)
+            if upstream:
+                upstreams[name] = upstream
+        return branches, upstreams
+        
+    def _configStamp(self):
+        """ 获取仓库config文件的修改时间，上游分支等配置变化时随之改变 """
+        try:
+            return os.stat(os.path.join(self.repo.common_dir, 'config')).st_mtime_ns
+        except OSError:
+            return None
+        
+    def _refsFingerprint(self):
+        """ 计算本地分支引用的指纹
+        
+        分支的创建、删除和移动都会在refs/heads下的目录中增删条目或改写packed-refs，
+        因此这些目录和packed-refs的修改时间足以判断分支列表是否可能变化
+        Returns:
+            tuple: 各目录及packed-refs的修改时间
+        """
+        common_dir = self.repo.common_dir
+        stamps = []
+        for root, _, _ in os.walk(os.path.join(common_dir, 'refs', 'heads')):
+            stamps.append((root, os.stat(root).st_mtime_ns))
+        try:
+            stamps.append(os.stat(os.path.join(common_dir, 'packed-refs')).st_mtime_ns)
+        except FileNotFoundError:
+            stamps.append(0)
+        return tuple(stamps)
+        
+    def getUpstream(self, branch):
+        """ 获取本地分支跟踪的上游分支
+        
+        与getBranches共用一次for-each-ref的结果，上游信息保存在config中，
+        因此config未修改时直接使用缓存
+        Args:
+            branch: 本地分支名
+        Returns:
+            str: 上游分支，如 origin/main；未设置上游时返回None
+        """
+        if not self.isValidRepo():
+            return None
             
-        return branches
+        stamp = self._configStamp()
+        if self._upstreamCache is None or self._upstreamCache[0] != stamp:
+            self._upstreamCache = (stamp, self._readBranchRefs()[1])
+            
+        return self._upstreamCache[1].get(branch)
         
     def getRemotes(self):
-        """ 获取所有远程仓库 """
+        """ 获取所有远程仓库，远程仓库保存在config中，config未修改时直接返回上次的结果 """
         if not self.isValidRepo():
             return []
             
-        remotes = []
-        for remote in self.repo.remotes:
-            remotes.append(str(remote))
+        stamp = self._configStamp()
+        if self._remotesCache is None or self._remotesCache[0] != stamp:
+            self._remotesCache = (stamp, [str(remote) for remote in self.repo.remotes])
             
-        return remotes
+        return list(self._remotesCache[1])
         
     def getFileHistory(self, file_path, count=10):
         """ 获取文件的历史记录 """
@@ -409,15 +682,29 @@ class GitManager:
             url = GitManager.sanitize_url(url)
             
             # 检查是否已存在同名远程仓库
-            for remote in self.repo.remotes:
-                if remote.name == name:
-                    raise Exception(f"远程仓库 '{name}' 已存在")
+            if name in self.getRemotes():
+                raise Exception(f"远程仓库 '{name}' 已存在")
                     
-            # 添加远程仓库
+            # 添加远程仓库，config的修改时间精度不足时也不会返回旧的列表
             self.repo.create_remote(name, url)
+            self._remotesCache = None
         except Exception as e:
             raise Exception(f"添加远程仓库失败: {str(e)}")
             
+    def setRemoteUrl(self, name, url):
+        """ 更新远程仓库URL
+        Args:
+            name: 远程仓库名称
+            url: 新的远程仓库URL
+        """
+        if not self.isValidRepo():
+            return
+            
+        try:
+            self.repo.git.remote('set-url', name, GitManager.sanitize_url(url))
+        except Exception as e:
+            raise Exception(f"更新远程仓库URL失败: {str(e)}")
+            
     def removeRemote(self, name):
         """ 删除远程仓库
         Args:
@@ -428,6 +715,7 @@ class GitManager:
             
         try:
             self.repo.delete_remote(name)
+            self._remotesCache = None
             return True
         except Exception as e:
             raise Exception(f"删除远程仓库失败: {str(e)}")
@@ -440,20 +728,28 @@ class GitManager:
         if not self.isValidRepo():
             return []
             
+        # 一次git remote -v读取所有远程仓库的地址，代替逐个远程仓库执行git remote get-url
+        urls = {}
+        for line in self.repo.git.remote('-v').splitlines():
+            name, _, rest = line.partition('\t')
+            url, _, kind = rest.rpartition(' ')
+            if kind == '(fetch)' and name not in urls:
+                urls[name] = url
+                
         remotes = []
         for remote in self.repo.remotes:
-            remote_urls = list(remote.urls)
             remotes.append({
                 'name': remote.name,
-                'url': remote_urls[0] if remote_urls else ""
+                'url': urls.get(remote.name, "")
             })
             
         return remotes
             
-    def fetch(self, remote_name='origin'):
+    def fetch(self, remote_name='origin', progress_callback=None):
         """ 从远程仓库获取更新
         Args:
             remote_name: 远程仓库名称，默认为origin
+            progress_callback: 进度回调，参数为(进度百分比, 描述)
         """
         if not self.isValidRepo():
             return
@@ -465,7 +761,7 @@ class GitManager:
         try:
             GitManager._is_fetching = True
             # 使用git命令直接执行fetch，避免使用GitPython的高级API可能引起的循环调用
-            self.repo.git.fetch(remote_name)
+            self._runWithProgress('fetch', remote_name, progress_callback=progress_callback)
             GitManager._is_fetching = False
         except Exception as e:
             GitManager._is_fetching = False
@@ -700,7 +996,8 @@ class GitManager:
         return url
             
     @staticmethod
-    def cloneRepository(url, target_path, branch=None, depth=None, recursive=False):
+    def cloneRepository(url, target_path, branch=None, depth=None, recursive=False,
+                        progress_callback=None, cancel_event=None):
         """ 从远程克隆仓库
         Args:
             url: 远程仓库URL
@@ -708,6 +1005,8 @@ class GitManager:
             branch: 指定要克隆的分支，默认为None（克隆默认分支）
             depth: 指定历史深度，默认为None（完整历史）
             recursive: 是否递归克隆子模块，默认为False
+            progress_callback: 进度回调，参数为(进度百分比, 描述)；为None时直接阻塞执行
+            cancel_event: 取消事件，被设置时终止克隆，仅在提供进度回调时生效
         Returns:
             git.Repo: 克隆的仓库对象
         """
@@ -724,9 +1023,19 @@ class GitManager:
             if recursive:
                 clone_args['recursive'] = True
                 
-            # 克隆仓库
-            repo = git.Repo.clone_from(url, target_path, **clone_args)
-            return repo
+            if progress_callback is None:
+                # 克隆仓库
+                return git.Repo.clone_from(url, target_path, **clone_args)
+                
+            # 边克隆边解析进度
+            process = git.Git().clone('--progress', url, target_path, as_process=True, **clone_args)
+            try:
+                GitManager._streamProgress(process, progress_callback, cancel_event)
+            except git.exc.GitCommandError:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise Exception("克隆已取消")
+                raise
+            return git.Repo(target_path)
         except git.exc.GitCommandError as e:
             error_msg = str(e).lower()
             # 处理特定的Git错误
@@ -745,29 +1054,38 @@ class GitManager:
         except Exception as e:
             raise Exception(f"克隆仓库失败: {str(e)}")
             
-    def syncWithRemote(self, remote_name='origin', branch=None):
+    def syncWithRemote(self, remote_name='origin', branch=None, progress_callback=None):
         """ 与远程仓库同步（先拉取后推送）
         Args:
             remote_name: 远程仓库名称，默认为origin
             branch: 分支名称，默认为当前分支
+            progress_callback: 进度回调，参数为(进度百分比, 描述)，每个阶段开始时调用
         """
         if not self.isValidRepo():
             return
             
+        def report(progress, message):
+            if progress_callback:
+                progress_callback(progress, message)
+            
         try:
             # 如果未指定分支，使用当前分支
             if branch is None:
                 branch = self.getCurrentBranch()
             
             # 先执行fetch操作
+            report(0, f"正在从 {remote_name} 获取更新...")
             self.fetch(remote_name)
             
             # 执行merge操作（相当于git pull的第二步）
+            report(40, f"正在合并 {remote_name}/{branch}...")
             remote_branch = f"{remote_name}/{branch}"
             self.repo.git.merge(remote_branch)
             
             # 推送更改
+            report(70, f"正在推送至 {remote_name}...")
             self.push(remote_name, branch)
+            report(100, "同步完成")
         except Exception as e:
             raise Exception(f"同步失败: {str(e)}")
             
@@ -787,12 +1105,13 @@ class GitManager:
             
             if as_remote:
                 # 添加为远程仓库
-                if remote_name in [remote.name for remote in self.repo.remotes]:
+                if remote_name in self.getRemotes():
                     # 已存在同名远程仓库，更新URL
                     self.repo.git.remote('set-url', remote_name, url)
                 else:
                     # 添加新的远程仓库
                     self.repo.create_remote(remote_name, url)
+                    self._remotesCache = None
             else:
                 # 不添加为远程仓库，直接拉取合并
                 # 防止循环调用fetch
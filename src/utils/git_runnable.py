@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from src.utils.logger import info, error, debug
+
+class GitCloneRunnable(QRunnable):
+    """克隆仓库任务，提交到QThreadPool执行，不占用GitThread，多个克隆可以与其他Git操作并行"""
+
+    class Signals(QObject):
+        """QRunnable不是QObject，信号定义在单独的对象上"""
+        finished = pyqtSignal(bool, str, str)  # 克隆完成信号，参数为：成功/失败，目标路径，结果/错误信息
+        progress = pyqtSignal(int, str)  # 进度更新信号，参数为：进度百分比，描述
+
+    def __init__(self, url, target_path, branch=None, depth=None, recursive=False):
+        """初始化克隆任务
+
+        Args:
+            url: 仓库URL
+            target_path: 目标路径
+            branch: 分支名称
+            depth: 克隆深度
+            recursive: 是否递归克隆子模块
+        """
+        super(GitCloneRunnable, self).__init__()
+        # 由调用方持有引用直到finished处理完毕，避免线程池删除后信号对象随之失效
+        self.setAutoDelete(False)
+        self.signals = GitCloneRunnable.Signals()
+        self.url = url
+        self.target_path = target_path
+        self.branch = branch
+        self.depth = depth
+        self.recursive = recursive
+        self.result_data = None   # 在工作线程中预先打开的仓库，供完成回调使用
+        self._cancelEvent = threading.Event()
+
+    def cancel(self):
+        """请求取消克隆，会终止git进程并以失败结束"""
+        self._cancelEvent.set()
+
+    def run(self):
+        """执行克隆的线程主函数"""
+        try:
+            from src.utils.git_manager import GitManager
+            debug(f"克隆任务：开始克隆仓库: {self.url} -> {self.target_path}")
+            GitManager.cloneRepository(self.url, self.target_path, self.branch, self.depth, self.recursive,
+                                       progress_callback=self.signals.progress.emit,
+                                       cancel_event=self._cancelEvent)
+
+            # 在工作线程中预先打开克隆好的仓库，完成回调无需再在UI线程读取引用
+            cloned_manager = GitManager(self.target_path)
+            self.result_data = {
+                'git_manager': cloned_manager,
+                'remotes': cloned_manager.getRemotes()
+            }
+            info(f"克隆任务：已克隆仓库至 {self.target_path}")
+            self.signals.finished.emit(True, self.target_path, f"已克隆仓库至 {self.target_path}")
+        except Exception as e:
+            error(f"克隆任务：克隆失败: {str(e)}")
+            self.signals.finished.emit(False, self.target_path, str(e))
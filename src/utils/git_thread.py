@@ -1,8 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PyQt5.QtCore import QThread, pyqtSignal
 from src.utils.logger import info, error, debug
+from src.utils.fs_utils import is_dir_nonempty
 
 class GitThread(QThread):
     """Git操作线程类，用于异步执行Git操作"""
@@ -49,7 +54,7 @@ class GitThread(QThread):
                     raise Exception("未设置GitManager实例")
                 remote_name = self.params.get('remote_name', 'origin')
                 branch = self.params.get('branch', None)
-                self.git_manager.pull(remote_name, branch)
+                self.git_manager.pull(remote_name, branch, self.progressUpdate.emit)
                 result = f"已从 {remote_name} 成功拉取更新"
                 
             elif self.operation == 'push':
@@ -58,22 +63,27 @@ class GitThread(QThread):
                 remote_name = self.params.get('remote_name', 'origin')
                 branch = self.params.get('branch', None)
                 set_upstream = self.params.get('set_upstream', False)
-                self.git_manager.push(remote_name, branch, set_upstream)
+                self.git_manager.push(remote_name, branch, set_upstream, self.progressUpdate.emit)
                 result = f"已成功推送至 {remote_name}"
                 
             elif self.operation == 'fetch':
                 if not self.git_manager:
                     raise Exception("未设置GitManager实例")
                 remote_name = self.params.get('remote_name', 'origin')
-                self.git_manager.fetch(remote_name)
+                self.git_manager.fetch(remote_name, self.progressUpdate.emit)
                 result = f"已从 {remote_name} 获取最新更改"
                 
             elif self.operation == 'commit':
                 if not self.git_manager:
                     raise Exception("未设置GitManager实例")
                 file_paths = self.params.get('file_paths', [])
+                path_bytes = self.params.get('path_bytes')
                 message = self.params.get('message', '提交更改')
-                self.git_manager.commit(file_paths, message)
+                if path_bytes:
+                    # 已编码的路径走批量提交
+                    self.git_manager.commitPaths(path_bytes, message)
+                else:
+                    self.git_manager.commit(file_paths, message)
                 result = f"已成功提交更改: {message}"
                 
             elif self.operation == 'sync':
@@ -81,9 +91,87 @@ class GitThread(QThread):
                     raise Exception("未设置GitManager实例")
                 remote_name = self.params.get('remote_name', 'origin')
                 branch = self.params.get('branch', None)
-                self.git_manager.syncWithRemote(remote_name, branch)
+                # 每个阶段开始时发出进度信号
+                self.git_manager.syncWithRemote(remote_name, branch, self.progressUpdate.emit)
                 result = f"已与 {remote_name} 同步完成"
                 
+            elif self.operation == 'import':
+                if not self.git_manager:
+                    raise Exception("未设置GitManager实例")
+                url = self.params.get('url')
+                if not url:
+                    raise Exception("导入仓库未提供URL")
+                as_remote = self.params.get('as_remote', True)
+                remote_name = self.params.get('remote_name', 'origin')
+                self.git_manager.importExternalRepo(url, as_remote, remote_name)
+                result = "已成功导入外部仓库" + (f" 并添加为远程仓库 {remote_name}" if as_remote else "")
+                
+            elif self.operation == 'create_branch':
+                if not self.git_manager:
+                    raise Exception("未设置GitManager实例")
+                branch_name = self.params.get('branch_name')
+                checkout = self.params.get('checkout', False)
+                self.git_manager.createBranch(branch_name, checkout)
+                result = f"已成功创建分支 '{branch_name}'" + ("并切换到该分支" if checkout else "")
+                
+            elif self.operation == 'merge_branch':
+                if not self.git_manager:
+                    raise Exception("未设置GitManager实例")
+                branch_name = self.params.get('branch_name')
+                self.git_manager.mergeBranch(branch_name)
+                result = f"已成功将 '{branch_name}' 合并到当前分支"
+                
+            elif self.operation == 'delete_branch':
+                if not self.git_manager:
+                    raise Exception("未设置GitManager实例")
+                branch_name = self.params.get('branch_name')
+                self.git_manager.deleteBranch(branch_name, self.params.get('force', False))
+                result = f"已成功删除分支 '{branch_name}'"
+                
+            elif self.operation == 'add_remote':
+                if not self.git_manager:
+                    raise Exception("未设置GitManager实例")
+                remote_name = self.params.get('remote_name')
+                url = self.params.get('url')
+                if self.params.get('update', False):
+                    # 更新已存在的远程仓库URL
+                    self.git_manager.setRemoteUrl(remote_name, url)
+                    result = f"已更新远程仓库 '{remote_name}' 的URL"
+                else:
+                    self.git_manager.addRemote(remote_name, url)
+                    result = f"已成功添加远程仓库 '{remote_name}'"
+                    
+            elif self.operation == 'remove_remote':
+                if not self.git_manager:
+                    raise Exception("未设置GitManager实例")
+                remote_name = self.params.get('remote_name')
+                self.git_manager.removeRemote(remote_name)
+                result = f"已成功删除远程仓库 '{remote_name}'"
+                
+            elif self.operation == 'stash':
+                if not self.git_manager:
+                    raise Exception("未设置GitManager实例")
+                self.git_manager.stashChanges(self.params.get('message'))
+                result = "已成功存储工作区更改"
+                
+            elif self.operation == 'apply_stash':
+                if not self.git_manager:
+                    raise Exception("未设置GitManager实例")
+                self.git_manager.applyStash(self.params.get('stash_id', 0))
+                result = "已成功应用存储的更改"
+                
+            elif self.operation == 'drop_stash':
+                if not self.git_manager:
+                    raise Exception("未设置GitManager实例")
+                self.git_manager.dropStash(self.params.get('stash_id', 0))
+                result = "已成功删除存储"
+                
+            elif self.operation == 'clear_stash':
+                if not self.git_manager:
+                    raise Exception("未设置GitManager实例")
+                self.git_manager.clearStash()
+                result = "已成功清空所有存储"
+                
             elif self.operation == 'init':
                 path = self.params.get('path')
                 if not path:
@@ -96,25 +184,6 @@ class GitThread(QThread):
                 GitManager.initRepository(path, initial_branch)
                 result = f"已在 {path} 初始化仓库"
                 
-            elif self.operation == 'clone':
-                url = self.params.get('url')
-                if not url:
-                    raise Exception("克隆仓库未提供URL")
-                    
-                target_path = self.params.get('target_path')
-                if not target_path:
-                    raise Exception("克隆仓库未提供目标路径")
-                    
-                branch = self.params.get('branch')
-                depth = self.params.get('depth')
-                recursive = self.params.get('recursive', False)
-                
-                # 使用静态方法克隆仓库，不需要GitManager实例
-                from src.utils.git_manager import GitManager
-                debug(f"Git线程：直接调用静态方法克隆仓库: {url} -> {target_path}")
-                GitManager.cloneRepository(url, target_path, branch, depth, recursive)
-                result = f"已克隆仓库至 {target_path}"
-                
             else:
                 # 未知操作
                 error(f"Git线程：未知操作 {self.operation}")
@@ -129,4 +198,283 @@ class GitThread(QThread):
             # 操作失败
             error_msg = str(e)
             error(f"Git线程：{self.operation} 操作失败 - {error_msg}")
-            self.operationFinished.emit(False, self.operation, error_msg) 
\ No newline at end of file
+            self.operationFinished.emit(False, self.operation, error_msg) 
+
+class GitStatusReaders:
+    """后台读取线程专用的GitManager，在同一仓库的多次刷新之间复用
+    
+    GitPython的cat-file进程和GitManager的缓存都不是线程安全的，不能与界面线程和GitThread共用；
+    这里为每个仓库保留两个只在后台读取线程中使用的实例，提交历史和引用分别读取以便并发，
+    由锁保证同一时间只有一个线程使用，常驻的cat-file进程和修改时间缓存都得以保留
+    """
+    
+    def __init__(self, repo_path):
+        """初始化读取实例容器，仓库在第一次使用时才在工作线程中打开
+        
+        Args:
+            repo_path: 仓库路径
+        """
+        self.repo_path = repo_path
+        self._lock = threading.Lock()
+        self._stateLock = threading.Lock()
+        self._managers = None
+        self._busy = False
+        self._closed = False
+        
+    @contextmanager
+    def acquire(self):
+        """独占使用读取实例，只能在工作线程中调用
+        
+        Yields:
+            tuple: (读取提交历史的GitManager, 读取变更和引用的GitManager)
+        """
+        with self._lock:
+            with self._stateLock:
+                if self._closed:
+                    raise RuntimeError(f"仓库已关闭: {self.repo_path}")
+                self._busy = True
+            try:
+                if self._managers is None:
+                    # 延迟导入，首次读取时才加载GitManager
+                    from src.utils.git_manager import GitManager
+                    self._managers = (GitManager(self.repo_path), GitManager(self.repo_path))
+                yield self._managers
+            finally:
+                with self._stateLock:
+                    self._busy = False
+                    closed = self._closed
+                if closed:
+                    self._closeManagers()
+                    
+    def close(self):
+        """切换仓库时调用，读取实例正在使用时由使用线程在结束后关闭"""
+        with self._stateLock:
+            self._closed = True
+            busy = self._busy
+        if not busy:
+            self._closeManagers()
+            
+    def _closeManagers(self):
+        """关闭读取实例打开的仓库"""
+        managers, self._managers = self._managers, None
+        for manager in managers or ():
+            manager.repo.close()
+            
+
+class GitStatusThread(QThread):
+    """Git状态读取线程类，用于在后台收集刷新面板所需的仓库状态"""
+    
+    # 定义信号
+    statusReady = pyqtSignal(object, object)  # 状态读取完成信号，参数为：取消令牌，状态字典
+    statusFailed = pyqtSignal(object, str)  # 状态读取失败信号，参数为：取消令牌，错误信息
+    
+    def __init__(self, readers, cancel_token, history_count=5, parent=None, remotes=None,
+                 untracked_mode='normal', history=None):
+        """初始化状态读取线程
+        
+        Args:
+            readers: 当前仓库的GitStatusReaders
+            cancel_token: threading.Event取消令牌，被置位后线程尽快退出且不再发出结果
+            history_count: 读取的提交历史条数
+            parent: 父对象
+            remotes: 已缓存的远程仓库列表，提供时不再重新读取
+            untracked_mode: 未跟踪文件的扫描方式，no、normal或all
+            history: 上次读取的(HEAD哈希, 提交历史)，HEAD未变化时直接复用
+        """
+        super(GitStatusThread, self).__init__(parent)
+        self.readers = readers
+        self.cancel_token = cancel_token
+        self.history_count = history_count
+        self.remotes = remotes
+        self.untracked_mode = untracked_mode
+        self.history = history
+        
+    def run(self):
+        """读取仓库状态的线程主函数，相互独立的git读取并发执行"""
+        token = self.cancel_token
+        if token.is_set():
+            return
+            
+        try:
+            with self.readers.acquire() as managers:
+                status = self._readStatus(token, *managers)
+        except Exception as e:
+            if not token.is_set():
+                error(f"Git状态线程：读取仓库状态失败 - {str(e)}")
+                self.statusFailed.emit(token, str(e))
+            return
+            
+        if status is None or token.is_set():
+            debug("Git状态线程：刷新已取消")
+            return
+        status['remotes'], (status['current_branch'], status['branches']) = status.pop('refs')
+        status['head'], status['commits'] = status.pop('history')
+        self.statusReady.emit(token, status)
+        
+    def _readStatus(self, token, history_manager, manager):
+        """并发读取变更文件、提交历史和引用
+        
+        Args:
+            token: 取消令牌
+            history_manager: 读取提交历史的GitManager
+            manager: 读取变更文件和引用的GitManager，git status每次启动独立的进程，不共享状态
+            
+        Returns:
+            dict: 各项读取结果，刷新被取消时返回None
+        """
+        # 等待读取实例期间刷新可能已被取代
+        if token.is_set():
+            return None
+            
+        # 各项读取之间没有依赖，总耗时约为最慢的一项而不是各项之和
+        executor = ThreadPoolExecutor(max_workers=3)
+        futures = {
+            executor.submit(manager.getChangedFiles, self.untracked_mode, token): 'changes',
+            executor.submit(self._readHistory, history_manager): 'history',
+            executor.submit(self._readRefs, manager): 'refs',
+        }
+        status = {}
+        
+        try:
+            # 必需的状态，任何一项失败都视为刷新失败
+            for future in as_completed(futures):
+                if token.is_set():
+                    return None
+                status[futures[future]] = future.result()
+        finally:
+            # 等待仍在执行的读取结束后再释放读取实例，避免与下一次刷新同时使用
+            executor.shutdown(wait=True, cancel_futures=True)
+        return status
+            
+    def _readHistory(self, manager):
+        """读取提交历史，HEAD与上次相同时跳过遍历提交
+        
+        Args:
+            manager: 读取线程专用的GitManager实例
+            
+        Returns:
+            tuple: (HEAD哈希, 提交历史)
+        """
+        head = manager.getHeadSha()
+        if self.history is not None and head is not None and head == self.history[0]:
+            return self.history
+        return head, manager.getCommitHistory(self.history_count)
+        
+    def _readRefs(self, manager):
+        """依次读取远程仓库列表、当前分支和分支列表
+        
+        Args:
+            manager: 读取线程专用的GitManager实例
+            
+        Returns:
+            tuple: (远程仓库列表, (当前分支, 分支列表))
+        """
+        return self._readRemotes(manager), self._readBranches(manager)
+        
+    def _readBranches(self, manager):
+        """读取当前分支和分支列表，失败时（例如分离HEAD）不影响其它状态的显示
+        
+        Returns:
+            tuple: (当前分支, 分支列表)，失败时均为None
+        """
+        try:
+            return manager.getCurrentBranch(), manager.getBranches()
+        except Exception as e:
+            debug(f"Git状态线程：读取分支信息失败 - {str(e)}")
+            return None, None
+            
+    def _readRemotes(self, manager):
+        """读取远程仓库列表，优先使用调用方提供的缓存"""
+        if self.remotes is not None:
+            return self.remotes
+        return manager.getRemotes()
+            
+
+class GitOpenThread(QThread):
+    """Git仓库打开线程类，用于在后台读取仓库的index和配置"""
+    
+    # 定义信号
+    repoOpened = pyqtSignal(object, str, object)  # 仓库打开完成信号，参数为：取消令牌，仓库路径，预先准备的仓库数据
+    openFailed = pyqtSignal(object, str, str)  # 仓库打开失败信号，参数为：取消令牌，仓库路径，错误信息
+    
+    def __init__(self, path, cancel_token, parent=None):
+        """初始化仓库打开线程
+        
+        Args:
+            path: 仓库路径
+            cancel_token: threading.Event取消令牌，被置位后不再发出结果
+            parent: 父对象
+        """
+        super(GitOpenThread, self).__init__(parent)
+        self.path = path
+        self.cancel_token = cancel_token
+        
+    def run(self):
+        """打开仓库的线程主函数"""
+        token = self.cancel_token
+        try:
+            # 延迟导入，首次打开仓库时才加载GitManager
+            from src.utils.git_manager import GitManager
+            git_manager = GitManager(self.path)
+            prepared = {
+                'git_manager': git_manager,
+                'remotes': git_manager.getRemotes()
+            }
+        except Exception as e:
+            if not token.is_set():
+                error(f"Git打开线程：打开仓库失败 - {str(e)}")
+                self.openFailed.emit(token, self.path, str(e))
+            return
+            
+        if not token.is_set():
+            self.repoOpened.emit(token, self.path, prepared)
+            
+
+class BranchListThread(QThread):
+    """分支列表读取线程类，用于在选择分支的对话框打开后再后台读取分支"""
+    
+    # 定义信号
+    loaded = pyqtSignal(list)  # 读取完成信号，参数为：分支名称列表
+    failed = pyqtSignal(str)   # 读取失败信号，参数为：错误信息
+    
+    def __init__(self, readers, parent=None):
+        """初始化分支列表读取线程
+        
+        Args:
+            readers: 当前仓库的GitStatusReaders，不使用界面线程的GitManager
+            parent: 父对象
+        """
+        super(BranchListThread, self).__init__(parent)
+        self.readers = readers
+        
+    def run(self):
+        """读取分支列表的线程主函数，与状态刷新线程轮流使用读取实例"""
+        try:
+            with self.readers.acquire() as (_, manager):
+                branches = manager.getBranches()
+            self.loaded.emit(branches)
+        except Exception as e:
+            error(f"分支列表读取线程：读取失败 - {str(e)}")
+            self.failed.emit(str(e))
+            
+class PathProbeThread(QThread):
+    """路径检查线程类，用于在后台检查路径是否存在以及目录是否为空"""
+    
+    # 定义信号
+    probed = pyqtSignal(str, bool, bool)  # 检查完成信号，参数为：路径，是否存在，是否为非空目录
+    
+    def __init__(self, path, parent=None):
+        """初始化路径检查线程
+        
+        Args:
+            path: 要检查的路径
+            parent: 父对象
+        """
+        super(PathProbeThread, self).__init__(parent)
+        self.path = path
+        
+    def run(self):
+        """检查路径的线程主函数，读到目录的第一个条目即可判断是否为空"""
+        exists = os.path.exists(self.path)
+        nonempty = exists and is_dir_nonempty(self.path)
+        self.probed.emit(self.path, exists, nonempty)
@@ -189,12 +189,21 @@ class Logger:
             if not os.path.exists(self.log_file):
                 return "日志文件不存在"
                 
-            # 使用 tail 方式读取最后N行
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                # 读取所有行并保留最后 lines 行
-                all_lines = f.readlines()
-                recent_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
-                return ''.join(recent_lines)
+            # 使用 tail 方式从文件末尾按块向前读取，直到凑够 lines 行，无需读取整个文件
+            block_size = 64 * 1024
+            with open(self.log_file, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                pos = f.tell()
+                data = b''
+                # 多读一个换行符，保证保留的第一行是完整的
+                while pos > 0 and data.count(b'\n') <= lines:
+                    read_size = min(block_size, pos)
+                    pos -= read_size
+                    f.seek(pos)
+                    data = f.read(read_size) + data
+                    
+            recent_lines = data.splitlines(keepends=True)[-lines:]
+            return b''.join(recent_lines).decode('utf-8', 'replace').replace('\r\n', '\n')
         except Exception as e:
             return f"读取日志失败: {str(e)}"
 
@@ -10,19 +10,19 @@ from PyQt5.QtGui import QIcon, QFont, QKeySequence, QColor, QTextCharFormat, QTe
 
 from qfluentwidgets import (NavigationInterface, NavigationItemPosition, 
                           FluentIcon, SubtitleLabel, setTheme, Theme, 
-                          FluentStyleSheet, InfoBar, InfoBarPosition)
+                          FluentStyleSheet)
 
 # 导入自定义组件
 from src.components.editor import MarkdownEditor
 from src.components.explorer import FileExplorer
 from src.components.preview import MarkdownPreview
 from src.components.git_panel import GitPanel
+from src.utils.fs_utils import is_dir_nonempty
 from src.components.status_bar import StatusBar
-from src.utils.git_manager import GitManager
 from src.utils.config_manager import ConfigManager
-from src.components.account_dialog import AccountDialog
 from src.components.log_dialog import LogDialog
 from src.utils.logger import info, warning, error, critical, show_error_message
+from src.components.ui_helpers import show_info_bar
 
 class MainWindow(QMainWindow):
     """ 主窗口类 """
@@ -33,7 +33,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         
         # 初始化配置管理器
-        self.configManager = ConfigManager()
+        self.configManager = ConfigManager.instance()
         
         # 初始化Git管理器为None
         self.gitManager = None
@@ -355,15 +355,7 @@ class MainWindow(QMainWindow):
             self.configManager.clear_recent_repositories()
             # 不需要手动调用updateRecentRepositoriesMenu，信号连接会自动触发更新
             
-            InfoBar.success(
-                title="清空成功",
-                content="已清空最近仓库历史记录",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            show_info_bar(self, 'success', "清空成功", "已清空最近仓库历史记录")
     
     def setTheme(self, theme):
         """ 设置主题 """
@@ -469,15 +461,7 @@ class MainWindow(QMainWindow):
                 print(f"MainWindow.saveFile: Updated statusBar with {currentFile}")
                 
                 # 显示成功消息
-                InfoBar.success(
-                    title="保存成功",
-                    content=f"文件已保存: {os.path.basename(currentFile)}",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'success', "保存成功", f"文件已保存: {os.path.basename(currentFile)}")
             
             return success
         except Exception as e:
@@ -511,15 +495,7 @@ class MainWindow(QMainWindow):
             print(f"MainWindow.saveFileAs: Updated statusBar with new path: {newPath}")
             
             # 显示成功消息
-            InfoBar.success(
-                title="保存成功",
-                content=f"文件已保存: {os.path.basename(newPath)}",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            show_info_bar(self, 'success', "保存成功", f"文件已保存: {os.path.basename(newPath)}")
             
         return success
     
@@ -562,7 +538,7 @@ class MainWindow(QMainWindow):
         info(f"完整的仓库路径: {fullRepoPath}")
         
         # 检查路径是否已存在
-        if os.path.exists(fullRepoPath) and os.listdir(fullRepoPath):
+        if is_dir_nonempty(fullRepoPath):
             reply = QMessageBox.question(
                 self, "确认覆盖", 
                 f"目录 {fullRepoPath} 已存在且不为空，是否继续？\n（不会删除现有文件，但会将此目录初始化为Git仓库）",
@@ -576,6 +552,7 @@ class MainWindow(QMainWindow):
         try:
             info(f"开始初始化仓库: {fullRepoPath}")
             # 初始化仓库
+            from src.utils.git_manager import GitManager
             GitManager.initRepository(fullRepoPath)
             
             # 打开新创建的仓库
@@ -583,26 +560,10 @@ class MainWindow(QMainWindow):
             
             if success:
                 info(f"成功创建并打开仓库: {fullRepoPath}")
-                InfoBar.success(
-                    title="创建成功",
-                    content=f"已成功创建并初始化Git仓库: {repoName}",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=3000,
-                    parent=self
-                )
+                show_info_bar(self, 'success', "创建成功", f"已成功创建并初始化Git仓库: {repoName}", 3000)
             else:
                 warning(f"仓库创建成功，但打开失败: {fullRepoPath}")
-                InfoBar.warning(
-                    title="部分成功",
-                    content=f"已创建仓库，但打开失败: {repoName}",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=3000,
-                    parent=self
-                )
+                show_info_bar(self, 'warning', "部分成功", f"已创建仓库，但打开失败: {repoName}", 3000)
         except Exception as e:
             error(f"创建仓库失败: {str(e)}, 路径: {fullRepoPath}")
             QMessageBox.critical(self, "错误", f"创建仓库失败: {str(e)}")
@@ -613,15 +574,7 @@ class MainWindow(QMainWindow):
             return
             
         if not filePath.lower().endswith(('.md', '.markdown')):
-            InfoBar.warning(
-                title="不支持的文件类型",
-                content="MGit只支持Markdown文件",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            show_info_bar(self, 'warning', "不支持的文件类型", "MGit只支持Markdown文件")
             return
             
         try:
@@ -641,6 +594,7 @@ class MainWindow(QMainWindow):
         """ 打开Git仓库 """
         # 检查是否为有效的Git仓库
         try:
+            from src.utils.git_manager import GitManager
             gitManager = GitManager(path)
             if gitManager.isValidRepo():
                 self.repoChanged.emit(path)
@@ -652,15 +606,7 @@ class MainWindow(QMainWindow):
                 
                 return True
             else:
-                InfoBar.warning(
-                    title="无效仓库",
-                    content="所选路径不是有效的Git仓库",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'warning', "无效仓库", "所选路径不是有效的Git仓库")
                 return False
         except Exception as e:
             QMessageBox.critical(self, "错误", f"打开仓库失败: {str(e)}")
@@ -707,15 +653,7 @@ class MainWindow(QMainWindow):
         """ 比较当前未保存的内容与已保存的文件版本 """
         currentFile = self.statusBar.getCurrentFile()
         if not currentFile or not os.path.exists(currentFile):
-            InfoBar.warning(
-                title="无法比较",
-                content="没有已保存的文件可以比较",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            show_info_bar(self, 'warning', "无法比较", "没有已保存的文件可以比较")
             return
             
         try:
@@ -728,15 +666,7 @@ class MainWindow(QMainWindow):
                 
             # 如果内容相同，无需比较
             if current_content == saved_content:
-                InfoBar.info(
-                    title="内容相同",
-                    content="当前内容与已保存文件相同",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'info', "内容相同", "当前内容与已保存文件相同")
                 return
                 
             # 创建临时文件保存当前内容
@@ -764,15 +694,7 @@ class MainWindow(QMainWindow):
         """ 放弃更改，回退到已保存的版本 """
         currentFile = self.statusBar.getCurrentFile()
         if not currentFile or not os.path.exists(currentFile):
-            InfoBar.warning(
-                title="无法回退",
-                content="没有已保存的文件可以回退",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            show_info_bar(self, 'warning', "无法回退", "没有已保存的文件可以回退")
             return
             
         try:
@@ -782,15 +704,7 @@ class MainWindow(QMainWindow):
                 
             # 检查内容是否相同
             if content == self.editor.toPlainText():
-                InfoBar.info(
-                    title="无需回退",
-                    content="当前内容没有修改，无需回退",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'info', "无需回退", "当前内容没有修改，无需回退")
                 return
                 
             # 确认是否回退
@@ -811,15 +725,7 @@ class MainWindow(QMainWindow):
             self.editor.currentFilePath = currentFile
             self.editor.editor.document().setModified(False)
             
-            InfoBar.success(
-                title="回退成功",
-                content="已成功回退到已保存版本",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            show_info_bar(self, 'success', "回退成功", "已成功回退到已保存版本")
         except Exception as e:
             QMessageBox.critical(self, "回退失败", f"回退到已保存版本失败: {str(e)}")
             
@@ -827,61 +733,30 @@ class MainWindow(QMainWindow):
         """ 比较当前文件与Git版本 """
         currentFile = self.statusBar.getCurrentFile()
         if not currentFile or not os.path.exists(currentFile):
-            InfoBar.warning(
-                title="无法比较",
-                content="没有可比较的文件",
-                orient=Qt.Horizontal,
-                isClosable=True,
-                position=InfoBarPosition.TOP,
-                duration=2000,
-                parent=self
-            )
+            show_info_bar(self, 'warning', "无法比较", "没有可比较的文件")
             return
             
         try:
             # 检查是否在Git仓库中
             repo_path = self.statusBar.getCurrentRepository()
             if not repo_path:
-                InfoBar.warning(
-                    title="未关联Git仓库",
-                    content="当前文件不在Git仓库中，无法与Git版本比较",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'warning', "未关联Git仓库", "当前文件不在Git仓库中，无法与Git版本比较")
                 return
                 
             # 创建临时Git管理器
+            from src.utils.git_manager import GitManager
             gitManager = GitManager(repo_path)
             
             # 检查文件是否在Git跟踪中
             relative_path = os.path.relpath(currentFile, repo_path)
             if not gitManager.isFileTracked(relative_path):
-                InfoBar.warning(
-                    title="文件未跟踪",
-                    content="当前文件未被Git跟踪，无法与Git版本比较",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'warning', "文件未跟踪", "当前文件未被Git跟踪，无法与Git版本比较")
                 return
                 
             # 获取不同版本选择
             versions = gitManager.getFileCommitHistory(relative_path, max_count=10)
             if not versions:
-                InfoBar.warning(
-                    title="无历史版本",
-                    content="找不到文件的历史版本",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
+                show_info_bar(self, 'warning', "无历史版本", "找不到文件的历史版本")
                 return
                 
             # 创建版本选择对话框
@@ -1098,6 +973,7 @@ class MainWindow(QMainWindow):
             
             # 初始化或获取Git管理器
             if not self.gitManager:
+                from src.utils.git_manager import GitManager
                 self.gitManager = GitManager(repo_path)
             
             try:
@@ -1198,15 +1074,7 @@ class MainWindow(QMainWindow):
                         self.editor.editor.document().setModified(True)
                         
                         # 显示成功消息
-                        InfoBar.success(
-                            title="还原成功",
-                            content=f"文件已还原到提交 {selected_commit['hash'][:8]} 的版本。",
-                            orient=Qt.Horizontal,
-                            isClosable=True,
-                            position=InfoBarPosition.TOP,
-                            duration=3000,
-                            parent=self
-                        )
+                        show_info_bar(self, 'success', "还原成功", f"文件已还原到提交 {selected_commit['hash'][:8]} 的版本。", 3000)
             except Exception as e:
                 error(f"还原到Git版本时出错: {str(e)}")
                 QMessageBox.warning(self, "还原失败", f"操作过程中出错: {str(e)}")
@@ -1219,15 +1087,7 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'editor') and hasattr(self.editor, 'recoverFromAutoSave'):
             recovered = self.editor.recoverFromAutoSave()
             if recovered:
-                InfoBar.success(
-                    title="恢复成功",
-                    content="已从自动保存文件恢复内容",
-                    orient=Qt.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=3000,
-                    parent=self
-                ) 
+                show_info_bar(self, 'success', "恢复成功", "已从自动保存文件恢复内容", 3000) 
 
     def closeEvent(self, event):
         """ 在关闭窗口前检查是否有未保存的更改 """
@@ -1269,6 +1129,8 @@ class MainWindow(QMainWindow):
 
     def showAccountManager(self):
         """ 显示账号管理对话框 """
+        # 延迟导入，只有打开账号管理时才加载账号和OAuth相关模块
+        from src.components.account_dialog import AccountDialog
         dialog = AccountDialog(self)
         dialog.exec_() 
 